@@ -0,0 +1,350 @@
+"""
+Benchmark the SDK commands over a synthetic content repository generated with TestSuite.
+
+The repository has `--packs` packs, each with an integration and `--items` content items (scripts, playbooks and
+incident fields). Every playbook has `--playbook-tasks` tasks, which use the scripts and the integration commands of
+`--fan-out` other packs, so the packs depend on each other as content packs do.
+
+Every command runs as a `demisto-sdk` subprocess in the repository, and its wall time, throughput (content items per
+second) and peak RSS (of the command process, without the pool workers it starts) are recorded to a JSON file.
+Given a previous JSON file as `--baseline`, the commands which got slower or bigger than `--tolerance` are reported,
+and the benchmark exits with 1.
+
+The graph commands use the Neo4j of the environment (docker, or a local service by `DEMISTO_SDK_NEO4J_DATABASE_URL`).
+The numbers of nodes and relationships of the graph are recorded after every graph command, and the graphs created with
+and without `--bulk-import` are checked to have the same numbers.
+Every command is recorded with its exit code, which is also 1 when it reports findings in the content (such as
+`validate` errors or `secrets` found); the output of the commands is kept with `--keep`.
+`format` changes the repository, so it runs last.
+
+Usage:
+    python benchmarks/content_repo_benchmark.py --packs 50 --items 30 --output results.json
+    python benchmarks/content_repo_benchmark.py --baseline results.json --commands validate-all --commands secrets
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import typer
+from neo4j import GraphDatabase
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
+from demisto_sdk.commands.content_graph.common import (
+    NEO4J_DATABASE_URL,
+    NEO4J_PASSWORD,
+    NEO4J_USERNAME,
+)
+from TestSuite.repo import Repo
+from TestSuite.test_tools import suite_join_path
+
+app = typer.Typer()
+
+# The arguments of every benchmarked command, by its name (in the order they run).
+# `{output}` is the output directory of the commands, and `{files}` the comma-separated files of the packs.
+COMMANDS: Dict[str, List[str]] = {
+    "graph-create": ["graph", "create", "-o", "{output}/graph"],
+    "graph-create-bulk": ["graph", "create", "--bulk-import", "-o", "{output}/graph"],
+    "graph-update": ["graph", "update", "-o", "{output}/graph"],
+    "validate-all": ["validate", "-a", "--no-docker-checks"],
+    "prepare-content": ["prepare-content", "-a", "-o", "{output}/prepared"],
+    "create-id-set": ["create-id-set", "-o", "{output}/id_set.json"],
+    "secrets": ["secrets", "-i", "{files}"],
+    "format": ["format", "-i", "Packs", "-y", "-nv", "--no-graph"],
+}
+
+# The commands which build the graph, after which its nodes and relationships are counted.
+GRAPH_COMMANDS = ("graph-create", "graph-create-bulk", "graph-update")
+GRAPH_COUNTS = ("nodes", "relationships")
+
+with open(
+    suite_join_path("assets/default_playbook", "playbook-sample.yml")
+) as playbook_file:
+    SAMPLE_PLAYBOOK = yaml.load(playbook_file)
+with open(
+    suite_join_path("assets/default_playbook/tasks", "task-sample.yml")
+) as task_file:
+    SAMPLE_TASK = yaml.load(task_file)
+
+
+def create_playbook_data(name: str, tasks: int, dependencies: List[str]) -> dict:
+    """
+    A playbook of a chain of tasks, where every fifth task also branches to the task after the next one.
+    The tasks alternate between the scripts and the integration commands of the dependency packs.
+    """
+    playbook = dict(SAMPLE_PLAYBOOK, id=name, name=name)
+    playbook_tasks = {
+        "0": dict(SAMPLE_PLAYBOOK["tasks"]["0"], nexttasks={"#none#": ["1"]})
+    }
+    for index in range(1, tasks + 1):
+        dependency = dependencies[index % len(dependencies)]
+        task: Dict[str, Any] = {
+            **SAMPLE_TASK["task"],
+            "id": f"{name}-{index}",
+            "name": f"task {index}",
+        }
+        if index % 2:
+            task.update(scriptName=f"{dependency}_script_{index % 3}")
+        else:
+            task.pop("scriptName")
+            task.update(
+                script=f"{dependency}_integration|||{dependency}-command-{index % 3}",
+                iscommand=True,
+                brand=f"{dependency}_integration",
+            )
+        next_tasks = {"#none#": [str(index + 1)]} if index < tasks else {}
+        if index % 5 == 0 and index + 2 <= tasks:
+            next_tasks["#none#"].append(str(index + 2))
+        playbook_tasks[str(index)] = {
+            **SAMPLE_TASK,
+            "id": str(index),
+            "taskid": f"{name}-{index}",
+            "task": task,
+            "nexttasks": next_tasks,
+        }
+    playbook["tasks"] = playbook_tasks
+    return playbook
+
+
+def create_repo(
+    path: Path, packs: int, items: int, playbook_tasks: int, fan_out: int
+) -> int:
+    """Generates the content repository, and returns the number of its content items."""
+    repo = Repo(path)
+    scripts = max(items // 3, 3)
+    playbooks = items // 3
+    incident_fields = max(items - scripts - playbooks, 0)
+    for pack_index in range(packs):
+        name = f"pack_{pack_index}"
+        pack = repo.create_pack(name)
+        pack.pack_metadata.update({"marketplaces": ["xsoar", "marketplacev2"]})
+        dependencies = [
+            f"pack_{(pack_index + offset) % packs}" for offset in range(1, fan_out + 1)
+        ] or [name]
+        integration = pack.create_integration(f"{name}_integration")
+        integration.create_default_integration(
+            f"{name}_integration", [f"{name}-command-{index}" for index in range(3)]
+        )
+        for index in range(scripts):
+            script = pack.create_script(f"{name}_script_{index}")
+            script.create_default_script(f"{name}_script_{index}")
+        for index in range(playbooks):
+            pack.create_playbook(
+                f"{name}_playbook_{index}",
+                yml=create_playbook_data(
+                    f"{name}_playbook_{index}", playbook_tasks, dependencies
+                ),
+            )
+        for index in range(incident_fields):
+            pack.create_incident_field(f"{name}_field_{index}")
+    repo.init_git()
+    assert repo.git_util
+    # the commands read the organization of the repository from its remote
+    repo.git_util.repo.remote("origin").set_url(
+        "https://github.com/demisto/content.git"
+    )
+    return packs * (1 + scripts + playbooks + incident_fields)
+
+
+def run_command(
+    name: str, repo_path: Path, output: Path, env: Dict[str, str]
+) -> Dict[str, float]:
+    files = ",".join(
+        str(path.relative_to(repo_path))
+        for path in sorted((repo_path / "Packs").rglob("*"))
+        if path.is_file()
+    )
+    args = [arg.format(output=output, files=files) for arg in COMMANDS[name]]
+    with open(output / f"{name}.log", "w") as log_file:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "demisto_sdk", *args],
+            cwd=repo_path,
+            env=env,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+        # wait4 gives the resource usage of this command alone (unlike getrusage of all the children)
+        _, status, rusage = os.wait4(process.pid, 0)
+        seconds = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux, and in bytes on macOS
+    peak_rss = rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return {
+        "seconds": round(seconds, 3),
+        "peak_rss_mb": round(peak_rss / 2**20, 1),
+        "exit_code": os.waitstatus_to_exitcode(status),
+    }
+
+
+def count_graph() -> Dict[str, int]:
+    """The numbers of nodes and relationships of the content graph."""
+    queries = {
+        "nodes": "MATCH (n) RETURN count(n)",
+        "relationships": "MATCH ()-[r]->() RETURN count(r)",
+    }
+    with (
+        GraphDatabase.driver(
+            NEO4J_DATABASE_URL, auth=(NEO4J_USERNAME, NEO4J_PASSWORD)
+        ) as driver,
+        driver.session() as session,
+    ):
+        return {
+            count: session.run(query).single(strict=True)[0]
+            for count, query in queries.items()
+        }
+
+
+def compare_graphs(results: Dict[str, Dict[str, float]]) -> List[str]:
+    """The differences between the graphs created with and without `--bulk-import`, as messages."""
+    created, bulk_created = (
+        results.get("graph-create"),
+        results.get("graph-create-bulk"),
+    )
+    if not created or not bulk_created:
+        return []
+    return [
+        f"graph-create-bulk: {count} {bulk_created[count]} != {created[count]} of graph-create"
+        for count in GRAPH_COUNTS
+        if count in created
+        and count in bulk_created
+        and bulk_created[count] != created[count]
+    ]
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """The regressions of the results from the baseline, as messages."""
+    regressions = []
+    for name, result in results.items():
+        if not (previous := baseline.get(name)):
+            continue
+        if result["exit_code"] != previous["exit_code"]:
+            regressions.append(
+                f"{name}: exit_code {previous['exit_code']} -> {result['exit_code']}"
+            )
+            continue
+        for count in GRAPH_COUNTS:
+            if (
+                count in result
+                and count in previous
+                and result[count] != previous[count]
+            ):
+                regressions.append(
+                    f"{name}: {count} {previous[count]} -> {result[count]}"
+                )
+        for metric in ("seconds", "peak_rss_mb"):
+            if previous[metric] and result[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} {previous[metric]} -> {result[metric]} "
+                    f"(+{result[metric] / previous[metric] - 1:.0%})"
+                )
+    return regressions
+
+
+@app.command()
+def main(
+    packs: int = typer.Option(20, help="The number of packs to generate."),
+    items: int = typer.Option(
+        30, help="The number of content items per pack (besides its integration)."
+    ),
+    playbook_tasks: int = typer.Option(60, help="The number of tasks per playbook."),
+    fan_out: int = typer.Option(
+        3, help="The number of other packs the playbooks of each pack depend on."
+    ),
+    commands: List[str] = typer.Option(
+        list(COMMANDS), help="The commands to benchmark (default: all)."
+    ),
+    output: Path = typer.Option(
+        Path("content_repo_benchmark.json"), help="The JSON file to record to."
+    ),
+    baseline: Optional[Path] = typer.Option(
+        None, help="A previous JSON file to compare the results to."
+    ),
+    tolerance: float = typer.Option(
+        0.2, help="The slowdown or growth of a command counted as a regression."
+    ),
+    keep: bool = typer.Option(
+        False, help="Keep the generated repository and the output of the commands."
+    ),
+):
+    if unknown := set(commands) - set(COMMANDS):
+        raise typer.BadParameter(
+            f"Unknown commands {unknown}, choose of {list(COMMANDS)}"
+        )
+    work_dir = Path(tempfile.mkdtemp(prefix="content_repo_benchmark_"))
+    repo_path, output_path = work_dir / "content", work_dir / "output"
+    repo_path.mkdir()
+    output_path.mkdir()
+
+    start = time.perf_counter()
+    content_items = create_repo(repo_path, packs, items, playbook_tasks, fan_out)
+    typer.echo(
+        f"Generated {packs} packs, {content_items} content items in {time.perf_counter() - start:.1f}s"
+    )
+
+    env = {
+        **os.environ,
+        "DEMISTO_SDK_IGNORE_CONTENT_WARNING": "true",
+        "DEMISTO_SDK_CONTENT_PATH": str(repo_path),
+    }
+    results = {}
+    for name in (name for name in COMMANDS if name in commands):
+        result = run_command(name, repo_path, output_path, env)
+        result["items_per_second"] = round(content_items / result["seconds"], 1)
+        if name in GRAPH_COMMANDS and not result["exit_code"]:
+            result.update(count_graph())
+        results[name] = result
+        typer.echo(
+            f"{name:>16}: {result['seconds']:8.2f}s {result['items_per_second']:8.1f} items/s "
+            f"{result['peak_rss_mb']:8.1f}MB exit_code={result['exit_code']}"
+            + "".join(
+                f" {count}={result[count]}" for count in GRAPH_COUNTS if count in result
+            )
+        )
+
+    with open(output, "w") as output_file:
+        json.dump(
+            {
+                "parameters": {
+                    "packs": packs,
+                    "items": items,
+                    "playbook_tasks": playbook_tasks,
+                    "fan_out": fan_out,
+                    "content_items": content_items,
+                },
+                "results": results,
+            },
+            output_file,
+            indent=4,
+        )
+    typer.echo(f"Recorded the results to {output}")
+    if keep:
+        typer.echo(
+            f"The repository and the output of the commands are kept in {work_dir}"
+        )
+    else:
+        shutil.rmtree(work_dir)
+
+    if differences := compare_graphs(results):
+        typer.echo("The bulk imported graph differs:\n" + "\n".join(differences))
+        raise typer.Exit(1)
+    if baseline:
+        with open(baseline) as baseline_file:
+            baseline_results = json.load(baseline_file)["results"]
+        if regressions := compare(results, baseline_results, tolerance):
+            typer.echo("Regressions from the baseline:\n" + "\n".join(regressions))
+            raise typer.Exit(1)
+        typer.echo("No regressions from the baseline")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,82 @@
+"""
+Benchmark the serial vs. the parallel combine of content-repo .coverage files.
+
+Usage:
+    python benchmarks/coverage_combine_benchmark.py --files 400 --lines 300
+"""
+
+import random
+import shutil
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import coverage
+import typer
+
+from demisto_sdk.commands.coverage_analyze.helpers import combine_coverage_files
+
+app = typer.Typer()
+
+
+def create_synthetic_coverage_files(
+    target_dir: Path, files: int, lines: int
+) -> list[str]:
+    """Creates `files` .coverage files, each measuring a single code file like the ones in content."""
+    data_files = []
+    for index in range(files):
+        data_dir = (
+            target_dir / "Packs" / f"Pack{index}" / "Integrations" / f"Int{index}"
+        )
+        data_dir.mkdir(parents=True)
+        data_file = str(data_dir / ".coverage")
+        data = coverage.CoverageData(basename=data_file)
+        data.add_lines(
+            {
+                str(data_dir / f"Int{index}.py"): sorted(
+                    random.sample(range(1, lines * 2), lines)
+                )
+            }
+        )
+        data.write()
+        data_files.append(data_file)
+    return data_files
+
+
+@app.command()
+def main(
+    files: int = typer.Option(400, help="The number of .coverage files."),
+    lines: int = typer.Option(300, help="The number of measured lines per file."),
+    processes: int = typer.Option(0, help="Worker processes (0 for cpu_count)."),
+):
+    with TemporaryDirectory() as tmp_dir:
+        source_dir = Path(tmp_dir, "source")
+        source_files = create_synthetic_coverage_files(source_dir, files, lines)
+        timings = {}
+        for name in ("serial", "parallel"):
+            work_dir = Path(tmp_dir, name)
+            shutil.copytree(source_dir, work_dir)
+            data_files = [
+                str(work_dir / Path(data_file).relative_to(source_dir))
+                for data_file in source_files
+            ]
+            coverage_obj = coverage.Coverage(
+                data_file=str(work_dir / "combined.coverage")
+            )
+            start = time.perf_counter()
+            if name == "serial":
+                coverage_obj.combine(data_files)
+            else:
+                combine_coverage_files(
+                    coverage_obj, data_files, processes=processes or None
+                )
+            timings[name] = time.perf_counter() - start
+
+    typer.echo(f"files={files} lines={lines}")
+    for name, seconds in timings.items():
+        typer.echo(f"{name:>8}: {seconds:.2f}s")
+    typer.echo(f" speedup: {timings['serial'] / timings['parallel']:.2f}x")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,101 @@
+"""
+Benchmark hydrating content graph query results into models with `parse_obj` vs. `construct_trusted`.
+
+The nodes and relationships are synthetic dictionaries shaped like the ones returned by neo4j,
+so the benchmark runs without a graph database. The node paths are outside of a pack, so the pack lookup
+done by the `pack` validator (the same in both strategies) does not parse pack metadata files.
+
+Usage:
+    python benchmarks/graph_hydration_benchmark.py --nodes 20000 --relationships 5
+"""
+
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import typer
+
+from demisto_sdk.commands.content_graph.common import construct_trusted
+from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
+from demisto_sdk.commands.content_graph.objects.script import Script
+
+app = typer.Typer()
+
+
+def create_synthetic_nodes(nodes: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "object_id": f"Script{index}",
+            "node_id": f"Script:Script{index}",
+            "content_type": "Script",
+            "source_repo": "content",
+            "path": f"Scripts/Script{index}/Script{index}.yml",
+            "marketplaces": ["xsoar", "marketplacev2", "xsoar_saas"],
+            "name": f"Script{index}",
+            "display_name": f"Script {index}",
+            "description": "A synthetic script",
+            "fromversion": "6.10.0",
+            "toversion": "99.99.99",
+            "deprecated": False,
+            "type": "python3",
+            "docker_image": "demisto/python3:3.10.11.54799",
+            "tags": ["transformer"],
+            "skip_prepare": [],
+            "is_test": False,
+            "not_in_repository": False,
+        }
+        for index in range(nodes)
+    ]
+
+
+def hydrate(
+    nodes: List[Dict[str, Any]],
+    relationships: int,
+    parse_node: Callable,
+    parse_relationship: Callable,
+) -> None:
+    objects = [parse_node(Script, node) for node in nodes]
+    for index, obj in enumerate(objects):
+        for offset in range(1, relationships + 1):
+            target = objects[(index + offset) % len(objects)]
+            parse_relationship(
+                RelationshipData,
+                {
+                    "relationship_type": "USES",
+                    "source_id": obj.node_id,
+                    "target_id": target.node_id,
+                    "content_item_to": target,
+                    "mandatorily": True,
+                    "is_direct": True,
+                },
+            )
+
+
+@app.command()
+def main(
+    nodes: int = typer.Option(20000, help="The number of script nodes."),
+    relationships: int = typer.Option(5, help="The number of relationships per node."),
+):
+    data = create_synthetic_nodes(nodes)
+    strategies = {
+        "parse_obj": lambda model, obj: model.parse_obj(obj),
+        "trusted": construct_trusted,
+    }
+    timings = {}
+    for name, parse in strategies.items():
+        start = time.perf_counter()
+        hydrate(data, relationships, parse, parse)
+        timings[name] = time.perf_counter() - start
+        # memory is traced in a separate run, as tracing slows down the timed run
+        tracemalloc.start()
+        hydrate(data, relationships, parse, parse)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        typer.echo(f"{name:>9}: {timings[name]:.2f}s, peak {peak / 2**20:.1f} MiB")
+
+    typer.echo(f"nodes={nodes} relationships={nodes * relationships}")
+    typer.echo(f"  speedup: {timings['parse_obj'] / timings['trusted']:.2f}x")
+
+
+if __name__ == "__main__":
+    app()
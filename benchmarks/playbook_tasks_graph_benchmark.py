@@ -0,0 +1,122 @@
+"""
+Benchmark the playbook tasks graph against the previous networkx fixpoint implementation.
+
+Runs over the largest playbooks of a content repository when `--content-path` is given,
+otherwise over synthetic playbooks of long task chains with parallel branches.
+
+Usage:
+    python benchmarks/playbook_tasks_graph_benchmark.py --content-path ~/dev/content --largest 50
+    python benchmarks/playbook_tasks_graph_benchmark.py --tasks 600
+"""
+
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import networkx
+import typer
+
+from demisto_sdk.commands.common.playbook_tasks_graph import PlaybookTasksGraph
+from demisto_sdk.commands.common.tools import get_file
+
+app = typer.Typer()
+
+
+def legacy_build_tasks_graph(playbook_data: dict) -> networkx.DiGraph:
+    """The previous implementation (update_id_set.build_tasks_graph), kept as the baseline."""
+    initial_task = playbook_data.get("starttaskid", "")
+    tasks = playbook_data.get("tasks", {})
+
+    graph = networkx.DiGraph()
+    graph.add_node(initial_task, mandatory=True)
+
+    found_new_tasks = True
+    while found_new_tasks:
+        current_number_of_nodes = graph.number_of_nodes()
+        leaf_nodes = {node for node in graph.nodes() if graph.out_degree(node) == 0}
+
+        for leaf in leaf_nodes:
+            leaf_task = tasks.get(leaf)
+            leaf_mandatory = graph.nodes[leaf]["mandatory"]
+            if not leaf_task:
+                continue
+
+            leaf_next_tasks: List[str] = sum(
+                leaf_task.get("nexttasks", {}).values(), []
+            )
+            for task_id in leaf_next_tasks:
+                task = tasks.get(task_id)
+                if not task:
+                    continue
+                mandatory = leaf_mandatory and not task.get("skipunavailable", False)
+                if task_id not in graph.nodes():
+                    graph.add_node(task_id, mandatory=mandatory)
+                else:
+                    graph.nodes[task_id]["mandatory"] = (
+                        graph.nodes[task_id]["mandatory"] or mandatory
+                    )
+                graph.add_edge(leaf, task_id)
+
+        found_new_tasks = graph.number_of_nodes() > current_number_of_nodes
+
+    return graph
+
+
+def create_synthetic_playbook(tasks: int) -> dict:
+    """A chain of tasks, where every third task also branches to a skippable task which rejoins the chain."""
+    playbook_tasks = {}
+    for index in range(tasks):
+        next_tasks = {"#none#": [str(index + 1)]} if index + 1 < tasks else {}
+        if index % 3 == 0 and index + 2 < tasks:
+            next_tasks["yes"] = [str(index + 2)]
+        playbook_tasks[str(index)] = {
+            "id": str(index),
+            "nexttasks": next_tasks,
+            "skipunavailable": index % 5 == 0,
+        }
+    return {"starttaskid": "0", "tasks": playbook_tasks}
+
+
+def load_largest_playbooks(content_path: Path, largest: int) -> List[dict]:
+    paths = sorted(
+        content_path.glob("Packs/*/Playbooks/*.yml"),
+        key=lambda path: path.stat().st_size,
+        reverse=True,
+    )[:largest]
+    return [get_file(path) for path in paths]
+
+
+@app.command()
+def main(
+    content_path: Optional[Path] = typer.Option(
+        None, help="A content repository to take the largest playbooks from."
+    ),
+    largest: int = typer.Option(50, help="The number of largest playbooks to use."),
+    tasks: int = typer.Option(600, help="The number of tasks per synthetic playbook."),
+    playbooks: int = typer.Option(20, help="The number of synthetic playbooks."),
+):
+    if content_path:
+        data = load_largest_playbooks(content_path, largest)
+    else:
+        data = [create_synthetic_playbook(tasks) for _ in range(playbooks)]
+
+    timings = {}
+    for name, build in (
+        ("networkx", legacy_build_tasks_graph),
+        ("worklist", PlaybookTasksGraph.from_playbook_data),
+    ):
+        start = time.perf_counter()
+        for playbook_data in data:
+            build(playbook_data)
+        timings[name] = time.perf_counter() - start
+
+    typer.echo(
+        f"playbooks={len(data)} tasks={sum(len(p.get('tasks') or {}) for p in data)}"
+    )
+    for name, seconds in timings.items():
+        typer.echo(f"{name:>9}: {seconds:.3f}s")
+    typer.echo(f"  speedup: {timings['networkx'] / timings['worklist']:.1f}x")
+
+
+if __name__ == "__main__":
+    app()
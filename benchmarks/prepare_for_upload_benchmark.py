@@ -0,0 +1,170 @@
+"""
+Benchmark `prepare_for_upload` of every integration of a content repository, with the previous marketplace
+rewrites (a full walk replacing the references with an uncompiled pattern on every string, then a full walk
+resolving the marketplace suffixes) against the single-walk `MarketplaceUploadPreparer`.
+
+Every integration is prepared for every marketplace from a fresh copy of its data, and both methods are verified
+to prepare the same data.
+
+Usage:
+    python benchmarks/prepare_for_upload_benchmark.py --content-path ~/dev/content
+"""
+
+import copy
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
+
+import typer
+from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedScalarString is OK
+    FoldedScalarString,
+)
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import (
+    MARKETPLACES_REPLACING_XSOAR_REFERENCES,
+)
+from demisto_sdk.commands.content_graph.objects import (
+    content_item as content_item_module,
+)
+from demisto_sdk.commands.content_graph.objects import (
+    integration_script as integration_script_module,
+)
+from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
+from demisto_sdk.commands.content_graph.objects.integration import Integration
+from demisto_sdk.commands.prepare_content.preparers.marketplace_suffix_preparer import (
+    MarketplaceSuffixPreparer,
+)
+
+app = typer.Typer()
+
+SDK_TEST_FILES = Path(__file__).parents[1] / "demisto_sdk" / "tests" / "test_files"
+LEGACY_PATTERN = (
+    r"\bCortex XSOAR\b(?![\S]*\/)(?:\s+[\w.]*\d[\w.]*)?(?!(?:.{0,20})https)"
+)
+
+
+def legacy_replace_marketplace_references(
+    data: Any, marketplace: MarketplaceVersions, path: str = ""
+) -> Any:
+    """The previous `replace_marketplace_references`, kept as the baseline."""
+    if marketplace in MARKETPLACES_REPLACING_XSOAR_REFERENCES:
+        if isinstance(data, dict):
+            keys_to_update = {}
+            for key, value in data.items():
+                new_key = (
+                    re.sub(LEGACY_PATTERN, "Cortex", key)
+                    if isinstance(key, str)
+                    else key
+                )
+                if new_key != key:
+                    keys_to_update[key] = new_key
+                data[key] = legacy_replace_marketplace_references(
+                    value, marketplace, path
+                )
+            for old_key, new_key in keys_to_update.items():
+                data[new_key] = data.pop(old_key)
+        elif isinstance(data, list):
+            for i in range(len(data)):
+                data[i] = legacy_replace_marketplace_references(
+                    data[i], marketplace, path
+                )
+        elif isinstance(data, FoldedScalarString):
+            data = FoldedScalarString(re.sub(LEGACY_PATTERN, "Cortex", str(data)))
+        elif isinstance(data, str):
+            data = re.sub(LEGACY_PATTERN, "Cortex", data)
+    return data
+
+
+class LegacyUploadPreparer:
+    @staticmethod
+    def prepare(data: dict, current_marketplace: MarketplaceVersions) -> dict:
+        data = legacy_replace_marketplace_references(data, current_marketplace)
+        return MarketplaceSuffixPreparer.prepare(data, current_marketplace)
+
+
+def find_integrations(content_path: Path) -> List[Integration]:
+    integrations = []
+    for path in sorted(content_path.rglob("Integrations/**/*.yml")):
+        if path.name.endswith(("_unified.yml", "_test.yml")):
+            continue
+        try:
+            model = BaseContent.from_path(path)
+        except Exception:
+            continue
+        if isinstance(model, Integration):
+            integrations.append(model)
+    return integrations
+
+
+PreparedData = Dict[Tuple[MarketplaceVersions, Path], Any]
+
+
+def prepare_all(
+    integrations: List[Integration], data: Dict[Path, dict]
+) -> Tuple[float, PreparedData]:
+    prepared: PreparedData = {}
+    seconds = 0.0
+    for marketplace in MarketplaceVersions:
+        for integration in integrations:
+            integration._loaded_data = copy.deepcopy(data[integration.path])
+            start = time.perf_counter()
+            try:
+                prepared[(marketplace, integration.path)] = (
+                    integration.prepare_for_upload(marketplace)
+                )
+            except Exception as e:
+                prepared[(marketplace, integration.path)] = repr(e)
+            seconds += time.perf_counter() - start
+            integration._loaded_data = None
+    return seconds, prepared
+
+
+@app.command()
+def main(
+    content_path: Optional[Path] = typer.Option(
+        None,
+        help="The content repository to prepare the integrations of (default: the SDK test files).",
+    ),
+    rounds: int = typer.Option(3, help="The number of times to prepare everything."),
+):
+    logger.remove()
+    integrations = find_integrations(content_path or SDK_TEST_FILES)
+    data = {integration.path: integration.data for integration in integrations}
+
+    timings = {"previous": 0.0, "fused": 0.0}
+    mismatches = 0
+    with mock.patch.object(Integration, "get_supported_native_images", return_value=[]):
+        for _ in range(rounds):
+            with (
+                mock.patch.object(
+                    content_item_module,
+                    "MarketplaceUploadPreparer",
+                    LegacyUploadPreparer,
+                ),
+                mock.patch.object(
+                    integration_script_module,
+                    "replace_marketplace_references",
+                    legacy_replace_marketplace_references,
+                ),
+            ):
+                seconds, previous = prepare_all(integrations, data)
+            timings["previous"] += seconds
+            seconds, fused = prepare_all(integrations, data)
+            timings["fused"] += seconds
+            mismatches = sum(previous[key] != fused[key] for key in previous)
+
+    typer.echo(
+        f"integrations={len(integrations)} marketplaces={len(MarketplaceVersions)} "
+        f"rounds={rounds} mismatches={mismatches}"
+    )
+    for name, seconds in timings.items():
+        typer.echo(f"{name:>8}: {seconds:.2f}s")
+    typer.echo(f" speedup: {timings['previous'] / timings['fused']:.2f}x")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,101 @@
+"""
+Benchmark the memory of node relationships stored as sets of RelationshipData vs. compact relationships.
+
+Usage:
+    python benchmarks/relationships_memory_benchmark.py --nodes 5000 --relationships 50
+"""
+
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Callable, List
+
+import typer
+
+from demisto_sdk.commands.content_graph.common import (
+    RelationshipType,
+    construct_trusted,
+)
+from demisto_sdk.commands.content_graph.objects.relationship import (
+    CompactRelationshipsData,
+    RelationshipData,
+    RelationshipsStore,
+)
+from demisto_sdk.commands.content_graph.objects.script import Script
+
+app = typer.Typer()
+
+
+def create_synthetic_scripts(nodes: int) -> List[Script]:
+    scripts = []
+    for index in range(nodes):
+        script = construct_trusted(
+            Script,
+            {
+                "object_id": f"Script{index}",
+                "node_id": f"Script:Script{index}",
+                "path": f"Scripts/Script{index}/Script{index}.yml",
+                "marketplaces": ["xsoar"],
+                "name": f"Script{index}",
+                "display_name": f"Script{index}",
+                "fromversion": "6.10.0",
+                "toversion": "99.99.99",
+                "deprecated": False,
+                "type": "python3",
+                "tags": [],
+                "skip_prepare": [],
+            },
+        )
+        script.database_id = str(index)
+        scripts.append(script)
+    return scripts
+
+
+def add_relationships(
+    scripts: List[Script], relationships: int, relationships_data: Callable[[], Any]
+) -> None:
+    for index, script in enumerate(scripts):
+        script.relationships_data = relationships_data()
+        for offset in range(1, relationships + 1):
+            target = scripts[(index + offset) % len(scripts)]
+            script.add_relationship(
+                RelationshipType.DEPENDS_ON,
+                construct_trusted(
+                    RelationshipData,
+                    {
+                        "relationship_type": RelationshipType.DEPENDS_ON,
+                        "source_id": script.database_id,
+                        "target_id": target.database_id,
+                        "content_item_to": target,
+                        "mandatorily": True,
+                        "is_direct": False,
+                    },
+                ),
+            )
+
+
+@app.command()
+def main(
+    nodes: int = typer.Option(5000, help="The number of script nodes."),
+    relationships: int = typer.Option(50, help="The number of relationships per node."),
+):
+    scripts = create_synthetic_scripts(nodes)
+    store: RelationshipsStore  # set per strategy, before its relationships are added
+    strategies = {
+        "sets": lambda: defaultdict(set),
+        "compact": lambda: CompactRelationshipsData(store),
+    }
+    typer.echo(f"nodes={nodes} relationships={nodes * relationships}")
+    for name, relationships_data in strategies.items():
+        store = RelationshipsStore()
+        tracemalloc.start()
+        start = time.perf_counter()
+        add_relationships(scripts, relationships, relationships_data)
+        seconds = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        typer.echo(f"{name:>8}: {seconds:.2f}s, {current / 2**20:.1f} MiB retained")
+
+
+if __name__ == "__main__":
+    app()
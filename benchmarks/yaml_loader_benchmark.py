@@ -0,0 +1,91 @@
+"""
+Benchmark the safe YAML loading of `tools.get_file`: the previous ruamel loading (a new ruamel instance
+and the `simple: =` regex per file) against the libyaml loader, and its pure ruamel fallback.
+
+Runs over every YAML file of a content repository (`--content-path`), otherwise over the YAML files of
+the demisto-sdk test data. Verifies all loaders load the same objects.
+
+Usage:
+    python benchmarks/yaml_loader_benchmark.py --content-path ~/dev/content
+"""
+
+import re
+import time
+from io import StringIO
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import typer
+
+from demisto_sdk.commands.common.handlers import YAML_Handler
+from demisto_sdk.commands.common.handlers.yaml.libyaml_handler import (
+    LIBYAML_SAFE_LOADER,
+    LIBYAML_Handler,
+)
+
+app = typer.Typer()
+
+SDK_TEST_FILES = Path(__file__).parents[1] / "demisto_sdk"
+
+
+def legacy_load(text: str):
+    """The previous loading of get_file, kept as the baseline."""
+    replaced = StringIO(re.sub(r"(simple: \s*\n*)(=)(\s*\n)", r'\1"\2"\3', text))
+    return YAML_Handler(typ="safe").load(replaced)
+
+
+def read_yaml_files(root: Path) -> List[str]:
+    texts = []
+    for path in sorted((*root.rglob("*.yml"), *root.rglob("*.yaml"))):
+        try:
+            texts.append(path.read_text())
+        except (OSError, UnicodeDecodeError):
+            continue
+    return texts
+
+
+def load_all(load: Callable, texts: List[str]) -> list:
+    loaded = []
+    for text in texts:
+        try:
+            loaded.append(load(text))
+        except Exception as e:
+            loaded.append(type(e))
+    return loaded
+
+
+@app.command()
+def main(
+    content_path: Optional[Path] = typer.Option(
+        None, help="A content repository to load all the YAML files of."
+    ),
+    rounds: int = typer.Option(1, help="The number of times to load every file."),
+):
+    texts = read_yaml_files(content_path or SDK_TEST_FILES)
+    loaders: Dict[str, Callable] = {"ruamel (previous)": legacy_load}
+    if LIBYAML_SAFE_LOADER:
+        loaders["libyaml"] = LIBYAML_Handler().load
+    loaders["ruamel (reused)"] = LIBYAML_Handler(use_libyaml=False).load
+
+    timings, results = {}, {}
+    for name, load in loaders.items():
+        start = time.perf_counter()
+        for _ in range(rounds):
+            results[name] = load_all(load, texts)
+        timings[name] = time.perf_counter() - start
+
+    typer.echo(f"files={len(texts)} MiB={sum(map(len, texts)) / 2**20:.1f}")
+    baseline = timings["ruamel (previous)"]
+    for name, seconds in timings.items():
+        mismatches = sum(
+            # the loaders raise different exception types for the same invalid files
+            not (isinstance(new, type) and isinstance(old, type)) and new != old
+            for new, old in zip(results[name], results["ruamel (previous)"])
+        )
+        typer.echo(
+            f"{name:>18}: {seconds:.2f}s ({baseline / seconds:.1f}x), mismatches={mismatches}"
+        )
+
+
+if __name__ == "__main__":
+    app()
@@ -81,14 +81,18 @@ DEMISTO_SDK_LOG_FILE_PATH = "DEMISTO_SDK_LOG_FILE_PATH"
 DEMISTO_SDK_LOG_NOTIFY_PATH = "DEMISTO_SDK_LOG_NOTIFY_PATH"
 DEMISTO_SDK_LOG_FILE_SIZE = "DEMISTO_SDK_LOG_FILE_SIZE"
 DEMISTO_SDK_LOG_FILE_COUNT = "DEMISTO_SDK_LOG_FILE_COUNT"
+DEMISTO_SDK_LOG_FILE_ENQUEUE = "DEMISTO_SDK_LOG_FILE_ENQUEUE"
 DEMISTO_SDK_LOG_NO_COLORS = "DEMISTO_SDK_LOG_NO_COLORS"
 DEMISTO_SDK_LOGGING_SET = "DEMISTO_SDK_LOGGING_SET"
+# Tracing
+DEMISTO_SDK_TRACE = "DEMISTO_SDK_TRACE"
 # Neo4j
 DEMISTO_SDK_NEO4J_VERSION = "DEMISTO_SDK_NEO4J_VERSION"
 DEMISTO_SDK_NEO4J_DATABASE_HTTP = "DEMISTO_SDK_NEO4J_DATABASE_HTTP"
 DEMISTO_SDK_NEO4J_DATABASE_URL = "DEMISTO_SDK_NEO4J_DATABASE_URL"
 DEMISTO_SDK_NEO4J_USERNAME = "DEMISTO_SDK_NEO4J_USERNAME"
 DEMISTO_SDK_NEO4J_PASSWORD = "DEMISTO_SDK_NEO4J_PASSWORD"
+DEMISTO_SDK_NEO4J_EXPORT_FORMAT = "DEMISTO_SDK_NEO4J_EXPORT_FORMAT"
 # --- Environment Variables ---
 
 
@@ -1,19 +1,37 @@
 import os
 import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from functools import lru_cache
+from hashlib import sha1
 from pathlib import Path
-from typing import List, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import click
 import gitdb
 from git import (
+    Git,
     InvalidGitRepositoryError,
+    NoSuchPathError,
     Repo,  # noqa: TID251: required to create GitUtil
 )
-from git.diff import Lit_change_type
+from git.diff import Diff, Lit_change_type
 from git.exc import GitError
-from git.objects import Blob, Commit
+from git.objects import Commit
 from git.remote import Remote
 
 from demisto_sdk.commands.common.constants import (
@@ -46,10 +64,395 @@ class GitFileNotFoundError(FileNotFoundError):
         )
 
 
+class GitBlobReader:
+    """
+    Reads files of commits through one long-lived `git cat-file --batch` process of a repository,
+    instead of a git process or a tree traversal per file.
+
+    The files are cached by the sha of their commit and their path, as they never change.
+    A reader is shared by all the GitUtil objects of a repository (see `GitBlobReader.of`).
+    """
+
+    MAX_CACHED_FILES = 4096
+
+    _readers: Dict[str, "GitBlobReader"] = {}
+    _readers_lock = threading.Lock()
+
+    def __init__(self, working_dir: str) -> None:
+        self._git = Git(working_dir)
+        self._lock = threading.Lock()
+        self._files: "OrderedDict[Tuple[str, str], Optional[bytes]]" = OrderedDict()
+
+    @classmethod
+    def of(cls, repo: Repo) -> "GitBlobReader":
+        """The reader of the repository, created once per process (git pipes can not be shared with forked processes)."""
+        working_dir = str(repo.working_dir)
+        key = f"{os.getpid()}:{working_dir}"
+        with cls._readers_lock:
+            if (reader := cls._readers.get(key)) is None:
+                reader = cls._readers[key] = cls(working_dir)
+        return reader
+
+    def resolve_commit(self, commit_or_branch: str) -> Optional[str]:
+        """The sha of the given commit/branch, or None if it does not exist."""
+        with self._lock:
+            try:
+                commit, *_ = self._git.get_object_header(
+                    f"{commit_or_branch}^{{commit}}"
+                )
+            except ValueError:
+                return None
+        # GitPython returns the header fields as bytes
+        return os.fsdecode(commit)
+
+    def read(self, commit_or_branch: str, path: Union[Path, str]) -> Optional[bytes]:
+        """
+        Reads a file of a commit.
+
+        Args:
+            commit_or_branch: commit sha or branch name (e.g. `origin/master`)
+            path: the path of the file from the repository root
+
+        Returns:
+            The file content, or None if the commit or the file does not exist.
+        """
+        if not (commit := self.resolve_commit(commit_or_branch)):
+            return None
+        return self._read_at_commit(commit, Path(path).as_posix())
+
+    def read_many(
+        self, commit_or_branch: str, paths: Iterable[Union[Path, str]]
+    ) -> Dict[str, Optional[bytes]]:
+        """Reads many files of a commit, resolving the commit once (see `read`)."""
+        commit = self.resolve_commit(commit_or_branch)
+        return {
+            (path := Path(file_path).as_posix()): self._read_at_commit(commit, path)
+            if commit
+            else None
+            for file_path in paths
+        }
+
+    def exists(self, commit_or_branch: str, path: Union[Path, str]) -> bool:
+        """Whether the path (a file or a directory) exists in the commit."""
+        # Path drops a leading `./`, which git resolves from the current directory rather than the repository root
+        path = Path(path).as_posix()
+        if path == ".":
+            path = ""  # `<commit>:` is the root tree
+        with self._lock:
+            try:
+                self._git.get_object_header(f"{commit_or_branch}:{path}")
+            except ValueError:
+                return False
+        return True
+
+    def _read_at_commit(self, commit: str, path: str) -> Optional[bytes]:
+        key = (commit, path)
+        with self._lock:
+            if key in self._files:
+                self._files.move_to_end(key)
+                return self._files[key]
+            try:
+                _, object_type, _, data = self._git.get_object_data(f"{commit}:{path}")
+            except ValueError:  # the file does not exist in the commit
+                data = None
+            else:
+                if object_type not in (b"blob", "blob"):  # GitPython returns bytes
+                    data = None
+            self._files[key] = data
+            if len(self._files) > self.MAX_CACHED_FILES:
+                self._files.popitem(last=False)
+            return data
+
+
+class ChangedFile(NamedTuple):
+    """
+    A file changed between two trees of a repository.
+    The old path is None for an added file, and the new path is None for a deleted file.
+    """
+
+    status: str  # the git status letter (M, A, D, R, C, T)
+    old_path: Optional[Path]
+    new_path: Optional[Path]
+    score: Optional[int] = None  # the similarity of a renamed or copied file
+    old_mode: Optional[int] = None
+    new_mode: Optional[int] = None
+    old_sha: Optional[str] = None
+    new_sha: Optional[str] = None
+
+    @classmethod
+    def from_diff(cls, diff: Diff) -> "ChangedFile":
+        status = diff.change_type or "M"
+        return cls(
+            status=status,
+            old_path=Path(diff.a_path) if diff.a_path and status != "A" else None,
+            new_path=Path(diff.b_path) if diff.b_path and status != "D" else None,
+            score=diff.score,
+            old_mode=diff.a_mode or None,
+            new_mode=diff.b_mode or None,
+            old_sha=diff.a_blob.hexsha if diff.a_blob else None,
+            new_sha=diff.b_blob.hexsha if diff.b_blob else None,
+        )
+
+    @property
+    def path(self) -> Path:
+        """The path of the file before the change, or its new path if it was added."""
+        return self.old_path or self.new_path  # type: ignore[return-value]
+
+    @property
+    def permissions_changed(self) -> bool:
+        return bool(self.old_mode and self.new_mode and self.old_mode != self.new_mode)
+
+    def is_change_type(self, change_type: str) -> bool:
+        """Whether the change is of the given type, as `DiffIndex.iter_change_type` matches it."""
+        if self.status == change_type:
+            return True
+        # renamed and type-changed files with a changed content are modified as well
+        return bool(
+            change_type == "M"
+            and self.old_sha
+            and self.new_sha
+            and self.old_sha != self.new_sha
+        )
+
+
+class GitChanges(NamedTuple):
+    """
+    All the changes of a repository against a base commit, computed together (see `GitUtil.get_changes`).
+
+    committed: The current commit against the base commit.
+    branch: The changes made on the current branch since it forked from the base commit.
+    staged: The index against the current commit.
+    untracked: The changes of the working tree, as listed by `git status`.
+    """
+
+    committed: Tuple[ChangedFile, ...]
+    branch: Tuple[ChangedFile, ...]
+    staged: Tuple[ChangedFile, ...]
+    untracked: Tuple[ChangedFile, ...] = ()
+
+    @staticmethod
+    def paths_of(changes: Iterable[ChangedFile], change_type: str) -> Set[Path]:
+        return {change.path for change in changes if change.is_change_type(change_type)}
+
+    @staticmethod
+    def renames_of(
+        changes: Iterable[ChangedFile], full_match: bool = True
+    ) -> Set[Tuple[Path, Path]]:
+        """The (old path, new path) of the renamed files, only of the unmodified ones by default."""
+        return {
+            (change.old_path, change.new_path)  # type: ignore[misc]
+            for change in changes
+            if change.status == "R" and (change.score == 100 or not full_match)
+        }
+
+    @property
+    def branch_files(self) -> Set[Path]:
+        """The files changed on the branch (the new paths of the renamed files)."""
+        return {change.new_path or change.path for change in self.branch}
+
+    @property
+    def branch_statuses(self) -> Dict[Path, str]:
+        """The status on the branch of every changed path, as `git diff --name-status <range> -- <path>` returns it."""
+        statuses: Dict[Path, str] = {}
+        for change in self.branch:
+            if change.status in ("R", "C"):
+                # without its source, a renamed or copied file is an added one
+                statuses[change.new_path] = "A"  # type: ignore[index]
+                if change.status == "R":
+                    statuses[change.old_path] = "D"  # type: ignore[index]
+            else:
+                statuses[change.path] = change.status
+        return statuses
+
+
+class RepositoryFileIndex:
+    """
+    The files of a repository working tree - the tracked files which were not deleted and the untracked files
+    which are not ignored - listed once by `git ls-files`, with lookups by directory, pack, content type folder
+    and suffix instead of listing and checking the file system for every path.
+
+    The paths are kept sorted (relative to the repository root, as posix strings), so the files of a directory
+    are a contiguous range.
+    The index does not follow changes to the working tree after it is built. Path lookups use it only within
+    `RepositoryFileIndex.scope`, while the working tree is not expected to change (see `RepositoryFileIndex.active`).
+    """
+
+    _scopes: Dict[str, Optional["RepositoryFileIndex"]] = {}
+    _scopes_lock = threading.Lock()
+
+    def __init__(
+        self,
+        root: Union[Path, str],
+        files: Iterable[str],
+        tracked_files: Iterable[str] = (),
+    ) -> None:
+        self.root = os.path.realpath(root)
+        self.files: List[str] = sorted(set(files))
+        self.tracked_files: List[str] = list(tracked_files)
+        self._by_suffix: Optional[Dict[str, List[str]]] = None
+        self._by_content_folder: Optional[Dict[str, List[str]]] = None
+
+    @classmethod
+    def from_repo(cls, repo: Repo) -> "RepositoryFileIndex":
+        files, tracked_files, deleted_files = [], [], set()
+        for entry in repo.git.ls_files(
+            "-z", "-t", "--cached", "--others", "--deleted", "--exclude-standard"
+        ).split("\x00"):
+            if not entry:
+                continue
+            # every path is tagged by its status: `H` cached, `?` untracked, `R` deleted
+            tag, path = entry[0], entry[2:]
+            if tag == "?":
+                files.append(path)
+            elif tag == "R":
+                deleted_files.add(path)
+            else:
+                tracked_files.append(path)
+        files.extend(path for path in tracked_files if path not in deleted_files)
+        return cls(Path(repo.working_dir), files, tracked_files)
+
+    @classmethod
+    @contextmanager
+    def scope(cls, path: Optional[Path] = None) -> Iterator[None]:
+        """
+        Answers the path lookups of the repository of the given path (the content repository by default)
+        from its index while the scope is active. The index is built on the first lookup.
+        Does nothing when the path is not in a git repository.
+        """
+        try:
+            root = os.path.realpath(GitUtil.from_content_path(path).repo.working_dir)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            yield
+            return
+        with cls._scopes_lock:
+            is_nested = root in cls._scopes
+            cls._scopes.setdefault(root, None)
+        try:
+            yield
+        finally:
+            if not is_nested:
+                with cls._scopes_lock:
+                    cls._scopes.pop(root, None)
+
+    @classmethod
+    def active(cls, path: Union[Path, str]) -> Optional["RepositoryFileIndex"]:
+        """The index of the active scope the path is in, or None if the path should be looked up in the file system."""
+        if not cls._scopes:
+            return None
+        absolute = os.path.abspath(path)
+        # the scopes may be entered and exited by other threads while they are iterated
+        with cls._scopes_lock:
+            for root in cls._scopes:
+                if absolute == root or absolute.startswith(root + os.sep):
+                    break
+            else:
+                return None
+            if (index := cls._scopes.get(root)) is None:
+                index = cls._scopes[root] = cls.from_repo(Repo(root))
+        return index
+
+    def relative(self, path: Union[Path, str]) -> Optional[str]:
+        """The posix path from the repository root, or None if the path is not in the repository."""
+        absolute = os.path.abspath(path)
+        if absolute == self.root:
+            return ""
+        if absolute.startswith(self.root + os.sep):
+            return absolute[len(self.root) + 1 :].replace(os.sep, "/")
+        return None
+
+    def _range(self, directory: str) -> List[str]:
+        """All the files under the directory (a repository relative posix path)."""
+        if not directory:
+            return self.files
+        prefix = f"{directory}/"
+        # the paths starting with the prefix are sorted between it and its successor
+        successor = f"{directory}0"  # `0` follows `/`
+        return self.files[
+            bisect_left(self.files, prefix) : bisect_left(self.files, successor)
+        ]
+
+    def exists(self, path: Union[Path, str]) -> bool:
+        """Whether the path is a file or a directory of the working tree."""
+        return (relative := self.relative(path)) is not None and (
+            self.is_file(relative) or bool(self._range(relative))
+        )
+
+    def is_file(self, relative_path: str) -> bool:
+        position = bisect_left(self.files, relative_path)
+        return position < len(self.files) and self.files[position] == relative_path
+
+    def is_dir(self, path: Union[Path, str]) -> bool:
+        """Whether the path is a directory of the working tree (has files)."""
+        return (relative := self.relative(path)) is not None and bool(
+            self._range(relative)
+        )
+
+    def list_dir(
+        self,
+        path: Union[Path, str],
+        suffixes: Sequence[str] = (),
+        recursive: bool = True,
+    ) -> List[Path]:
+        """
+        The files under a directory, as `Path(path).rglob` (or `glob` if not recursive) would find them.
+
+        Args:
+            path: The directory, absolute or relative to the current directory.
+            suffixes: The file name endings to find (e.g. `.yml`), all the files if empty.
+            recursive: Whether to find the files of the subdirectories.
+        """
+        if (relative := self.relative(path)) is None:
+            return []
+        start = len(relative) + 1 if relative else 0
+        directory = Path(path)
+        return [
+            directory / file[start:]
+            for file in self._range(relative)
+            if (not suffixes or file.endswith(tuple(suffixes)))
+            and (recursive or "/" not in file[start:])
+        ]
+
+    def pack_files(self, pack_name: str, suffixes: Sequence[str] = ()) -> List[Path]:
+        """The files of a pack, relative to the repository root."""
+        return [
+            Path(file)
+            for file in self._range(f"{PACKS_FOLDER}/{pack_name}")
+            if not suffixes or file.endswith(tuple(suffixes))
+        ]
+
+    def content_type_files(
+        self, folder: str, suffixes: Sequence[str] = ()
+    ) -> List[Path]:
+        """The files in a content type folder (e.g. `Integrations`) of all the packs, relative to the repository root."""
+        if self._by_content_folder is None:
+            self._by_content_folder = {}
+            for file in self._range(PACKS_FOLDER):
+                parts = file.split("/", 3)
+                if len(parts) == 4:
+                    self._by_content_folder.setdefault(parts[2], []).append(file)
+        return [
+            Path(file)
+            for file in self._by_content_folder.get(folder, ())
+            if not suffixes or file.endswith(tuple(suffixes))
+        ]
+
+    def suffix_files(self, suffix: str) -> List[Path]:
+        """The files with the given suffix (e.g. `.yml`), relative to the repository root."""
+        if self._by_suffix is None:
+            self._by_suffix = {}
+            for file in self.files:
+                if (suffix_start := file.rfind(".")) > file.rfind("/") + 1:
+                    self._by_suffix.setdefault(file[suffix_start:], []).append(file)
+        return [Path(file) for file in self._by_suffix.get(suffix, ())]
+
+
 class GitUtil:
     # in order to use Repo class/static methods
     REPO_CLS = Repo
 
+    # the changes of every repository against its base branches, with the state they were computed at
+    _changes: Dict[Tuple, Tuple[Tuple, GitChanges]] = {}
+
     def __init__(
         self,
         path: Optional[Union[str, Path, Repo]] = None,
@@ -77,6 +480,10 @@ class GitUtil:
             return cls(Path(content_path), search_parent_directories=False)
         return cls(path)
 
+    @property
+    def blob_reader(self) -> GitBlobReader:
+        return GitBlobReader.of(self.repo)
+
     def path_from_git_root(self, path: Union[Path, str]) -> Path:
         """
         Given an absolute path, return the path to the file/directory from the
@@ -195,13 +602,12 @@ class GitUtil:
             else str(path)
         )
 
-        try:
-            blob: Blob = commit.tree / path
-        except KeyError:
+        content = self.blob_reader.read(commit.hexsha, path)
+        if content is None:
             raise GitFileNotFoundError(
                 commit_or_branch, path=path, from_remote=from_remote
             )
-        return blob.data_stream.read()
+        return content
 
     def is_file_exist_in_commit_or_branch(
         self, path: Union[Path, str], commit_or_branch: str, from_remote: bool = True
@@ -212,12 +618,7 @@ class GitUtil:
             logger.debug(f"Could not get commit {commit_or_branch}")
             return False
 
-        path = str(self.path_from_git_root(path))
-
-        try:
-            return commit.tree[path].path == path
-        except KeyError:
-            return False
+        return self.blob_reader.exists(commit.hexsha, self.path_from_git_root(path))
 
     def list_files_in_dir(
         self,
@@ -262,8 +663,128 @@ class GitUtil:
 
     @lru_cache
     def get_all_files(self) -> Set[Path]:
+        """All the files tracked by git, from the repository file index when one is in scope."""
+        if index := RepositoryFileIndex.active(Path(self.repo.working_dir)):
+            return set(map(Path, index.tracked_files))
         return set(map(Path, self.repo.git.ls_files("-z").split("\x00")))
 
+    def get_changes(
+        self, prev_ver: str = "", include_untracked: bool = False
+    ) -> GitChanges:
+        """
+        Gets all the changes against the prev_ver - committed, on the branch, staged and optionally untracked,
+        computed together in a single pass over the repository.
+        The status specific methods (`modified_files`, `added_files`, etc.) are views over these changes.
+
+        The committed, branch and staged changes are cached per repository, by the commits they were computed
+        between and the state of the index. The untracked changes are listed on every call,
+        as the working tree changes without either.
+
+        Args:
+            prev_ver (str): The base branch against which the comparison is made.
+            include_untracked (bool): Whether to list the untracked changes as well.
+        Returns:
+            GitChanges: The changes of the repository.
+        """
+        remote, branch = self.handle_prev_ver(prev_ver)
+        changes = self._get_changes(remote, branch)
+        if include_untracked:
+            changes = changes._replace(untracked=self._get_untracked_changes())
+        return changes
+
+    def _get_changes(self, remote: Optional[str], branch: str) -> GitChanges:
+        is_private_repo = string_to_bool(
+            os.getenv("DEMISTO_SDK_PRIVATE_REPO_MODE", ""), default_when_empty=False
+        )
+        key = (self.repo.git_dir, remote, branch, is_private_repo)
+        cached_state, changes = GitUtil._changes.get(key, (None, None))
+        if changes is not None and cached_state == self._changes_state(remote, branch):
+            return changes
+
+        self.fetch()
+        state = self._changes_state(remote, branch)
+        base_commit = self._get_base_commit(remote, branch)
+        current_hash = self.get_current_commit_hash()
+        changes = GitChanges(
+            committed=tuple(map(ChangedFile.from_diff, base_commit.diff(current_hash))),
+            branch=self._get_branch_changes(
+                remote, branch, current_hash, is_private_repo
+            ),
+            staged=tuple(map(ChangedFile.from_diff, self.repo.head.commit.diff())),
+        )
+        GitUtil._changes[key] = (state, changes)
+        return changes
+
+    def _get_base_commit(self, remote: Optional[str], branch: str) -> Commit:
+        if remote:
+            return self.repo.remote(name=remote).refs[branch].commit
+        # if remote does not exist we are checking against the commit sha1
+        return self.repo.commit(rev=branch)
+
+    def _changes_state(self, remote: Optional[str], branch: str) -> Tuple:
+        """What the changes are computed from: the base commit, the current commit and the index."""
+        try:
+            index = os.stat(os.path.join(self.repo.git_dir, "index"))
+            index_state: Optional[Tuple[int, int, int]] = (
+                index.st_ino,
+                index.st_mtime_ns,
+                index.st_size,
+            )
+        except OSError:
+            index_state = None
+        return (
+            self._get_base_commit(remote, branch).hexsha,
+            self.get_current_commit_hash(),
+            index_state,
+        )
+
+    def _get_branch_changes(
+        self,
+        remote: Optional[str],
+        branch: str,
+        current_hash: str,
+        is_private_repo: bool,
+    ) -> Tuple[ChangedFile, ...]:
+        """
+        Get the changes made on the current branch since it forked from the base branch.
+
+        Returns:
+            Tuple[ChangedFile, ...]: The changed files, with their statuses.
+        """
+        if remote:
+            diff_range = f"{remote}/{branch}...{current_hash}"
+
+        # In private repos, always use merge-base to find common ancestor
+        # This prevents including all diverged commits
+        elif is_private_repo:
+            try:
+                merge_base = self.repo.git.merge_base(branch, current_hash).strip()
+                diff_range = f"{merge_base}..{current_hash}"
+            except Exception:
+                diff_range = f"{branch}..{current_hash}"
+        else:
+            diff_range = f"{branch}...{current_hash}"
+
+        changes = []
+        fields = iter(self.repo.git.diff("--name-status", "-z", diff_range).split("\0"))
+        for status in fields:
+            if not status:
+                continue
+            change_type, score = status[0], status[1:]
+            if change_type in ("R", "C"):
+                old_path, new_path = Path(next(fields)), Path(next(fields))
+            else:
+                old_path = new_path = Path(next(fields))
+            changes.append(
+                ChangedFile(
+                    status=change_type,
+                    old_path=None if change_type == "A" else old_path,
+                    new_path=None if change_type == "D" else new_path,
+                    score=int(score) if score.isdigit() else None,
+                )
+            )
+        return tuple(changes)
+
     def modified_files(
         self,
         prev_ver: str = "",
@@ -283,7 +804,6 @@ class GitUtil:
             Set: A set of Paths to the modified files.
         """
         remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
 
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="M")
@@ -293,6 +813,8 @@ class GitUtil:
             )
             return last_commit
 
+        changes = self.get_changes(prev_ver, include_untracked=include_untracked)
+
         # get all renamed files - some of these can be identified as modified by git,
         # but we want to identify them as renamed - so will remove them from the returned files.
         renamed = {
@@ -316,29 +838,13 @@ class GitUtil:
         if not staged_only:
             # get all committed files identified as modified which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("M")
-                    if item.a_path is not None
-                }.union(untrue_rename_committed)
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    Path(os.path.join(item.a_path))  # type: ignore
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("M")
-                }.union(untrue_rename_committed)
+            committed = changes.paths_of(changes.committed, "M").union(
+                untrue_rename_committed
+            )
 
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed modified files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
-            committed = committed.intersection(all_branch_changed_files)
+            committed = committed.intersection(changes.branch_files)
 
         # remove the renamed and deleted files from the committed
         committed = committed - renamed - deleted
@@ -349,40 +855,20 @@ class GitUtil:
             )
             return committed
 
-        untracked: Set = set()
-        if include_untracked:
-            # get all untracked modified files
-            untracked = self._get_untracked_files("M")
-
-        # get all the files that are staged on the branch and identified as modified.
-        staged = {
-            Path(os.path.join(item.a_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("M")
-        }.union(untracked).union(untrue_rename_staged)
+        # get all the files that are staged on the branch and identified as modified,
+        # and all untracked modified files.
+        staged = (
+            changes.paths_of(changes.staged, "M")
+            .union(changes.paths_of(changes.untracked, "M"))
+            .union(untrue_rename_staged)
+        )
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will remove it from the staged modified files.
         # also remove the deleted and renamed files as well.
-        if remote:
-            committed_added = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("A")
-                if item.a_path is not None
-            }
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed_added = {
-                Path(os.path.join(item.a_path))  # type: ignore
-                for item in self.repo.commit(rev=branch)
-                .diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }
+        committed_added = changes.paths_of(changes.committed, "A")
 
         staged = staged - committed_added - renamed - deleted
 
@@ -417,7 +903,6 @@ class GitUtil:
             Set: A set of Paths to the added files.
         """
         remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
 
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="A")
@@ -427,6 +912,8 @@ class GitUtil:
             )
             return last_commit
 
+        changes = self.get_changes(prev_ver, include_untracked=include_untracked)
+
         deleted = self.deleted_files(prev_ver, committed_only, staged_only)
 
         # handle a case where a file is wrongly recognized as renamed (not 100% score) and is actually of added status
@@ -439,29 +926,13 @@ class GitUtil:
 
         # get all committed files identified as added which are changed from prev_ver.
         # this can result in extra files identified which were not touched on this branch.
-        if remote:
-            committed = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("A")
-                if item.a_path is not None
-            }.union(untrue_rename_committed)
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed = {
-                Path(os.path.join(item.a_path))  # type: ignore
-                for item in self.repo.commit(rev=branch)
-                .diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }.union(untrue_rename_committed)
+        committed = changes.paths_of(changes.committed, "A").union(
+            untrue_rename_committed
+        )
 
         # identify all files that were touched on this branch regardless of status
         # intersect these with all the committed files to identify the committed added files.
-        all_branch_changed_files = self._get_all_changed_files(prev_ver)
-        committed = committed.intersection(all_branch_changed_files)
+        committed = committed.intersection(changes.branch_files)
 
         # remove deleted files
         committed = committed - deleted
@@ -472,31 +943,20 @@ class GitUtil:
             )
             return committed
 
-        untracked_added: Set = set()
-        untracked_modified: Set = set()
-        if include_untracked:
-            # get all untracked added files
-            untracked_added = self._get_untracked_files("A")
-
-            # get all untracked modified files
-            untracked_modified = self._get_untracked_files("M")
-
         # get all the files that are staged on the branch and identified as added.
-        staged = {
-            Path(os.path.join(item.a_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("A")
-        }.union(untrue_rename_staged)
+        staged = changes.paths_of(changes.staged, "A").union(untrue_rename_staged)
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will added it from the staged added files.
         # same goes to untracked files - can be identified as modified but are actually added against prev_ver
-        committed_added_locally_modified = {
-            Path(os.path.join(item.a_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("M")
-        }.intersection(committed)
-        untracked = untracked_added.union(untracked_modified.intersection(committed))
+        committed_added_locally_modified = changes.paths_of(
+            changes.staged, "M"
+        ).intersection(committed)
+        untracked = changes.paths_of(changes.untracked, "A").union(
+            changes.paths_of(changes.untracked, "M").intersection(committed)
+        )
 
         staged = staged.union(committed_added_locally_modified).union(untracked)
 
@@ -531,37 +991,19 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the deleted files.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="D")
         if last_commit:
             return last_commit
 
+        changes = self.get_changes(prev_ver, include_untracked=include_untracked)
+
         committed = set()
 
         if not staged_only:
             # get all committed files identified as deleted which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("D")
-                    if item.a_path is not None
-                }
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    Path(os.path.join(item.a_path))  # type: ignore
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("D")
-                }
+            committed = changes.paths_of(changes.committed, "D")
 
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed deleted files.
@@ -571,8 +1013,7 @@ class GitUtil:
             )
 
             if not is_private_repo:
-                all_branch_changed_files = self._get_all_changed_files(prev_ver)
-                committed = committed.intersection(all_branch_changed_files)
+                committed = committed.intersection(changes.branch_files)
             else:
                 # Filter out .gitkeep files and files under AssetsModelingRules
                 committed = {
@@ -584,16 +1025,11 @@ class GitUtil:
         if committed_only:
             return committed
 
-        untracked: Set = set()
-        if include_untracked:
-            # get all untracked deleted files
-            untracked = self._get_untracked_files("D")
-
-        # get all the files that are staged on the branch and identified as deleted.
-        staged = {
-            Path(os.path.join(item.a_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("D")
-        }.union(untracked)
+        # get all the files that are staged on the branch and identified as deleted,
+        # and all untracked deleted files.
+        staged = changes.paths_of(changes.staged, "D").union(
+            changes.paths_of(changes.untracked, "D")
+        )
 
         if staged_only:
             return staged
@@ -621,9 +1057,6 @@ class GitUtil:
             Set: A set of Tuples of Paths to the renamed files -
             first element being the old file path and the second is the new.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="R")
         if last_commit:
@@ -632,40 +1065,20 @@ class GitUtil:
             )
             return last_commit
 
+        changes = self.get_changes(prev_ver, include_untracked=include_untracked)
+
         deleted = self.deleted_files(prev_ver, committed_only, staged_only)
         committed = set()
 
         if not staged_only:
             # get all committed files identified as renamed which are changed from prev_ver and are with 100% score.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    (Path(item.a_path), Path(item.b_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("R")
-                    if item.a_path is not None
-                    and item.b_path is not None
-                    and item.score == 100
-                }
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    (Path(item.a_path), Path(item.b_path))  # type: ignore
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("R")
-                    if item.score == 100
-                }
-
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed added files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
+            all_branch_changed_files = changes.branch_files
             committed = {
                 tuple_item
-                for tuple_item in committed
+                for tuple_item in changes.renames_of(changes.committed)
                 if (
                     tuple_item[1] in all_branch_changed_files
                     and tuple_item[1] not in deleted
@@ -682,17 +1095,11 @@ class GitUtil:
 
             return committed
 
-        untracked: Set = set()
-        if include_untracked:
-            # get all untracked renamed files
-            untracked = self._get_untracked_files("R")
-
-        # get all the files that are staged on the branch and identified as renamed and are with 100% score.
-        staged = {
-            (Path(item.a_path), Path(item.b_path))  # type: ignore
-            for item in self.repo.head.commit.diff().iter_change_type("R")
-            if item.score == 100
-        }.union(untracked)
+        # get all the files that are staged on the branch and identified as renamed and are with 100% score,
+        # and all untracked renamed files.
+        staged = changes.renames_of(changes.staged).union(
+            changes.renames_of(changes.untracked)
+        )
 
         if staged_only:
             self.debug_print(
@@ -743,33 +1150,50 @@ class GitUtil:
         }
         return pack_ids
 
-    def _get_untracked_files(self, requested_status: str) -> set:
-        """return all untracked files of the given requested status.
-        Args:
-            requested_status (str): M, A, R, D - the git status to return
+    def _get_untracked_changes(self) -> Tuple[ChangedFile, ...]:
+        """return all the local changes, as listed by `git status`.
         Returns:
-            Set: of path strings which include the untracked files of a certain status.
+            Tuple: of the changed files, with the first letter of their status.
         """
-        git_status = self.repo.git.status("--short", "-u").split("\n")
+        # without optional locks git status does not refresh the index, which would invalidate the cached changes
+        git_status = self.repo.git.status(
+            "--short", "-u", env={"GIT_OPTIONAL_LOCKS": "0"}
+        ).split("\n")
 
         # in case there are no local changes - return
         if git_status == [""]:
-            return set()
+            return ()
 
-        extracted_paths = set()
+        changes = []
         for line in git_status:
             line = line.strip()
-            file_status = line.split()[0].upper() if not line.startswith("?") else "A"
-            if file_status.startswith(requested_status):
-                if requested_status == "R":
-                    if file_status == "R100":
-                        extracted_paths.add(
-                            (Path(line.split()[-2]), Path(line.split()[-1]))
-                        )
-                else:
-                    extracted_paths.add(Path(line.split()[-1]))  # type: ignore
+            file_status = (
+                line.split()[0].upper()[0] if not line.startswith("?") else "A"
+            )
+            old_path = new_path = Path(line.split()[-1])
+            if file_status == "R":
+                # a rename is listed as `R <old path> -> <new path>`
+                old_path = Path(line.split()[1])
+            changes.append(
+                ChangedFile(
+                    status=file_status,
+                    old_path=None if file_status == "A" else old_path,
+                    new_path=None if file_status == "D" else new_path,
+                )
+            )
+        return tuple(changes)
 
-        return extracted_paths
+    def _get_untracked_files(self, requested_status: str) -> set:
+        """return all untracked files of the given requested status.
+        Args:
+            requested_status (str): M, A, R, D - the git status to return
+        Returns:
+            Set: of path strings which include the untracked files of a certain status.
+        """
+        untracked = self._get_untracked_changes()
+        if requested_status == "R":
+            return GitChanges.renames_of(untracked)
+        return GitChanges.paths_of(untracked, requested_status)
 
     @lru_cache
     def _get_staged_files(self) -> Set[Path]:
@@ -795,48 +1219,7 @@ class GitUtil:
         Returns:
             Set[Path]: of Paths to files changed in the current branch.
         """
-        self.fetch()
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_hash = self.get_current_commit_hash()
-
-        if remote:
-            changed_files = {
-                Path(os.path.join(item))
-                for item in self.repo.git.diff(
-                    "--name-only", f"{remote}/{branch}...{current_hash}"
-                ).split("\n")
-                if item
-            }
-
-        # if remote does not exist we are checking against the commit sha1 or branch
-        else:
-            is_private_repo = string_to_bool(
-                os.getenv("DEMISTO_SDK_PRIVATE_REPO_MODE", ""), default_when_empty=False
-            )
-
-            # In private repos, always use merge-base to find common ancestor
-            # This prevents including all diverged commits
-            if is_private_repo:
-                try:
-                    merge_base = self.repo.git.merge_base(branch, current_hash).strip()
-                    compare_from = merge_base
-                    diff_operator = ".."
-                except Exception:
-                    compare_from = branch
-                    diff_operator = ".."
-            else:
-                # For non-private repos, use three-dot diff
-                diff_operator = "..."
-                compare_from = branch
-
-            changed_files = {
-                Path(os.path.join(item))
-                for item in self.repo.git.diff(
-                    "--name-only", f"{compare_from}{diff_operator}{current_hash}"
-                ).split("\n")
-                if item
-            }
-        return changed_files
+        return self.get_changes(prev_ver or "").branch_files
 
     def _only_last_commit(
         self, prev_ver: str, requested_status: Lit_change_type
@@ -969,6 +1352,37 @@ class GitUtil:
     def get_current_commit_hash(self) -> str:
         return self.repo.head.object.hexsha
 
+    def get_working_tree_hash(self, paths: Sequence[str] = ()) -> str:
+        """
+        Get a hash representing the uncommitted state of the working tree.
+
+        Staged, unstaged and untracked changes are all taken into account, so two calls return the same
+        hash only if the dirty files (and their content) are identical.
+
+        Args:
+            paths (Sequence[str]): Paths (relative to the repository root) to limit the hash to.
+                Defaults to the whole repository.
+
+        Returns:
+            str: The sha1 of the dirty files' statuses, paths and content.
+        """
+        pathspecs = [f":/{path}" for path in paths]
+        git_status = self.repo.git.status("--porcelain", "-u", "-z", "--", *pathspecs)
+        entries = iter(git_status.split("\0"))
+        working_tree_hash = sha1()
+        for entry in entries:
+            if not entry:
+                continue
+            status, file_path = entry[:2], entry[3:]
+            if "R" in status or "C" in status:
+                # renames and copies are followed by the original path
+                file_path = f"{next(entries, '')} -> {file_path}"
+            working_tree_hash.update(f"{status} {file_path}\0".encode())
+            full_path = Path(self.repo.working_dir) / file_path.split(" -> ")[-1]
+            if full_path.is_file():
+                working_tree_hash.update(full_path.read_bytes())
+        return working_tree_hash.hexdigest()
+
     def git_path(self) -> str:
         git_path = self.repo.git.rev_parse("--show-toplevel")
         return git_path.replace("\n", "")
@@ -1003,46 +1417,16 @@ class GitUtil:
         Returns:
             Set: of Paths to non 100% renamed files which are of a given status.
         """
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
-        if staged_only:
-            return {
-                Path(item.b_path)  # type: ignore
-                for item in self.repo.head.commit.diff().iter_change_type("R")
-                if item.score < 100  # type: ignore
-                and self._check_file_status(
-                    file_path=str(item.b_path), remote=remote, branch=branch
-                )
-                == status
-            }
-
-        if remote:
-            return {
-                Path(item.b_path)
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("R")
-                if item.b_path is not None
-                and item.score is not None
-                and item.score < 100
-                and self._check_file_status(
-                    file_path=str(item.b_path), remote=remote, branch=branch
-                )
-                == status
-            }
-
-        # if remote does not exist we are checking against the commit sha1
+        changes = self._get_changes(remote, branch)
+        # the status of every file on the branch, as `_check_file_status` returns it
+        branch_statuses = changes.branch_statuses
         return {
-            Path(item.b_path)  # type: ignore
-            for item in self.repo.commit(rev=branch)
-            .diff(current_branch_or_hash)
-            .iter_change_type("R")
-            if item.score < 100  # type: ignore
-            and self._check_file_status(
-                file_path=str(item.b_path), remote=remote, branch=branch
-            )
-            == status
+            change.new_path  # type: ignore[misc]
+            for change in (changes.staged if staged_only else changes.committed)
+            if change.status == "R"
+            and change.score is not None
+            and change.score < 100
+            and branch_statuses.get(change.new_path, "") == status  # type: ignore[arg-type]
         }
 
     def _check_file_status(
@@ -1092,8 +1476,14 @@ class GitUtil:
         Returns:
             The fetched file content.
         """
-        file_content = self.repo.git.show(git_file_path)
-        return file_content
+        commit_or_branch, _, path = git_file_path.partition(":")
+        content = self.blob_reader.read(commit_or_branch, path)
+        if content is None:
+            # `git show` raises the GitCommandError the callers expect when the file does not exist
+            return self.repo.git.show(git_file_path)
+        # decoded and stripped as the output of `git show`
+        file_content = content.decode("utf-8", "surrogateescape")
+        return file_content[:-1] if file_content.endswith("\n") else file_content
 
     def get_local_remote_file_path(
         self, full_file_path: str, tag: str, from_remote: bool = True
@@ -5,6 +5,7 @@ This is for source of truth of handlers
 from .json.json5_handler import JSON5_Handler
 from .json.ujson_handler import UJSON_Handler as JSON_Handler
 from .xsoar_handler import XSOAR_Handler  # noqa: F401
+from .yaml.libyaml_handler import LIBYAML_Handler as YAML_SafeLoad_Handler  # noqa: F401
 from .yaml.ruamel_handler import RUAMEL_Handler as YAML_Handler
 
 DEFAULT_JSON_HANDLER = (
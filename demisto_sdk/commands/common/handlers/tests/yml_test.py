@@ -1,7 +1,12 @@
 from io import StringIO
+from typing import Type
 
+import pytest
 from ruamel.yaml import YAML  # noqa: TID251
+from ruamel.yaml.parser import ParserError  # noqa: TID251
+from ruamel.yaml.scanner import ScannerError  # noqa: TID251
 
+from demisto_sdk.commands.common.handlers.yaml.libyaml_handler import LIBYAML_Handler
 from demisto_sdk.commands.common.handlers.yaml.ruamel_handler import RUAMEL_Handler
 
 
@@ -38,3 +43,96 @@ class TestYAMLHandler:
 
         assert yaml_dump.yaml.indent.call_count == 1
         yaml_dump.yaml.indent.assert_called_with(sequence=4)
+
+
+class TestLIBYAMLHandler:
+    YAML_1_2_DATA = """
+bool: yes
+octal: 010
+explicit_octal: 0o10
+number: 1_000
+float: .5
+date: 2020-01-01
+timestamp: 2020-01-01T10:00:00+02:00
+empty:
+anchor: &anchor {a: 1}
+merged:
+  <<: *anchor
+  b: 2
+"""
+
+    @pytest.mark.parametrize("use_libyaml", [True, False])
+    def test_load_as_ruamel(self, use_libyaml: bool):
+        """
+        Given:
+            - A yaml with scalars which YAML 1.1 and YAML 1.2 resolve differently, and a merge key.
+        When:
+            - Loading it with the libyaml loader, and with its ruamel fallback.
+        Then:
+            - Ensure the loaded data is the same as the data loaded by the safe ruamel loader.
+        """
+        assert LIBYAML_Handler(use_libyaml=use_libyaml).load(
+            self.YAML_1_2_DATA
+        ) == RUAMEL_Handler(typ="safe").load(self.YAML_1_2_DATA)
+
+    @pytest.mark.parametrize("use_libyaml", [True, False])
+    def test_load_equals_sign(self, use_libyaml: bool):
+        """
+        Given:
+            - A playbook task condition with `simple: =`.
+        When:
+            - Loading it with the libyaml loader, and with its ruamel fallback.
+        Then:
+            - Ensure `=` is loaded as a string.
+        """
+        assert LIBYAML_Handler(use_libyaml=use_libyaml).load("simple: =\n") == {
+            "simple": "="
+        }
+
+    @pytest.mark.parametrize("use_libyaml", [True, False])
+    def test_load_duplicate_keys(self, use_libyaml: bool):
+        """
+        Given:
+            - A yaml with a duplicate key.
+        When:
+            - Loading it with the libyaml loader, and with its ruamel fallback.
+        Then:
+            - Ensure the loading fails, as with the safe ruamel loader.
+        """
+        with pytest.raises(Exception, match="duplicate key"):
+            LIBYAML_Handler(use_libyaml=use_libyaml).load("a: 1\na: 2\n")
+
+    @pytest.mark.parametrize("use_libyaml", [True, False])
+    @pytest.mark.parametrize(
+        "malformed_yaml, error",
+        [("a: [1, 2\n", ParserError), ("a: b: c\n", ScannerError)],
+    )
+    def test_load_malformed_yaml(
+        self, use_libyaml: bool, malformed_yaml: str, error: Type[Exception]
+    ):
+        """
+        Given:
+            - A malformed yaml.
+        When:
+            - Loading it with the libyaml loader, and with its ruamel fallback.
+        Then:
+            - Ensure the error of ruamel is raised, as the callers handle it.
+        """
+        with pytest.raises(error):
+            LIBYAML_Handler(use_libyaml=use_libyaml).load(malformed_yaml)
+
+    @pytest.mark.parametrize("use_libyaml", [True, False])
+    def test_load_non_scalar_keys(self, use_libyaml: bool):
+        """
+        Given:
+            - A yaml with a sequence as a mapping key, and a yaml where that key is duplicated.
+        When:
+            - Loading them with the libyaml loader, and with its ruamel fallback.
+        Then:
+            - Ensure the first is loaded as by the safe ruamel loader, and the duplicate key fails the loading
+              (rather than a TypeError of the duplicate keys check).
+        """
+        handler = LIBYAML_Handler(use_libyaml=use_libyaml)
+        assert handler.load("? [a, b]\n: 1\n") == {("a", "b"): 1}
+        with pytest.raises(Exception, match="duplicate key"):
+            handler.load("? [a, b]\n: 1\n? [a, b]\n: 2\n")
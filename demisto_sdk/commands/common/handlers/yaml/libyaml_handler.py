@@ -0,0 +1,146 @@
+import threading
+from typing import Any, Optional, Type
+
+from ruamel.yaml import YAML  # noqa:TID251 - this is the handler
+from ruamel.yaml.constructor import (  # noqa:TID251 - this is the handler
+    SafeConstructor as RuamelSafeConstructor,
+)
+from ruamel.yaml.resolver import (  # noqa:TID251 - this is the handler
+    VersionedResolver,
+    implicit_resolvers,
+)
+from ruamel.yaml.util import create_timestamp  # noqa:TID251 - this is the handler
+
+from demisto_sdk.commands.common.handlers.xsoar_handler import XSOAR_Handler
+from demisto_sdk.commands.common.handlers.yaml.ruamel_handler import RUAMEL_Handler
+
+YAML_VERSION = (1, 2)
+# `=` is resolved to the (unsupported) YAML value tag, which fails the loading of playbooks with `simple: =`.
+# It is loaded as a plain string instead.
+VALUE_TAG = "tag:yaml.org,2002:value"
+UNRESOLVED_TAGS = {VALUE_TAG, "tag:yaml.org,2002:yaml"}
+
+
+class _Resolver(VersionedResolver):
+    """The YAML 1.2 resolver of ruamel, without the value tag."""
+
+    def add_version_implicit_resolver(self, version, tag, regexp, first):
+        if tag not in UNRESOLVED_TAGS:
+            super().add_version_implicit_resolver(version, tag, regexp, first)
+
+
+def _get_libyaml_safe_loader() -> Optional[Type]:
+    """
+    Builds a PyYAML loader over the libyaml C parser, which loads the same objects as the (YAML 1.2) safe loader of ruamel.
+    Returns None when PyYAML or its libyaml bindings are not installed.
+    """
+    try:
+        import yaml
+        from yaml import CSafeLoader
+    except ImportError:
+        return None
+
+    class LibYAMLSafeLoader(CSafeLoader):
+        error = yaml.YAMLError  # the base error of the loading
+        yaml_implicit_resolvers: dict = {}
+        yaml_constructors = CSafeLoader.yaml_constructors.copy()
+        ruamel_timestamp_regexp: Any = RuamelSafeConstructor.timestamp_regexp
+
+        def construct_mapping(self, node, deep=False):
+            merge_keys = sum(
+                key_node.tag == "tag:yaml.org,2002:merge" for key_node, _ in node.value
+            )
+            keys_count = len(node.value) - merge_keys
+            self.flatten_mapping(node)
+            # merged keys are placed first and may be overridden, explicit keys must be unique
+            scalar_keys = [
+                (key_node.tag, key_node.value)
+                for key_node, _ in node.value[len(node.value) - keys_count :]
+                if isinstance(key_node, yaml.ScalarNode)
+            ]
+            if len(set(scalar_keys)) != len(scalar_keys):
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping",
+                    node.start_mark,
+                    "found duplicate key",
+                    node.start_mark,
+                )
+            return super().construct_mapping(node, deep=deep)
+
+        def construct_yaml_int(self, node) -> int:
+            value = self.construct_scalar(node).replace("_", "")
+            sign = -1 if value[0] == "-" else 1
+            if value[0] in "+-":
+                value = value[1:]
+            for prefix, base in (("0b", 2), ("0x", 16), ("0o", 8)):
+                if value.startswith(prefix):
+                    return sign * int(value[2:], base)
+            return sign * int(value)
+
+        def construct_yaml_timestamp(self, node) -> Any:
+            match = self.ruamel_timestamp_regexp.match(node.value)
+            if match is None:
+                raise yaml.constructor.ConstructorError(
+                    None,
+                    None,
+                    f'failed to construct timestamp from "{node.value}"',
+                    node.start_mark,
+                )
+            return create_timestamp(**match.groupdict())
+
+    LibYAMLSafeLoader.add_constructor(
+        "tag:yaml.org,2002:int", LibYAMLSafeLoader.construct_yaml_int
+    )
+    LibYAMLSafeLoader.add_constructor(
+        "tag:yaml.org,2002:timestamp", LibYAMLSafeLoader.construct_yaml_timestamp
+    )
+    for versions, tag, regexp, first in implicit_resolvers:
+        if YAML_VERSION in versions and tag not in UNRESOLVED_TAGS:
+            LibYAMLSafeLoader.add_implicit_resolver(tag, regexp, first)
+    return LibYAMLSafeLoader
+
+
+LIBYAML_SAFE_LOADER = _get_libyaml_safe_loader()
+
+
+class LIBYAML_Handler(XSOAR_Handler):
+    """
+    XSOAR wrapper for fast safe (not round-trip) yaml loading.
+    Loads with the libyaml C parser of PyYAML when it is installed, and otherwise with the safe loader of ruamel,
+    reusing one ruamel instance per thread. Both load the same objects (YAML 1.2, `=` is a string).
+    Dumping is done with the safe dumper of ruamel.
+    """
+
+    def __init__(self, use_libyaml: bool = True):
+        self._loader = LIBYAML_SAFE_LOADER if use_libyaml else None
+        self._dumper = RUAMEL_Handler(typ="safe")
+        self._local = threading.local()
+
+    @property
+    def yaml(self) -> YAML:
+        """The safe ruamel instance of the current thread"""
+        if (yaml := getattr(self._local, "yaml", None)) is None:
+            yaml = YAML(typ="safe")
+            yaml.Resolver = _Resolver
+            self._local.yaml = yaml
+        return yaml
+
+    def load(self, stream):
+        if self._loader is None:
+            return self.yaml.load(stream)
+        loader = self._loader(stream)
+        try:
+            return loader.get_single_data()
+        except self._loader.error:
+            # Loaded again by ruamel, which raises the (ruamel) errors the callers handle
+            if hasattr(stream, "seek"):
+                stream.seek(0)
+            return self.yaml.load(stream)
+        finally:
+            loader.dispose()
+
+    def dump(self, data, stream, indent=None, sort_keys=False, **kwargs):
+        self._dumper.dump(data, stream, indent=indent, sort_keys=sort_keys, **kwargs)
+
+    def dumps(self, data, indent=None, sort_keys=False, **kwargs):
+        return self._dumper.dumps(data, indent=indent, sort_keys=sort_keys, **kwargs)
@@ -11,6 +11,7 @@ from demisto_sdk.commands.common.hook_validations.content_entity_validator impor
     ContentEntityValidator,
 )
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.playbook_tasks_graph import PlaybookTasksGraph
 from demisto_sdk.commands.common.tools import is_string_uuid
 
 
@@ -466,18 +467,9 @@ class PlaybookValidator(ContentEntityValidator):
         Return:
             bool. if the Playbook has root is connected to all tasks.
         """
-        start_task_id = self.current_file.get("starttaskid")
-        tasks = self.current_file.get("tasks", {})
-        tasks_bucket = set()
-        next_tasks_bucket = set()
-        for task_id, task in tasks.items():
-            if task_id != start_task_id:
-                tasks_bucket.add(task_id)
-            next_tasks = task.get("nexttasks", {})
-            for next_task_ids in next_tasks.values():
-                if next_task_ids:
-                    next_tasks_bucket.update(next_task_ids)
-        orphan_tasks = tasks_bucket.difference(next_tasks_bucket)
+        orphan_tasks = PlaybookTasksGraph.from_playbook_data(
+            self.current_file
+        ).orphan_tasks
         if orphan_tasks:
             error_message, error_code = Errors.playbook_unconnected_tasks(orphan_tasks)
             if self.handle_error(error_message, error_code, file_path=self.file_path):
@@ -6,10 +6,15 @@ Module contains validation of schemas, ids and paths.
 import os
 import re
 import string
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import pykwalify
+from pykwalify.compat import yml as pykwalify_yaml
 from pykwalify.core import Core
+from pykwalify.errors import CoreError
+from pykwalify.rule import Rule
 
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
@@ -32,6 +37,51 @@ from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import get_remote_file, is_file_path_in_pack
 
 
+@lru_cache(maxsize=None)
+def get_compiled_schema(schema_path: str) -> Tuple[Dict[str, Rule], Rule]:
+    """Loads a schema file and compiles its pykwalify rules, once per process.
+
+    Args:
+        schema_path: The path of the schema file.
+
+    Returns:
+        The rules of the partial schemas (`schema;<name>`) by their names, and the root rule.
+    """
+    if not Path(schema_path).exists():
+        raise CoreError(f"Provided source_file do not exists on disk : {schema_path}")
+    with open(schema_path) as stream:
+        schema = pykwalify_yaml.load(stream)
+    if not schema:
+        raise CoreError(f"No data loaded from file : {schema_path}")
+    partial_rules = {
+        key.split(";", 1)[1]: Rule(schema=value)
+        for key, value in schema.items()
+        if key.startswith("schema;")
+    }
+    root_rule = Rule(
+        schema={
+            key: value for key, value in schema.items() if not key.startswith("schema;")
+        }
+    )
+    return partial_rules, root_rule
+
+
+class CompiledSchemaCore(Core):
+    """A pykwalify `Core` which validates already loaded data with the compiled rules of a schema file,
+    instead of reading the data and the schema files and compiling the rules on every validation."""
+
+    def __init__(self, source_data, schema_path: str):
+        self.partial_rules, self.compiled_root_rule = get_compiled_schema(schema_path)
+        super().__init__(source_data=source_data, schema_data={})
+
+    def _start_validate(self, value=None):
+        # the partial schemas are global in pykwalify, and the includes are resolved by name while validating
+        pykwalify.partial_schemas.update(self.partial_rules)
+        self.errors = []
+        self.root_rule = self.compiled_root_rule
+        self._validate(value, self.root_rule, "", [])
+
+
 class StructureValidator(BaseValidator):
     """Structure validator is designed to validate the correctness of the file structure we enter to content repo.
 
@@ -187,7 +237,13 @@ class StructureValidator(BaseValidator):
                     __file__, "..", "..", self.SCHEMAS_PATH, f"{scheme_file_name}.yml"
                 )
             )
-            core = Core(source_file=self.file_path, schema_files=[path])
+            if Path(self.file_path).suffix in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
+                # validate the data loaded by load_data_from_file, with the schema compiled once per process
+                core = CompiledSchemaCore(
+                    source_data=self.current_file, schema_path=path
+                )
+            else:
+                core = Core(source_file=self.file_path, schema_files=[path])
             core.validate(raise_exception=True)
         except Exception as err:
             try:
@@ -4,12 +4,13 @@ import os
 import platform
 import sys
 from pathlib import Path
-from typing import Callable, Iterable, Optional, Union
+from typing import Any, Callable, Iterable, Optional, Union
 
 import loguru  # noqa: TID251 # This is the only place where we allow it
 import typer
 
 from demisto_sdk.commands.common.constants import (
+    DEMISTO_SDK_LOG_FILE_ENQUEUE,
     DEMISTO_SDK_LOG_FILE_PATH,
     DEMISTO_SDK_LOG_FILE_SIZE,
     DEMISTO_SDK_LOG_NO_COLORS,
@@ -38,6 +39,52 @@ LOGURU_DIAGNOSE = "LOGURU_DIAGNOSE"
 logger = loguru.logger  # all SDK modules should import from this file, not from loguru
 logger.disable(None)  # enabled at setup_logging()
 
+# depth=2 reports the caller of LazyLogger in the records
+_lazy_logger = loguru.logger.opt(depth=2)
+_LEVEL_NUMBERS = {
+    level: loguru.logger.level(level).no for level in ("DEBUG", "INFO", "WARNING")
+}
+
+
+class LazyLogger:
+    """
+    A facade of the logger for messages which are expensive to build, built only when a sink accepts their level.
+
+    The message is a `str.format` template. Callable args are called (and the message is formatted)
+    only when a sink accepts the level of the record:
+
+        lazy_logger.debug("Pack {} files:\n{}", self.name, lambda: "\n".join(...))
+
+    Checking the level costs more than building a message of cheap values,
+    so messages of cheap values should be logged with an f-string through `logger`.
+    The messages are not parsed for color tags.
+    """
+
+    @staticmethod
+    def is_enabled_for(level: str) -> bool:
+        """Whether a sink accepts records of the level (to skip building what only a message uses)."""
+        level_no = _LEVEL_NUMBERS.get(level) or logger.level(level).no
+        return level_no >= logger._core.min_level  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _log(level: str, message: str, args: tuple) -> None:
+        if LazyLogger.is_enabled_for(level):
+            _lazy_logger.log(
+                level, message, *(arg() if callable(arg) else arg for arg in args)
+            )
+
+    def debug(self, message: str, *args: Any) -> None:
+        self._log("DEBUG", message, args)
+
+    def info(self, message: str, *args: Any) -> None:
+        self._log("INFO", message, args)
+
+    def warning(self, message: str, *args: Any) -> None:
+        self._log("WARNING", message, args)
+
+
+lazy_logger = LazyLogger()
+
 
 class PropagateHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
@@ -168,6 +215,10 @@ def _add_file_logger(log_path: Path, threshold: Optional[str], diagnose: bool):
         colorize=False,
         diagnose=diagnose,
         level=(threshold or DEFAULT_FILE_THRESHOLD),
+        # when set, the records are written by a thread of this process (also the records of its forked workers),
+        # so a slow disk doesn't block the logging code. Enqueueing a record costs more than writing it to a
+        # local disk, so it is opt-in.
+        enqueue=string_to_bool(os.getenv(DEMISTO_SDK_LOG_FILE_ENQUEUE), False),
     )
     if string_to_bool(os.getenv(DEMISTO_SDK_LOG_NOTIFY_PATH), False) and (
         not os.environ.get(DEMISTO_SDK_LOGGING_SET)
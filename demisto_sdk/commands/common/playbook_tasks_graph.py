@@ -0,0 +1,160 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+
+class PlaybookTasksGraph:
+    """The flow graph of the tasks of a playbook, built from their `nexttasks`.
+
+    Tasks are indexed by their position, and the edges are kept in two flat arrays (the offsets of the
+    next tasks of every task, and the next tasks themselves). Reachability from the start task and
+    mandatory propagation are computed in a single worklist pass, so every task is visited at most twice:
+    once when it is reached, and once more if it is later found to be mandatory.
+
+    A task is mandatory if it is the start task, or if it can be reached from the start task through tasks
+    which cannot be skipped (`skipunavailable` is not set).
+    """
+
+    def __init__(
+        self,
+        start_task_id: str,
+        next_tasks: Mapping[str, Iterable[str]],
+        skippable_tasks: Iterable[str] = (),
+    ) -> None:
+        """
+        Args:
+            start_task_id (str): The id of the start task (`starttaskid`).
+            next_tasks (Mapping[str, Iterable[str]]): Task id to the ids of its next tasks, for all the playbook tasks.
+            skippable_tasks (Iterable[str]): The ids of the tasks which can be skipped.
+        """
+        self.start_task_id = start_task_id
+        self.task_ids: List[str] = list(next_tasks)
+        # the start task is in the graph even if the playbook has no such task, as in the playbook flow
+        if start_task_id not in next_tasks:
+            self.task_ids.append(start_task_id)
+        self._task_to_index: Dict[str, int] = {
+            task_id: index for index, task_id in enumerate(self.task_ids)
+        }
+
+        self._offsets = array("I", [0])
+        self._next_tasks = array("I")
+        for task_id in self.task_ids:
+            for next_task_id in next_tasks.get(task_id) or ():
+                if (next_task := self._task_to_index.get(next_task_id)) is not None:
+                    self._next_tasks.append(next_task)
+            self._offsets.append(len(self._next_tasks))
+
+        self._skippable = bytearray(len(self.task_ids))
+        for task_id in skippable_tasks:
+            if (index := self._task_to_index.get(task_id)) is not None:
+                self._skippable[index] = 1
+
+        self._reachable = bytearray(len(self.task_ids))
+        self._mandatory = bytearray(len(self.task_ids))
+        self._propagate(self._task_to_index[start_task_id])
+
+    @classmethod
+    def from_playbook_data(cls, playbook_data: dict) -> "PlaybookTasksGraph":
+        """Builds the tasks graph of a playbook from its yml data. Empty tasks are ignored, as missing tasks are."""
+        tasks: Dict[str, dict] = {
+            task_id: task
+            for task_id, task in (playbook_data.get("tasks") or {}).items()
+            if task
+        }
+        return cls(
+            start_task_id=playbook_data.get("starttaskid", ""),
+            next_tasks={
+                task_id: _flatten_next_tasks(task.get("nexttasks"))
+                for task_id, task in tasks.items()
+            },
+            skippable_tasks=[
+                task_id
+                for task_id, task in tasks.items()
+                if task.get("skipunavailable", False)
+            ],
+        )
+
+    @classmethod
+    def from_task_configs(
+        cls, start_task_id: str, tasks: Mapping[str, Any]
+    ) -> "PlaybookTasksGraph":
+        """Builds the tasks graph of a playbook from its parsed task models (TaskConfig)."""
+        return cls(
+            start_task_id=start_task_id,
+            next_tasks={
+                task_id: _flatten_next_tasks(task.nexttasks)
+                for task_id, task in tasks.items()
+            },
+            skippable_tasks=[
+                task_id for task_id, task in tasks.items() if task.skipunavailable
+            ],
+        )
+
+    def _propagate(self, start: int) -> None:
+        offsets, next_tasks = self._offsets, self._next_tasks
+        reachable, mandatory, skippable = (
+            self._reachable,
+            self._mandatory,
+            self._skippable,
+        )
+        reachable[start] = mandatory[start] = 1
+        worklist = [start]
+        while worklist:
+            task = worklist.pop()
+            task_mandatory = mandatory[task]
+            for next_task in next_tasks[offsets[task] : offsets[task + 1]]:
+                next_mandatory = task_mandatory and not skippable[next_task]
+                if not reachable[next_task]:
+                    reachable[next_task] = 1
+                    mandatory[next_task] = next_mandatory
+                    worklist.append(next_task)
+                elif next_mandatory and not mandatory[next_task]:
+                    # a mandatory path to a task which was reached through an optional one
+                    mandatory[next_task] = 1
+                    worklist.append(next_task)
+
+    def __contains__(self, task_id: object) -> bool:
+        return self.is_reachable(task_id)  # type: ignore[arg-type]
+
+    def is_reachable(self, task_id: str) -> bool:
+        """Whether the task is connected to the start task."""
+        index = self._task_to_index.get(task_id)
+        return index is not None and bool(self._reachable[index])
+
+    def is_mandatory(self, task_id: str) -> bool:
+        """Whether the task is mandatory.
+
+        Raises:
+            KeyError: If the task is not connected to the start task.
+        """
+        index = self._task_to_index.get(task_id)
+        if index is None or not self._reachable[index]:
+            raise KeyError(task_id)
+        return bool(self._mandatory[index])
+
+    @property
+    def reachable_tasks(self) -> List[str]:
+        return [
+            task_id
+            for task_id, reachable in zip(self.task_ids, self._reachable)
+            if reachable
+        ]
+
+    @property
+    def orphan_tasks(self) -> Set[str]:
+        """The tasks, other than the start task, which are not the next task of any task."""
+        has_previous_task = bytearray(len(self.task_ids))
+        for next_task in self._next_tasks:
+            has_previous_task[next_task] = 1
+        return {
+            task_id
+            for task_id, has_previous in zip(self.task_ids, has_previous_task)
+            if not has_previous and task_id != self.start_task_id
+        }
+
+
+def _flatten_next_tasks(next_tasks: Optional[Dict[str, Any]]) -> List[str]:
+    return [
+        task_id
+        for task_ids in (next_tasks or {}).values()
+        for task_id in task_ids or ()
+    ]
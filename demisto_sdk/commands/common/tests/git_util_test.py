@@ -166,3 +166,239 @@ def test_get_file_creation_date(git_repo: Repo):
     file_creation_date = git_repo.git_util.get_file_creation_date(file)
 
     datetime.strptime(file_creation_date, ISO_TIMESTAMP_FORMAT)  # raises if invalid
+
+
+def test_get_working_tree_hash(git_repo: Repo):
+    """
+    Given:
+    - A git repo with a committed file.
+
+    When:
+    - Computing the working tree hash before and after changing files.
+
+    Then:
+    - The hash is stable while nothing changes.
+    - The hash changes when a file is modified or an untracked file is added.
+    - Changes outside the requested paths are ignored.
+    """
+    git_repo.make_dir("Packs/MyPack")
+    git_repo.make_file(Path("Packs/MyPack/file.txt"), "lorem ipsum")
+    git_repo.git_util.commit_files("added file", "Packs/MyPack/file.txt")
+    git_util = git_repo.git_util
+
+    clean_hash = git_util.get_working_tree_hash(("Packs",))
+    assert clean_hash == git_util.get_working_tree_hash(("Packs",))
+
+    git_repo.make_file(Path("other.txt"), "not in packs")
+    assert clean_hash == git_util.get_working_tree_hash(("Packs",))
+
+    git_repo.make_file(Path("Packs/MyPack/file.txt"), "dolor sit amet")
+    modified_hash = git_util.get_working_tree_hash(("Packs",))
+    assert modified_hash != clean_hash
+
+    git_repo.make_file(Path("Packs/MyPack/new.txt"), "new")
+    assert git_util.get_working_tree_hash(("Packs",)) not in (
+        clean_hash,
+        modified_hash,
+    )
+
+
+def test_blob_reader(git_repo: Repo):
+    """
+    Given:
+    - A git repo with a file committed twice.
+
+    When:
+    - Reading files of the commits through the blob reader of the repo.
+
+    Then:
+    - The file content of each commit is returned, and the reader is shared by the GitUtil objects of the repo.
+    - Missing files, directories and commits are read as None.
+    """
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+    git_repo.make_dir("Packs/MyPack")
+    file = Path("Packs/MyPack/file.txt")
+    git_repo.make_file(file, "lorem ipsum")
+    git_repo.git_util.commit_files("added file", str(file))
+    first_commit = git_repo.git_util.get_current_commit_hash()
+    git_repo.make_file(file, "dolor sit amet")
+    git_repo.git_util.commit_files("modified file", str(file))
+
+    reader = git_repo.git_util.blob_reader
+    assert GitUtil(git_repo.path).blob_reader is reader
+    assert reader.read(first_commit, file) == b"lorem ipsum"
+    assert reader.read("HEAD", file) == b"dolor sit amet"
+    assert reader.read_many(first_commit, [file, "missing.txt"]) == {
+        file.as_posix(): b"lorem ipsum",
+        "missing.txt": None,
+    }
+    assert reader.read("HEAD", "Packs/MyPack") is None
+    assert reader.read("no-such-branch", file) is None
+    assert reader.exists("HEAD", "Packs/MyPack")
+    assert not reader.exists("HEAD", "missing.txt")
+
+
+def test_blob_reader_dotfiles(git_repo: Repo):
+    """
+    Given:
+    - A git repo with a committed dotfile and a file in a dot directory.
+
+    When:
+    - Checking whether the paths exist in the commit, with and without a leading `./`.
+
+    Then:
+    - The dotfiles are found, as paths from the repository root.
+    """
+    git_repo.make_dir(".github")
+    for file in (Path(".pack-ignore"), Path(".github/CODEOWNERS")):
+        git_repo.make_file(file, "lorem ipsum")
+        git_repo.git_util.commit_files("added dotfile", str(file))
+
+    reader = git_repo.git_util.blob_reader
+    assert reader.exists("HEAD", ".pack-ignore")
+    assert reader.exists("HEAD", "./.pack-ignore")
+    assert reader.exists("HEAD", Path(".github/CODEOWNERS"))
+    assert reader.exists("HEAD", "./.github")
+    assert reader.exists("HEAD", ".")
+    assert not reader.exists("HEAD", ".missing")
+    assert reader.read("HEAD", "./.pack-ignore") == b"lorem ipsum"
+
+
+def test_get_changes(git_repo: Repo, mocker):
+    """
+    Given:
+    - A git repo with a branch which modified, added, deleted and renamed files, and has staged and untracked changes.
+
+    When:
+    - Getting the changes against the primary branch, and the files of each status.
+
+    Then:
+    - All the changes are computed in a single pass, which is reused by the status specific methods.
+    - The changes are computed again once the index changes.
+    """
+    from demisto_sdk.commands.common.git_util import GitUtil
+    from demisto_sdk.commands.common.git_util import Repo as GitRepo
+
+    mocker.patch.object(GitRepo, "remote", return_value="")
+    mocker.patch.object(GitUtil, "fetch", return_value=None)
+    git_util = git_repo.git_util
+    content = "\n".join(f"line {i}" for i in range(20))
+    git_repo.make_dir("Packs/MyPack")
+    for name in ("modified", "deleted", "renamed", "script"):
+        git_repo.make_file(Path(f"Packs/MyPack/{name}.yml"), f"{name}\n{content}")
+    git_util.commit_files("added files")
+    git_util.repo.git.checkout("-b", "feature")
+
+    git_repo.make_file(Path("Packs/MyPack/modified.yml"), "changed")
+    git_repo.make_file(Path("Packs/MyPack/added.yml"), "added")
+    Path(git_repo.path, "Packs/MyPack/deleted.yml").unlink()
+    git_util.repo.git.mv("Packs/MyPack/renamed.yml", "Packs/MyPack/new_name.yml")
+    Path(git_repo.path, "Packs/MyPack/script.yml").chmod(0o755)
+    git_util.commit_files("changed files")
+    git_repo.make_file(Path("Packs/MyPack/staged.yml"), "staged")
+    git_util.stage_file(Path(git_repo.path, "Packs/MyPack/staged.yml"))
+    git_repo.make_file(Path("Packs/MyPack/untracked.yml"), "untracked")
+
+    changes = git_util.get_changes("master", include_untracked=True)
+    assert {(c.status, c.path) for c in changes.committed} == {
+        ("M", Path("Packs/MyPack/modified.yml")),
+        ("M", Path("Packs/MyPack/script.yml")),
+        ("A", Path("Packs/MyPack/added.yml")),
+        ("D", Path("Packs/MyPack/deleted.yml")),
+        ("R", Path("Packs/MyPack/renamed.yml")),
+    }
+    assert [c.path for c in changes.committed if c.permissions_changed] == [
+        Path("Packs/MyPack/script.yml")
+    ]
+    assert [c.new_path for c in changes.staged] == [Path("Packs/MyPack/staged.yml")]
+    assert Path("Packs/MyPack/untracked.yml") in {c.path for c in changes.untracked}
+
+    diff = mocker.spy(GitUtil, "_get_branch_changes")
+    assert git_util.modified_files("master") == {
+        Path("Packs/MyPack/modified.yml"),
+        Path("Packs/MyPack/script.yml"),
+    }
+    assert git_util.added_files("master", include_untracked=True) == {
+        Path("Packs/MyPack/added.yml"),
+        Path("Packs/MyPack/staged.yml"),
+        Path("Packs/MyPack/untracked.yml"),
+    }
+    assert git_util.deleted_files("master") == {Path("Packs/MyPack/deleted.yml")}
+    assert GitUtil(git_repo.path).renamed_files("master") == {
+        (Path("Packs/MyPack/renamed.yml"), Path("Packs/MyPack/new_name.yml"))
+    }
+    assert diff.call_count == 0
+
+    git_util.stage_file(Path(git_repo.path, "Packs/MyPack/untracked.yml"))
+    assert Path("Packs/MyPack/untracked.yml") in git_util.added_files(
+        "master", staged_only=True
+    )
+    assert diff.call_count == 1
+
+
+def test_repository_file_index(git_repo: Repo):
+    """
+    Given:
+    - A git repo with committed, untracked, deleted and ignored files.
+
+    When:
+    - Looking up files of the repository within a repository file index scope, and out of it.
+
+    Then:
+    - The index has the committed and untracked files, but not the deleted and ignored ones.
+    - The lookups by directory, pack, content type folder and suffix find the indexed files.
+    - Out of the scope the paths are not looked up in the index.
+    """
+    from demisto_sdk.commands.common.git_util import RepositoryFileIndex
+
+    for file in (
+        "Packs/MyPack/pack_metadata.json",
+        "Packs/MyPack/Integrations/MyInt/MyInt.yml",
+        "Packs/MyPack/Integrations/MyInt/MyInt.py",
+        "Packs/MyPack/Scripts/MyScript/MyScript.yml",
+        "Packs/MyPack-Other/Scripts/OtherScript/OtherScript.yml",
+        "Packs/MyPack/deleted.yml",
+    ):
+        Path(git_repo.path, file).parent.mkdir(parents=True, exist_ok=True)
+        Path(git_repo.path, file).write_text("data")
+    git_repo.git_util.commit_files("added files")
+    Path(git_repo.path, "Packs/MyPack/deleted.yml").unlink()
+    git_repo.make_file(Path("Packs/MyPack/Integrations/MyInt/untracked.md"), "data")
+    git_repo.make_file(Path(".gitignore"), "*.pyc")
+    git_repo.make_file(Path("Packs/MyPack/Integrations/MyInt/MyInt.pyc"), "data")
+    integration_dir = Path(git_repo.path, "Packs/MyPack/Integrations/MyInt")
+
+    assert RepositoryFileIndex.active(integration_dir) is None
+    with RepositoryFileIndex.scope(Path(git_repo.path)):
+        index = RepositoryFileIndex.active(integration_dir)
+        assert index is not None
+        assert sorted(index.list_dir(integration_dir)) == [
+            integration_dir / "MyInt.py",
+            integration_dir / "MyInt.yml",
+            integration_dir / "untracked.md",
+        ]
+        assert index.list_dir(integration_dir, suffixes=[".yml"]) == [
+            integration_dir / "MyInt.yml"
+        ]
+        assert index.is_dir(integration_dir)
+        assert index.exists(integration_dir / "MyInt.yml")
+        assert not index.exists(Path(git_repo.path, "Packs/MyPack/deleted.yml"))
+        assert not index.exists(integration_dir / "MyInt.pyc")
+        assert len(index.list_dir(Path(git_repo.path, "Packs/MyPack"))) == 5
+        assert index.list_dir(Path(git_repo.path, "Packs/MyPack"), recursive=False) == [
+            Path(git_repo.path, "Packs/MyPack/pack_metadata.json")
+        ]
+        assert index.pack_files("MyPack", suffixes=[".yml"]) == [
+            Path("Packs/MyPack/Integrations/MyInt/MyInt.yml"),
+            Path("Packs/MyPack/Scripts/MyScript/MyScript.yml"),
+        ]
+        assert index.content_type_files("Scripts") == [
+            Path("Packs/MyPack-Other/Scripts/OtherScript/OtherScript.yml"),
+            Path("Packs/MyPack/Scripts/MyScript/MyScript.yml"),
+        ]
+        assert index.suffix_files(".md") == [
+            Path("Packs/MyPack/Integrations/MyInt/untracked.md")
+        ]
+        assert Path("Packs/MyPack/deleted.yml") in git_repo.git_util.get_all_files()
+    assert RepositoryFileIndex.active(integration_dir) is None
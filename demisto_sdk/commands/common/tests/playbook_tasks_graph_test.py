@@ -0,0 +1,118 @@
+import pytest
+
+from demisto_sdk.commands.common.playbook_tasks_graph import PlaybookTasksGraph
+
+
+def create_playbook_data(next_tasks: dict, skippable: tuple = ()) -> dict:
+    return {
+        "starttaskid": "0",
+        "tasks": {
+            task_id: {
+                "id": task_id,
+                "nexttasks": {"#none#": task_ids} if task_ids else None,
+                "skipunavailable": task_id in skippable,
+            }
+            for task_id, task_ids in next_tasks.items()
+        },
+    }
+
+
+def test_mandatory_propagation():
+    """
+    Given:
+        - A playbook 0 -> 1 -> 2, where task 1 can be skipped.
+    When:
+        - Building the tasks graph.
+    Then:
+        - Ensure the tasks after the skippable task are not mandatory.
+    """
+    graph = PlaybookTasksGraph.from_playbook_data(
+        create_playbook_data({"0": ["1"], "1": ["2"], "2": []}, skippable=("1",))
+    )
+
+    assert graph.is_mandatory("0")
+    assert not graph.is_mandatory("1")
+    assert not graph.is_mandatory("2")
+
+
+def test_mandatory_path_found_after_optional_path():
+    """
+    Given:
+        - A playbook where task 3 is reached first through the skippable task 1,
+          and then through the longer mandatory path 0 -> 2 -> 4 -> 3.
+    When:
+        - Building the tasks graph.
+    Then:
+        - Ensure task 3 and the task following it are mandatory.
+    """
+    graph = PlaybookTasksGraph.from_playbook_data(
+        create_playbook_data(
+            {"0": ["1", "2"], "1": ["3"], "2": ["4"], "4": ["3"], "3": ["5"], "5": []},
+            skippable=("1",),
+        )
+    )
+
+    assert not graph.is_mandatory("1")
+    assert graph.is_mandatory("3")
+    assert graph.is_mandatory("5")
+
+
+def test_unreachable_and_orphan_tasks():
+    """
+    Given:
+        - A playbook with a loop, a task which is not connected to the start task,
+          and a next task which does not exist.
+    When:
+        - Building the tasks graph.
+    Then:
+        - Ensure only the connected tasks are reachable.
+        - Ensure checking whether an unreachable task is mandatory raises KeyError.
+        - Ensure the orphan tasks are the ones which are not the next task of any task.
+    """
+    graph = PlaybookTasksGraph.from_playbook_data(
+        create_playbook_data({"0": ["1"], "1": ["0", "9"], "2": ["3"], "3": []})
+    )
+
+    assert graph.reachable_tasks == ["0", "1"]
+    assert "2" not in graph
+    with pytest.raises(KeyError):
+        graph.is_mandatory("3")
+    assert graph.orphan_tasks == {"2"}
+
+
+def test_invalid_start_task():
+    """
+    Given:
+        - A playbook whose start task does not exist.
+    When:
+        - Building the tasks graph.
+    Then:
+        - Ensure only the start task is reachable.
+    """
+    playbook_data = create_playbook_data({"1": []})
+    playbook_data["starttaskid"] = "missing"
+
+    graph = PlaybookTasksGraph.from_playbook_data(playbook_data)
+
+    assert graph.reachable_tasks == ["missing"]
+    assert graph.is_mandatory("missing")
+    assert graph.orphan_tasks == {"1"}
+
+
+def test_empty_tasks():
+    """
+    Given:
+        - A playbook 0 -> 1 -> 2, where task 1 is empty (`1: null` in the yml).
+    When:
+        - Building the tasks graph.
+    Then:
+        - Ensure the empty task is ignored as a missing task, and does not fail the graph.
+    """
+    playbook_data = create_playbook_data({"0": ["1"], "1": ["2"], "2": []})
+    playbook_data["tasks"]["1"] = None
+
+    graph = PlaybookTasksGraph.from_playbook_data(playbook_data)
+
+    assert graph.reachable_tasks == ["0"]
+    assert "1" not in graph
+    assert graph.orphan_tasks == {"2"}
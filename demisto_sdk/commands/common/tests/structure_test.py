@@ -41,10 +41,12 @@ from demisto_sdk.commands.common.constants import (
     FileType,
 )
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.hook_validations import structure
 from demisto_sdk.commands.common.hook_validations.base_validator import BaseValidator
 from demisto_sdk.commands.common.hook_validations.structure import (
     StructureValidator,
     checked_type_by_reg,
+    get_compiled_schema,
 )
 from demisto_sdk.commands.common.tools import get_file, write_dict
 from demisto_sdk.tests.constants_test import (
@@ -546,6 +548,29 @@ class TestStructureValidator:
         structure = StructureValidator(str(tmp_path / "integration-editid.yml"))
         assert structure.is_valid_scheme()
 
+    def test_schema_compiled_once(self, mocker):
+        """
+        Given:
+            - Two playbooks, a valid one and an invalid one.
+        When:
+            - Validating the scheme of both of them.
+        Then:
+            - Ensure the playbook schema is loaded and compiled only once.
+            - Ensure only the invalid playbook fails the validation.
+        """
+        mocker.patch.object(
+            StructureValidator, "scheme_of_file_by_path", return_value="playbook"
+        )
+        get_compiled_schema.cache_clear()
+        load_schema = mocker.spy(structure.pykwalify_yaml, "load")
+        valid_validator = StructureValidator(file_path=VALID_TEST_PLAYBOOK_PATH)
+        invalid_validator = StructureValidator(file_path=INVALID_PLAYBOOK_PATH)
+
+        assert valid_validator.is_valid_scheme()
+        assert not invalid_validator.is_valid_scheme()
+        assert load_schema.call_count == 1
+        assert get_compiled_schema.cache_info().currsize == 1
+
 
 class TestGetMatchingRegex:
     INPUTS = [
@@ -2,6 +2,7 @@ import glob
 import os
 import shutil
 from configparser import ConfigParser
+from contextlib import nullcontext
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from typing import Callable, List, Optional, Tuple, Union
@@ -40,7 +41,7 @@ from demisto_sdk.commands.common.git_content_config import (
     GitContentConfig,
     GitCredentials,
 )
-from demisto_sdk.commands.common.git_util import GitUtil
+from demisto_sdk.commands.common.git_util import GitUtil, RepositoryFileIndex
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
 from demisto_sdk.commands.common.legacy_git_tools import git_path
@@ -435,6 +436,32 @@ class TestGenericFunctions:
         output = find_type(madeup_path)
         assert not output
 
+    def test_find_type_cached_by_modification(self, mocker, tmp_path):
+        """
+        Given
+        - A content file which is classified by its contents.
+
+        When
+        - Running find_type on it twice, then once more after it is rewritten as another type.
+
+        Then
+        - Ensure the file is read once until it changes, and then classified again.
+        """
+        path = tmp_path / "item.json"
+        path.write_text(json.dumps({"id": "incident_field", "cliName": "field"}))
+        get_dict_from_file_mock = mocker.patch(
+            "demisto_sdk.commands.common.tools.get_dict_from_file",
+            side_effect=lambda path, **_: (json.loads(Path(path).read_text()), "json"),
+        )
+
+        assert find_type(str(path)) == FileType.INCIDENT_FIELD
+        assert find_type(str(path)) == FileType.INCIDENT_FIELD
+        assert get_dict_from_file_mock.call_count == 1
+
+        path.write_text(json.dumps({"id": "indicator_field", "cliName": "field"}))
+        assert find_type(str(path)) == FileType.INDICATOR_FIELD
+        assert get_dict_from_file_mock.call_count == 2
+
     test_path_md = [VALID_MD]
 
     @pytest.mark.parametrize("path", test_path_md)
@@ -752,6 +779,12 @@ class TestEntityAttributes:
 
 
 class TestGetFilesInDir:
+    @pytest.fixture(autouse=True, params=[False, True], ids=["glob", "file_index"])
+    def file_index(self, request):
+        """Lists the files with glob, and from the repository file index"""
+        with RepositoryFileIndex.scope() if request.param else nullcontext():
+            yield
+
     def test_project_dir_is_file(self):
         project_dir = "demisto_sdk/commands/download/downloader.py"
         assert get_files_in_dir(project_dir, ["py"]) == [project_dir]
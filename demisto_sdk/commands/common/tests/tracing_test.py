@@ -0,0 +1,102 @@
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.common import tracing
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.timers import MEASURE_TYPE_TO_HEADERS, MeasureType
+from demisto_sdk.commands.common.tracing import span, traced
+
+
+@pytest.fixture
+def trace_path(tmp_path: Path):
+    path = tmp_path / "trace.json"
+    tracing.start_tracing(path)
+    yield path
+    tracing.stop_tracing()
+
+
+def span_in_worker(number: int) -> int:
+    with span("test.worker", number=number):
+        return number
+
+
+def test_span_disabled():
+    """
+    Given -
+        tracing which is not enabled
+    When -
+        entering spans
+    Then -
+        verify the spans are the shared no-op context manager and no event is recorded
+    """
+    assert not tracing.is_tracing()
+    with span("test.outer", attribute=1) as outer:
+        assert outer is None
+    assert span("test.outer") is span("test.other")
+    assert not tracing._events
+
+
+def test_nested_spans_exported(trace_path: Path, caplog):
+    """
+    Given -
+        enabled tracing
+    When -
+        running nested spans and a traced function, and exporting the trace
+    Then -
+        verify the trace file is a Chrome trace of the spans, with their attributes and nesting,
+        and the summary table is logged
+    """
+
+    @traced("test.function")
+    def function():
+        pass
+
+    with span("test.outer", pack="MyPack"):
+        function()
+        function()
+
+    assert tracing.export_trace() == trace_path
+
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert set(spans) == {"test.outer", "test.function"}
+    assert spans["test.outer"]["args"] == {"pack": "MyPack"}
+    assert spans["test.outer"]["cat"] == "test"
+    outer, inner = spans["test.outer"], spans["test.function"]
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert all(
+        header in caplog.text for header in MEASURE_TYPE_TO_HEADERS[MeasureType.SPANS]
+    )
+    assert [row[0] for row in tracing.summarize(events)] == [
+        "test.outer",
+        "test.function",
+    ]
+    assert tracing.summarize(events)[1][-1] == "2"
+
+
+def test_spans_of_worker_processes(trace_path: Path):
+    """
+    Given -
+        enabled tracing
+    When -
+        running spans in the workers of a multiprocessing pool, started inside a span of the main process
+    Then -
+        verify the trace contains the spans of the main process and of the workers, each with its own pid,
+        and the part files of the workers are removed
+    """
+    with span("test.pool"), multiprocessing.Pool(processes=2) as pool:
+        assert sorted(pool.imap_unordered(span_in_worker, range(6))) == list(range(6))
+
+    tracing.export_trace()
+
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    worker_spans = [event for event in events if event["name"] == "test.worker"]
+    assert sorted(int(event["args"]["number"]) for event in worker_spans) == list(
+        range(6)
+    )
+    main_pid = next(event["pid"] for event in events if event["name"] == "test.pool")
+    assert all(event["pid"] != main_pid for event in worker_spans)
+    assert not tracing._parts_dir(trace_path).exists()
@@ -25,11 +25,13 @@ packs: dict = {}
 class MeasureType(Enum):
     FUNCTIONS = "functions"
     PACKS = "packs"
+    SPANS = "spans"
 
 
 MEASURE_TYPE_TO_HEADERS: Dict[MeasureType, Sequence[str]] = {
     MeasureType.FUNCTIONS: ["Function", "Avg", "Total", "Call count"],
     MeasureType.PACKS: ["Pack", "Start Time", "End Time", "Total Time"],
+    MeasureType.SPANS: ["Span", "Avg", "Total", "Max", "Count"],
 }
 
 
@@ -143,13 +143,13 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.git_content_config import GitContentConfig, GitProvider
-from demisto_sdk.commands.common.git_util import GitUtil
+from demisto_sdk.commands.common.git_util import GitUtil, RepositoryFileIndex
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON5_HANDLER as json5
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
 from demisto_sdk.commands.common.handlers import (
     XSOAR_Handler,
-    YAML_Handler,
+    YAML_SafeLoad_Handler,
 )
 from demisto_sdk.commands.common.handlers.xsoar_handler import (
     JSONDecodeError,
@@ -165,12 +165,15 @@ DEMISTO_SDK_REPO = "demisto/demisto-sdk"
 if TYPE_CHECKING:
     from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
 
-yaml_safe_load = YAML_Handler(typ="safe")
+yaml_safe_load = YAML_SafeLoad_Handler()
 
 urllib3.disable_warnings()
 
 GRAPH_SUPPORTED_FILE_TYPES = ["yml", "json"]
 
+# Bounds the find_type caches, large enough to hold the files of a validate run
+FIND_TYPE_CACHE_SIZE = 4096
+
 
 class MarketplaceTagParser:
     def __init__(self, marketplace: str = MarketplaceVersions.XSOAR.value):
@@ -346,6 +349,24 @@ def get_files_in_dir(
     if ignore_test_files:
         exclude_all_list.extend(TESTS_AND_DOC_DIRECTORIES)
 
+    if (index := RepositoryFileIndex.active(project_dir)) and index.is_dir(project_dir):
+        if any(project_dir.endswith(file_type) for file_type in file_endings):
+            return [project_dir]
+        # the excluded files are the ones directly in an excluded directory under the project directory
+        excluded_dirs = tuple(f"/{exclude_item}" for exclude_item in exclude_all_list)
+        return [
+            str(path)
+            for path in index.list_dir(
+                project_dir,
+                suffixes=[f".{file_type}" for file_type in file_endings],
+                recursive=recursive,
+            )
+            if not (
+                excluded_dirs
+                and f"/{path.parent.relative_to(project_dir)}".endswith(excluded_dirs)
+            )
+        ]
+
     project_path = Path(project_dir)
     glob_function = project_path.rglob if recursive else project_path.glob
     for file_type in file_endings:
@@ -967,10 +988,13 @@ def get_file(
         return {}
     try:
         if type_of_file.lstrip(".") in {"yml", "yaml"}:
+            if not keep_order:
+                # the safe loader loads `simple: =` as is
+                return yaml_safe_load.load(file_content)
             replaced = StringIO(
                 re.sub(r"(simple: \s*\n*)(=)(\s*\n)", r'\1"\2"\3', file_content)
             )
-            return yaml.load(replaced) if keep_order else yaml_safe_load.load(replaced)
+            return yaml.load(replaced)
         elif type_of_file.lstrip(".") in {"svg"}:
             return ET.fromstring(file_content)
         else:
@@ -1716,7 +1740,7 @@ def get_dict_from_file(
     return {}, None
 
 
-@lru_cache
+@lru_cache(maxsize=FIND_TYPE_CACHE_SIZE)
 def find_type_by_path(path: Union[str, Path] = "") -> Optional[FileType]:
     """Find FileType value of a path, without accessing the file.
     This function is here as we want to implement lru_cache and we can do it on `find_type`
@@ -1920,6 +1944,77 @@ def find_type(
     Returns:
         FileType | None: Enum representation of the content file type, None otherwise.
     """
+    type_by_path = find_type_by_path(path)
+    if type_by_path:
+        return type_by_path
+    if _dict or file_type:
+        return _find_type_by_content(path, _dict, file_type, ignore_sub_categories)
+
+    if clear_cache:
+        _find_type_of_file.cache_clear()
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        # files which are not found here are looked up under the content path by get_file, and are not cached
+        return _find_type_by_file(
+            path, ignore_sub_categories, ignore_invalid_schema_file, clear_cache
+        )
+    return _find_type_of_file(
+        path,
+        stat.st_mtime_ns,
+        stat.st_size,
+        ignore_sub_categories,
+        ignore_invalid_schema_file,
+        clear_cache,
+    )
+
+
+@lru_cache(maxsize=FIND_TYPE_CACHE_SIZE)
+def _find_type_of_file(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    ignore_sub_categories: bool,
+    ignore_invalid_schema_file: bool,
+    clear_cache: bool,
+) -> Optional[FileType]:
+    """
+    Finds the type of a file by its contents.
+    Cached by the modification time and size of the file, so a file is read and classified again only once it changes.
+    """
+    return _find_type_by_file(
+        path, ignore_sub_categories, ignore_invalid_schema_file, clear_cache
+    )
+
+
+def _find_type_by_file(
+    path: str,
+    ignore_sub_categories: bool,
+    ignore_invalid_schema_file: bool,
+    clear_cache: bool,
+) -> Optional[FileType]:
+    try:
+        _dict, file_type = get_dict_from_file(
+            path, clear_cache=clear_cache, keep_order=False
+        )
+    except FileNotFoundError:
+        # unable to find the file - hence can't identify it
+        return None
+    except ValueError as err:
+        if ignore_invalid_schema_file:
+            # invalid file schema
+            logger.debug(str(err))
+            return None
+        raise err
+    return _find_type_by_content(path, _dict, file_type, ignore_sub_categories)
+
+
+def _find_type_by_content(
+    path: str,
+    _dict,
+    file_type: Optional[str],
+    ignore_sub_categories: bool,
+) -> Optional[FileType]:
     from demisto_sdk.commands.content_graph.objects import (
         AgentixAction,
         AgentixAgent,
@@ -1961,24 +2056,7 @@ def find_type(
     )
     from demisto_sdk.commands.content_graph.objects import List as ListObject
 
-    type_by_path = find_type_by_path(path)
-    if type_by_path:
-        return type_by_path
-    try:
-        if not _dict and not file_type:
-            _dict, file_type = get_dict_from_file(
-                path, clear_cache=clear_cache, keep_order=False
-            )
-
-    except FileNotFoundError:
-        # unable to find the file - hence can't identify it
-        return None
-    except ValueError as err:
-        if ignore_invalid_schema_file:
-            # invalid file schema
-            logger.debug(str(err))
-            return None
-        raise err
+    file_path = Path(path)
 
     if (file_type == "yml" or path.lower().endswith(".yml")) and path.lower().endswith(
         "_unified.yml"
@@ -1993,51 +2071,51 @@ def find_type(
     ):
         return FileType.BETA_INTEGRATION
 
-    if Integration.match(_dict, Path(path)):
+    if Integration.match(_dict, file_path):
         return FileType.INTEGRATION
 
-    if TestScript.match(_dict, Path(path)) and not ignore_sub_categories:
+    if TestScript.match(_dict, file_path) and not ignore_sub_categories:
         return FileType.TEST_SCRIPT
 
-    if Script.match(_dict, Path(path)):
+    if Script.match(_dict, file_path):
         return FileType.SCRIPT
 
-    if TestPlaybook.match(_dict, Path(path)):
+    if TestPlaybook.match(_dict, file_path):
         return FileType.TEST_PLAYBOOK
 
-    if Playbook.match(_dict, Path(path)):
+    if Playbook.match(_dict, file_path):
         return FileType.PLAYBOOK
 
-    if ParsingRule.match(_dict, Path(path)):
+    if ParsingRule.match(_dict, file_path):
         return FileType.PARSING_RULE
 
-    if MODELING_RULES_DIR in Path(path).parts:
-        if ModelingRule.match(_dict, Path(path)):
+    if MODELING_RULES_DIR in file_path.parts:
+        if ModelingRule.match(_dict, file_path):
             return FileType.MODELING_RULE
 
-    if CorrelationRule.match(_dict, Path(path)):
+    if CorrelationRule.match(_dict, file_path):
         return FileType.CORRELATION_RULE
 
     if (file_type == "json" or path.lower().endswith(".json")) and (
-        path.lower().endswith("_schema.json") and MODELING_RULES_DIR in Path(path).parts
+        path.lower().endswith("_schema.json") and MODELING_RULES_DIR in file_path.parts
     ):
         return FileType.MODELING_RULE_SCHEMA
 
-    if Widget.match(_dict, Path(path)):
+    if Widget.match(_dict, file_path):
         return FileType.WIDGET
 
-    if Report.match(_dict, Path(path)):
+    if Report.match(_dict, file_path):
         return FileType.REPORT
 
-    if GenericType.match(_dict, Path(path)):
+    if GenericType.match(_dict, file_path):
         return FileType.GENERIC_TYPE
 
-    if IncidentType.match(_dict, Path(path)):
+    if IncidentType.match(_dict, file_path):
         return FileType.INCIDENT_TYPE
 
     # 'regex' key can be found in new reputations files while 'reputations' key is for the old reputations
     # located in reputations.json file.
-    if IndicatorType.match(_dict, Path(path)):
+    if IndicatorType.match(_dict, file_path):
         return FileType.REPUTATION
 
     if (
@@ -2047,88 +2125,88 @@ def find_type(
     ):
         return FileType.OLD_CLASSIFIER
 
-    if Classifier.match(_dict, Path(path)):
+    if Classifier.match(_dict, file_path):
         return FileType.CLASSIFIER
 
-    if Mapper.match(_dict, Path(path)):
+    if Mapper.match(_dict, file_path):
         return FileType.MAPPER
 
     if (
         ("layout" in _dict or "kind" in _dict)
         and ("kind" in _dict or "typeId" in _dict)
-        and Path(path).suffix == ".json"
+        and file_path.suffix == ".json"
     ):
         return FileType.LAYOUT
 
     if isinstance(_dict, dict) and LAYOUT_CONTAINER_FIELDS.intersection(_dict):
-        if Layout.match(_dict, Path(path)):
+        if Layout.match(_dict, file_path):
             return FileType.LAYOUTS_CONTAINER
 
-    if Dashboard.match(_dict, Path(path)):
+    if Dashboard.match(_dict, file_path):
         return FileType.DASHBOARD
 
-    if PreProcessRule.match(_dict, Path(path)):
+    if PreProcessRule.match(_dict, file_path):
         return FileType.PRE_PROCESS_RULES
 
-    if GenericModule.match(_dict, Path(path)):
+    if GenericModule.match(_dict, file_path):
         return FileType.GENERIC_MODULE
 
-    if GenericDefinition.match(_dict, Path(path)):
+    if GenericDefinition.match(_dict, file_path):
         return FileType.GENERIC_DEFINITION
 
-    if Job.match(_dict, Path(path)):
+    if Job.match(_dict, file_path):
         return FileType.JOB
 
-    if Wizard.match(_dict, Path(path)):
+    if Wizard.match(_dict, file_path):
         return FileType.WIZARD
 
-    if XSIAMDashboard.match(_dict, Path(path)):
+    if XSIAMDashboard.match(_dict, file_path):
         return FileType.XSIAM_DASHBOARD
 
-    if XSIAMReport.match(_dict, Path(path)):
+    if XSIAMReport.match(_dict, file_path):
         return FileType.XSIAM_REPORT
 
-    if Trigger.match(_dict, Path(path)):
+    if Trigger.match(_dict, file_path):
         return FileType.TRIGGER
 
-    if XDRCTemplate.match(_dict, Path(path)):
+    if XDRCTemplate.match(_dict, file_path):
         return FileType.XDRC_TEMPLATE
 
-    if LayoutRule.match(_dict, Path(path)):
+    if LayoutRule.match(_dict, file_path):
         return FileType.LAYOUT_RULE
 
-    if CaseField.match(_dict, Path(path)):
+    if CaseField.match(_dict, file_path):
         return FileType.CASE_FIELD
 
-    if CaseLayout.match(_dict, Path(path)):
+    if CaseLayout.match(_dict, file_path):
         return FileType.CASE_LAYOUT
 
-    if CaseLayoutRule.match(_dict, Path(path)):
+    if CaseLayoutRule.match(_dict, file_path):
         return FileType.CASE_LAYOUT_RULE
 
-    if ListObject.match(_dict, Path(path)):
+    if ListObject.match(_dict, file_path):
         return FileType.LISTS
 
     # When using it for all files validation- sometimes 'id' can be integer
-    if GenericField.match(_dict, Path(path)):
+    if GenericField.match(_dict, file_path):
         return FileType.GENERIC_FIELD
 
-    if IncidentField.match(_dict, Path(path)):
+    if IncidentField.match(_dict, file_path):
         return FileType.INCIDENT_FIELD
 
-    if IndicatorField.match(_dict, Path(path)):
+    if IndicatorField.match(_dict, file_path):
         return FileType.INDICATOR_FIELD
 
-    if AgentixAgent.match(_dict, Path(path)):
+    if AgentixAgent.match(_dict, file_path):
         return FileType.AGENTIX_AGENT
 
-    if AgentixAction.match(_dict, Path(path)):
+    if AgentixAction.match(_dict, file_path):
         return FileType.AGENTIX_ACTION
 
-    if AgentixSkill.match(_dict, Path(path)):
+    if AgentixSkill.match(_dict, file_path):
         return FileType.AGENTIX_SKILL
 
-    if Collection.match(_dict, Path(path)):
+    if Collection.match(_dict, file_path):
         return FileType.COLLECTION
 
     return None
@@ -0,0 +1,251 @@
+"""
+Lightweight tracing of the SDK phases, exported as a Chrome trace (chrome://tracing, https://ui.perfetto.dev).
+
+Tracing is enabled by setting the `DEMISTO_SDK_TRACE` environment variable to the path of the trace file to write.
+The code is instrumented with nested spans, each with a name and attributes:
+
+    with span("parse.pack", pack=pack_path.name):
+        ...
+
+    @traced("graph.create_nodes")
+    def create_nodes(...):
+        ...
+
+When tracing is disabled, `span` returns a shared no-op context manager, so an instrumented hot path costs a
+function call.
+
+The process which enabled tracing (the first to import this module with the environment variable set) owns the
+trace. Every other process (multiprocessing workers, forked or spawned, and SDK subprocesses inheriting the
+environment) appends its events to a part file of its own whenever its outermost span ends, and the owner merges
+the parts into the trace file and logs a summary table of the spans on exit.
+"""
+
+import atexit
+import os
+import shutil
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from demisto_sdk.commands.common.constants import DEMISTO_SDK_TRACE
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.timers import MeasureType, write_measure_to_logger
+
+# The pid of the process owning the trace, inherited by the processes it starts.
+DEMISTO_SDK_TRACE_OWNER_PID = "DEMISTO_SDK_TRACE_OWNER_PID"
+
+_NO_SPAN = nullcontext()
+
+_trace_path: Optional[Path] = None
+_events: List[Dict[str, Any]] = []
+_local = threading.local()
+
+
+def is_tracing() -> bool:
+    return _trace_path is not None
+
+
+def _parts_dir(trace_path: Path) -> Path:
+    return trace_path.parent / f".{trace_path.name}.parts"
+
+
+def _is_owner() -> bool:
+    return os.environ.get(DEMISTO_SDK_TRACE_OWNER_PID) == str(os.getpid())
+
+
+def start_tracing(trace_path: Path) -> None:
+    """
+    Enables tracing for this process, and for the processes it starts.
+
+    Args:
+        trace_path: The path of the Chrome trace file to write on exit.
+    """
+    global _trace_path
+    _trace_path = Path(trace_path).absolute()
+    _events.clear()
+    _local.depth = 0
+    os.environ[DEMISTO_SDK_TRACE] = str(_trace_path)
+    if not os.environ.get(DEMISTO_SDK_TRACE_OWNER_PID):
+        os.environ[DEMISTO_SDK_TRACE_OWNER_PID] = str(os.getpid())
+    if _is_owner():
+        shutil.rmtree(_parts_dir(_trace_path), ignore_errors=True)
+        atexit.register(export_trace)
+
+
+def stop_tracing() -> None:
+    """Disables tracing, dropping the events which were not exported."""
+    global _trace_path
+    if _is_owner():
+        atexit.unregister(export_trace)
+        os.environ.pop(DEMISTO_SDK_TRACE_OWNER_PID, None)
+    if _trace_path:
+        shutil.rmtree(_parts_dir(_trace_path), ignore_errors=True)
+    os.environ.pop(DEMISTO_SDK_TRACE, None)
+    _trace_path = None
+    _events.clear()
+
+
+def _reset_after_fork() -> None:
+    # The child starts with a copy of the parent's buffer, whose events belong to the parent.
+    _events.clear()
+    _local.depth = 0
+
+
+def _flush_to_part_file() -> None:
+    if not _trace_path or not _events:
+        return
+    parts_dir = _parts_dir(_trace_path)
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    events = _events[:]
+    _events.clear()
+    with open(parts_dir / f"{os.getpid()}.jsonl", "a") as part_file:
+        part_file.writelines(f"{json.dumps(event)}\n" for event in events)
+
+
+def _add_event(name: str, start: int, end: int, attributes: Dict[str, Any]) -> None:
+    _events.append(
+        {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": start / 1000,
+            "dur": (end - start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {key: str(value) for key, value in attributes.items()},
+        }
+    )
+
+
+@contextmanager
+def _span(name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+    depth = getattr(_local, "depth", 0)
+    _local.depth = depth + 1
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _add_event(name, start, time.perf_counter_ns(), attributes)
+        _local.depth = depth
+        if not depth and not _is_owner():
+            _flush_to_part_file()
+
+
+def span(name: str, **attributes):
+    """
+    A context manager measuring its block as a span of the trace.
+
+    Args:
+        name: The name of the span, prefixed by its phase (e.g. `dump.pack`), which is used as the trace category.
+        attributes: Attributes of the span, shown as its args in the trace.
+    """
+    if _trace_path is None:
+        return _NO_SPAN
+    return _span(name, attributes)
+
+
+def traced(name: Optional[str] = None):
+    """
+    Decorates a function to measure each of its calls as a span.
+
+    Args:
+        name: The name of the span (default: the qualified name of the function).
+    """
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _read_part_files(parts_dir: Path) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = []
+    for part_file in sorted(parts_dir.glob("*.jsonl")):
+        with open(part_file) as part:
+            events.extend(json.loads(line) for line in part if line.strip())
+    return events
+
+
+def summarize(events: List[Dict[str, Any]]) -> List[List[str]]:
+    """
+    Summarizes the spans of a trace by their name, sorted by their total duration.
+
+    Returns:
+        The rows of the summary table: name, average seconds, total seconds, max seconds and count.
+    """
+    durations: Dict[str, List[float]] = defaultdict(list)
+    for event in events:
+        if event.get("ph") == "X":
+            durations[event["name"]].append(event["dur"] / 1_000_000)
+    return [
+        [
+            name,
+            f"{sum(seconds) / len(seconds):.3f}",
+            f"{sum(seconds):.3f}",
+            f"{max(seconds):.3f}",
+            str(len(seconds)),
+        ]
+        for name, seconds in sorted(
+            durations.items(), key=lambda item: sum(item[1]), reverse=True
+        )
+    ]
+
+
+def export_trace() -> Optional[Path]:
+    """
+    Writes the events of this process and of the part files of the other processes to the trace file,
+    and logs the summary table of the spans.
+
+    Returns:
+        The path of the trace file, or None if tracing is disabled.
+    """
+    if _trace_path is None:
+        return None
+    parts_dir = _parts_dir(_trace_path)
+    events = _read_part_files(parts_dir) + _events
+    _events.clear()
+    processes = {event["pid"] for event in events}
+    metadata = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "main" if pid == os.getpid() else f"worker-{pid}"},
+        }
+        for pid in sorted(processes)
+    ]
+    try:
+        _trace_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(_trace_path, "w") as trace_file:
+            json.dump(
+                {"traceEvents": metadata + events, "displayTimeUnit": "ms"},
+                trace_file,
+            )
+    except OSError as e:
+        logger.error(f"Could not write the trace to {_trace_path}: {e}")
+        return None
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    write_measure_to_logger(
+        "trace spans", summarize(events), measure_type=MeasureType.SPANS
+    )
+    logger.info(f"Wrote the trace of {len(processes)} processes to {_trace_path}")
+    return _trace_path
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+if env_trace_path := os.environ.get(DEMISTO_SDK_TRACE):
+    start_tracing(Path(env_trace_path))
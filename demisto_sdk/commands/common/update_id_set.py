@@ -13,7 +13,6 @@ from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
 import click
-import networkx
 from packaging.version import Version
 
 from demisto_sdk.commands.common.constants import (
@@ -59,6 +58,7 @@ from demisto_sdk.commands.common.content_constant_paths import (
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.playbook_tasks_graph import PlaybookTasksGraph
 from demisto_sdk.commands.common.tools import (
     find_type,
     get_current_repo,
@@ -375,63 +375,8 @@ def should_skip_item_by_mp(
     return False
 
 
-def build_tasks_graph(playbook_data):
-    """
-    Builds tasks flow graph.
-
-    Args:
-        playbook_data (dict): playbook yml data.
-
-    Returns:
-        DiGraph: all tasks of given playbook.
-    """
-    initial_task = playbook_data.get("starttaskid", "")
-    tasks = playbook_data.get("tasks", {})
-
-    graph = networkx.DiGraph()
-    graph.add_node(
-        initial_task, mandatory=True
-    )  # add starting task as root of the direct graph
-
-    found_new_tasks = True
-    while found_new_tasks:
-        current_number_of_nodes = graph.number_of_nodes()
-        leaf_nodes = {node for node in graph.nodes() if graph.out_degree(node) == 0}
-
-        for leaf in leaf_nodes:
-            leaf_task = tasks.get(leaf)
-            leaf_mandatory = graph.nodes[leaf]["mandatory"]
-
-            # In this case the playbook is invalid, starttaskid contains invalid task id.
-            if not leaf_task:
-                continue
-
-            leaf_next_tasks = sum(leaf_task.get("nexttasks", {}).values(), [])  # type: ignore
-
-            for task_id in leaf_next_tasks:
-                task = tasks.get(task_id)
-                if not task:
-                    continue
-
-                # If task can't be skipped and predecessor task is mandatory - set as mandatory.
-                mandatory = leaf_mandatory and not task.get("skipunavailable", False)
-                if task_id not in graph.nodes():
-                    graph.add_node(task_id, mandatory=mandatory)
-                else:
-                    # If task already in graph, update mandatory field.
-                    # If one of the paths to the task is mandatory - set as mandatory.
-                    graph.nodes[task_id]["mandatory"] = (
-                        graph.nodes[task_id]["mandatory"] or mandatory
-                    )
-                graph.add_edge(leaf, task_id)
-
-        found_new_tasks = graph.number_of_nodes() > current_number_of_nodes
-
-    return graph
-
-
 def get_lists_names_from_playbook(
-    data_dictionary: dict, graph: networkx.DiGraph
+    data_dictionary: dict, graph: PlaybookTasksGraph
 ) -> tuple:
     lists_names = set()
     lists_names_skippable = set()
@@ -445,7 +390,7 @@ def get_lists_names_from_playbook(
             )
 
             try:
-                skippable = not graph.nodes[task_id]["mandatory"]
+                skippable = not graph.is_mandatory(task_id)
             except KeyError:
                 # if task id not in the graph - the task is unreachable.
                 logger.info(
@@ -461,7 +406,7 @@ def get_lists_names_from_playbook(
 
 
 def get_task_ids_from_playbook(
-    param_to_enrich_by: str, data_dict: dict, graph: networkx.DiGraph
+    param_to_enrich_by: str, data_dict: dict, graph: PlaybookTasksGraph
 ) -> tuple:
     implementing_ids = set()
     implementing_ids_skippable = set()
@@ -472,7 +417,7 @@ def get_task_ids_from_playbook(
 
         enriched_id = task_details.get(param_to_enrich_by)
         try:
-            skippable = not graph.nodes[task_id]["mandatory"]
+            skippable = not graph.is_mandatory(task_id)
         except KeyError:
             # if task id not in the graph - the task is unreachable.
             logger.info(
@@ -807,7 +752,7 @@ def get_dependent_incident_and_indicator_fields(data_dictionary):
 
 def get_playbook_data(file_path: str, packs: Dict[str, Dict] = None) -> dict:
     data_dictionary = get_yaml(file_path)
-    graph = build_tasks_graph(data_dictionary)
+    graph = PlaybookTasksGraph.from_playbook_data(data_dictionary)
 
     id_ = data_dictionary.get("id", "-")
     name = data_dictionary.get("name", "-")
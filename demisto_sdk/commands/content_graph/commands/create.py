@@ -33,6 +33,8 @@ def create_content_graph(
     dependencies: bool = True,
     output_path: Optional[Path] = None,
     private_content_path: Optional[Path] = None,
+    bulk_import: bool = False,
+    private_content_synced: bool = False,
 ) -> None:
     """This function creates a new content graph database in neo4j from the content path
 
@@ -43,6 +45,9 @@ def create_content_graph(
         output_path (Path): The path to export the graph zip to.
         private_content_path (Path): Path to the private content repository. When provided,
             private content packs will be temporarily copied to the content repository.
+        bulk_import (bool): Whether to bulk load the nodes and relationships from files instead of transactions.
+        private_content_synced (bool): Whether the private content was already synced to the content repository
+            by the caller (e.g. an update which falls back to creating the graph).
     """
     # If private content path is provided, wrap the entire create in PrivateContentManager
     if private_content_path:
@@ -59,6 +64,8 @@ def create_content_graph(
                 marketplace=marketplace,
                 dependencies=dependencies,
                 output_path=output_path,
+                bulk_import=bulk_import,
+                private_content=True,
             )
         return
 
@@ -67,6 +74,8 @@ def create_content_graph(
         marketplace=marketplace,
         dependencies=dependencies,
         output_path=output_path,
+        bulk_import=bulk_import,
+        private_content=private_content_synced,
     )
 
 
@@ -75,13 +84,15 @@ def _create_content_graph_inner(
     marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
     dependencies: bool = True,
     output_path: Optional[Path] = None,
+    bulk_import: bool = False,
+    private_content: bool = False,
 ) -> None:
     """Internal function that performs the actual graph creation logic.
 
     This is separated from create_content_graph to allow wrapping with PrivateContentManager
     when private_content_path is provided.
     """
-    builder = ContentGraphBuilder(content_graph_interface)
+    builder = ContentGraphBuilder(content_graph_interface, bulk_import=bulk_import)
     builder.init_database()
     builder.create_graph()
     if dependencies:
@@ -89,6 +100,7 @@ def _create_content_graph_inner(
     content_graph_interface.export_graph(
         output_path, override_commit=True, marketplace=marketplace
     )
+    content_graph_interface.record_snapshot(dependencies, private_content)
     logger.info(
         f"Successfully created the content graph. UI representation "
         f"is available at {NEO4J_DATABASE_HTTP} "
@@ -139,6 +151,13 @@ def create(
         resolve_path=True,
         help="Path to the private content repository.",
     ),
+    bulk_import: bool = typer.Option(
+        False,
+        "--bulk-import",
+        is_flag=True,
+        help="Experimental. Whether to load the nodes and relationships into the new graph in bulk, from files "
+        "written to the neo4j import directory, instead of creating them in transactions.",
+    ),
     console_log_threshold: str = typer.Option(
         "INFO",
         "-clt",
@@ -176,6 +195,7 @@ def create(
             dependencies=not no_dependencies,
             output_path=output_path,
             private_content_path=private_content_path,
+            bulk_import=bulk_import,
         )
 
 
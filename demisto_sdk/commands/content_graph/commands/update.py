@@ -240,6 +240,7 @@ def update_content_graph(
                 dependencies=dependencies,
                 output_path=output_path,
                 create_graph_from_scratch=create_graph_from_scratch,
+                private_content=True,
             )
         return
 
@@ -266,6 +267,7 @@ def _update_content_graph_inner(
     dependencies: bool = True,
     output_path: Optional[Path] = None,
     create_graph_from_scratch: bool = False,
+    private_content: bool = False,
 ) -> None:
     """Internal function that performs the actual graph update logic.
 
@@ -278,7 +280,11 @@ def _update_content_graph_inner(
     if string_to_bool(force_create_graph, False) or create_graph_from_scratch:
         logger.info("Will create a new graph from scratch")
         create_content_graph(
-            content_graph_interface, marketplace, dependencies, output_path
+            content_graph_interface,
+            marketplace,
+            dependencies,
+            output_path,
+            private_content_synced=private_content,
         )
         return
 
@@ -338,6 +344,26 @@ def _update_content_graph_inner(
                     connectors_to_update.extend(env_connector_ids)
                     explicit_changes_provided = True
 
+    if (
+        not imported_path
+        and not explicit_changes_provided
+        and not is_external_repo
+        and content_graph_interface.is_up_to_date_with_snapshot(
+            dependencies, private_content
+        )
+    ):
+        # The graph was already built from this exact commit and working tree (e.g. by a previous command
+        # in the same CI job), so diffing git, reparsing packs and recreating dependencies is redundant.
+        logger.info(
+            "Content graph matches the current snapshot, skipping the update. "
+            f"UI representation is available at {NEO4J_DATABASE_HTTP} (username: {NEO4J_USERNAME}, password: {NEO4J_PASSWORD})"
+        )
+        if output_path:
+            output_path = output_path / marketplace.value
+            logger.info(f"Saving content graph in {output_path}.zip")
+            content_graph_interface.zip_import_dir(output_path)
+        return
+
     builder = ContentGraphBuilder(content_graph_interface)
     if not should_update_graph(
         content_graph_interface,
@@ -382,7 +408,11 @@ def _update_content_graph_inner(
                     "Importing graph from bucket failed. Creating from scratch"
                 )
                 create_content_graph(
-                    content_graph_interface, marketplace, dependencies, output_path
+                    content_graph_interface,
+                    marketplace,
+                    dependencies,
+                    output_path,
+                    private_content_synced=private_content,
                 )
                 return
     # Compute changed packs/connectors via git-diff now that the graph has
@@ -405,7 +435,11 @@ def _update_content_graph_inner(
                 f"Failed to get changed packs from git. Creating from scratch. Error: {e}"
             )
             create_content_graph(
-                content_graph_interface, marketplace, dependencies, output_path
+                content_graph_interface,
+                marketplace,
+                dependencies,
+                output_path,
+                private_content_synced=private_content,
             )
             return
         packs_to_update.extend(changed_pack_ids)
@@ -444,6 +478,9 @@ def _update_content_graph_inner(
     content_graph_interface.export_graph(
         output_path, override_commit=use_git, marketplace=marketplace
     )
+    if use_git:
+        # the graph now reflects the current commit and working tree
+        content_graph_interface.record_snapshot(dependencies, private_content)
     logger.info(
         f"Successfully updated the content graph. UI representation is available at {NEO4J_DATABASE_HTTP} "
         f"(username: {NEO4J_USERNAME}, password: {NEO4J_PASSWORD})"
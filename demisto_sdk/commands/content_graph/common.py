@@ -1,10 +1,27 @@
+import inspect
 import os
 import re
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from neo4j import graph
-from pydantic import BaseModel
+from pydantic import BaseModel, Extra
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
 from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedScalarString is OK
     FoldedScalarString,
 )
@@ -12,6 +29,7 @@ from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedSc
 from demisto_sdk.commands.common.constants import (
     DEMISTO_SDK_NEO4J_DATABASE_HTTP,
     DEMISTO_SDK_NEO4J_DATABASE_URL,
+    DEMISTO_SDK_NEO4J_EXPORT_FORMAT,
     DEMISTO_SDK_NEO4J_PASSWORD,
     DEMISTO_SDK_NEO4J_USERNAME,
     PACKS_FOLDER,
@@ -36,6 +54,16 @@ NEO4J_DATABASE_URL = os.getenv(DEMISTO_SDK_NEO4J_DATABASE_URL, "neo4j://127.0.0.
 NEO4J_USERNAME = os.getenv(DEMISTO_SDK_NEO4J_USERNAME, "neo4j")
 NEO4J_PASSWORD = os.getenv(DEMISTO_SDK_NEO4J_PASSWORD, "contentgraph")
 
+
+class GraphExportFormat(StrEnum):
+    GRAPHML = "graphml"
+    JSON_LINES = "jsonl"  # gzip compressed JSON lines (experimental)
+
+
+NEO4J_EXPORT_FORMAT = os.getenv(
+    DEMISTO_SDK_NEO4J_EXPORT_FORMAT, GraphExportFormat.GRAPHML
+)
+
 PACK_METADATA_FILENAME = "pack_metadata.json"
 VERSION_CONFIG_FILENAME = "version_config.json"
 PACK_CONTRIBUTORS_FILENAME = "CONTRIBUTORS.json"
@@ -43,6 +71,9 @@ UNIFIED_FILES_SUFFIXES = [".yml", ".json"]
 
 SERVER_CONTENT_ITEMS_PATH = Path("Tests/Marketplace/server_content_items.json")
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+_MISSING = object()
+
 
 class Neo4jRelationshipResult(NamedTuple):
     node_from: graph.Node
@@ -538,6 +569,120 @@ def lazy_property(property_func: Callable):
     return LazyProperty(_lazy_decorator)
 
 
+TRUSTED_FIELD_TYPES = (str, bool, int, float)
+
+
+class TrustedConstructionPlan(NamedTuple):
+    trusted_fields: FrozenSet[str]
+    validated_fields: Tuple[ModelField, ...]
+    instance_fields: FrozenSet[str]
+
+
+@lru_cache(maxsize=None)
+def _get_trusted_construction_plan(
+    model: Type[BaseModel],
+) -> Optional[TrustedConstructionPlan]:
+    """Splits the model fields into the fields which are assigned as-is by `construct_trusted`
+    (primitive types or lists of them, without aliases or validators) and the fields which are validated.
+    Validated model and enum fields without validators are also assigned as-is when given an instance of their type.
+
+    Returns None if the model cannot be constructed field by field (custom __init__, root validators or
+    forbidden extra fields) and must be fully parsed with `parse_obj`.
+    """
+    if (
+        model.__init__ is not BaseModel.__init__  # type: ignore[misc]
+        or model.__pre_root_validators__
+        or model.__post_root_validators__
+        or model.__config__.extra != Extra.ignore
+    ):
+        return None
+    trusted_fields = set()
+    validated_fields = []
+    instance_fields = set()
+    for name, field in model.__fields__.items():
+        has_validators = (
+            field.class_validators or field.pre_validators or field.post_validators
+        )
+        if (
+            field.type_ in TRUSTED_FIELD_TYPES
+            and field.shape in (SHAPE_SINGLETON, SHAPE_LIST)
+            and field.alias == name
+            and not has_validators
+        ):
+            trusted_fields.add(name)
+            continue
+        validated_fields.append(field)
+        if (
+            field.shape == SHAPE_SINGLETON
+            and inspect.isclass(field.type_)
+            and issubclass(field.type_, (BaseModel, Enum))
+            and not has_validators
+        ):
+            instance_fields.add(name)
+    return TrustedConstructionPlan(
+        frozenset(trusted_fields), tuple(validated_fields), frozenset(instance_fields)
+    )
+
+
+def construct_trusted(model: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """Constructs a model from trusted data, i.e. nodes and relationships which were already validated
+    before they were written to the content graph.
+
+    Primitive fields are assigned as-is, without type checking, as well as model and enum instances
+    (which are not copied, unlike in `parse_obj`). The rest of the fields (nested data, paths and every field
+    with validators) are validated with their pydantic field, in the same order `parse_obj` does.
+    Unknown keys are ignored.
+    If a required field is missing or a field fails validation, falls back to `parse_obj`,
+    which raises the pydantic `ValidationError`.
+
+    Args:
+        model (Type[BaseModel]): The model to construct.
+        data (Dict[str, Any]): The model data.
+
+    Returns:
+        BaseModel: The model instance.
+    """
+    plan = _get_trusted_construction_plan(model)
+    if plan is None:
+        return model.parse_obj(data)
+
+    config = model.__config__
+    fields_set = set(plan.trusted_fields & data.keys())
+    values = {name: data[name] for name in fields_set}
+    for name in plan.trusted_fields - fields_set:
+        field = model.__fields__[name]
+        if field.required:
+            return model.parse_obj(data)
+        values[name] = field.get_default()
+
+    for field in plan.validated_fields:
+        value = data.get(field.alias, _MISSING)
+        if value is _MISSING and config.allow_population_by_field_name:
+            value = data.get(field.name, _MISSING)
+        if value is _MISSING:
+            if field.required:
+                return model.parse_obj(data)
+            value = field.get_default()
+            if not field.validate_always and not config.validate_all:
+                values[field.name] = value
+                continue
+        else:
+            fields_set.add(field.name)
+            if field.name in plan.instance_fields and isinstance(value, field.type_):
+                values[field.name] = value
+                continue
+        value, errors = field.validate(value, values, loc=field.alias, cls=model)  # type: ignore[arg-type]
+        if errors:
+            return model.parse_obj(data)
+        values[field.name] = value
+
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__fields_set__", fields_set)
+    obj._init_private_attributes()
+    return obj
+
+
 def get_server_content_items(tag: Optional[str] = None) -> Dict[ContentType, list]:
     """Reads a JSON file containing server content items from content repository
     and returns a dict representation of it in the required format.
@@ -619,6 +764,29 @@ CONTENT_PRIVATE_ITEMS: dict = {
 }
 
 
+# The marketplaces in which "Cortex XSOAR" references are replaced, see `replace_marketplace_references`.
+MARKETPLACES_REPLACING_XSOAR_REFERENCES = {
+    MarketplaceVersions.MarketplaceV2,
+    MarketplaceVersions.XPANSE,
+    MarketplaceVersions.PLATFORM,
+}
+XSOAR_REFERENCE = "Cortex XSOAR"
+XSOAR_REFERENCE_PATTERN = re.compile(
+    r"\bCortex XSOAR\b(?![\S]*\/)(?:\s+[\w.]*\d[\w.]*)?(?!(?:.{0,20})https)"
+)
+
+
+def replace_xsoar_references(text: str) -> str:
+    """
+    Replaces the "Cortex XSOAR" references of a single string (see `replace_marketplace_references`).
+    Strings which don't contain "Cortex XSOAR" are not searched with the pattern at all.
+    """
+    if XSOAR_REFERENCE not in text:
+        # as the substitution would, return a plain str also for the (ruamel) str subclasses
+        return str(text)
+    return XSOAR_REFERENCE_PATTERN.sub("Cortex", text)
+
+
 def replace_marketplace_references(
     data: Any, marketplace: MarketplaceVersions, path: str = ""
 ) -> Any:
@@ -635,19 +803,14 @@ def replace_marketplace_references(
     Returns:
         Any: The same data object with replacements made if applicable.
     """
-    pattern = r"\bCortex XSOAR\b(?![\S]*\/)(?:\s+[\w.]*\d[\w.]*)?(?!(?:.{0,20})https)"
     try:
-        if marketplace in {
-            MarketplaceVersions.MarketplaceV2,
-            MarketplaceVersions.XPANSE,
-            MarketplaceVersions.PLATFORM,
-        }:
+        if marketplace in MARKETPLACES_REPLACING_XSOAR_REFERENCES:
             if isinstance(data, dict):
                 keys_to_update = {}
                 for key, value in data.items():
                     # Process the key
                     new_key = (
-                        re.sub(pattern, "Cortex", key) if isinstance(key, str) else key
+                        replace_xsoar_references(key) if isinstance(key, str) else key
                     )
                     if new_key != key:
                         keys_to_update[key] = new_key
@@ -661,9 +824,9 @@ def replace_marketplace_references(
                     data[i] = replace_marketplace_references(data[i], marketplace, path)
             elif isinstance(data, FoldedScalarString):
                 # if data is a FoldedScalarString (yml unification), we need to convert it to a string and back
-                data = FoldedScalarString(re.sub(pattern, "Cortex", str(data)))
+                data = FoldedScalarString(replace_xsoar_references(data))
             elif isinstance(data, str):
-                data = re.sub(pattern, "Cortex", data)
+                data = replace_xsoar_references(data)
     except Exception as e:
         logger.error(
             f"Error processing data for replacing incorrect marketplace at path '{path}': {e}"
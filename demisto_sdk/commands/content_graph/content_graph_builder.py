@@ -1,25 +1,28 @@
 import gc
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
 from demisto_sdk.commands.content_graph.common import Nodes, Relationships
 from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInterface
-from demisto_sdk.commands.content_graph.objects.repository import (
-    ContentDTO,
-)
+from demisto_sdk.commands.content_graph.objects.repository import iter_graph_records
 
 PACKS_PER_BATCH = 600
 
 
 class ContentGraphBuilder:
-    def __init__(self, content_graph: ContentGraphInterface) -> None:
+    def __init__(
+        self, content_graph: ContentGraphInterface, bulk_import: bool = False
+    ) -> None:
         """Given a graph DB interface:
-        1. Creates a repository model
-        2. Collects all nodes and relationships from the model
+        1. Parses the repository
+        2. Collects all nodes and relationships of its packs and connectors
 
         Args:
             content_graph (ContentGraphInterface): The interface to create the graph with.
+            bulk_import (bool): Whether to create a new graph by bulk loading its nodes and relationships from files,
+                instead of creating them in transactions. Graph updates are always done in transactions.
         """
         self.content_graph = content_graph
+        self.bulk_import = bulk_import
         self.nodes: Nodes = Nodes()
         self.relationships: Relationships = Relationships()
 
@@ -37,7 +40,7 @@ class ContentGraphBuilder:
 
         At least one of the two must be non-empty for any work to happen -
         otherwise ``_parse_and_model_content`` would fall through to
-        ``ContentDTO.from_path(None, None)`` and reparse the entire repo,
+        ``iter_graph_records(packs_to_parse=None, connectors_to_parse=None)`` and reparse the entire repo,
         which is both expensive and, when merging an imported graph, would
         duplicate packs that only live in the caller's repo checkout.
         """
@@ -48,28 +51,33 @@ class ContentGraphBuilder:
 
     def init_database(self) -> None:
         self.content_graph.clean_graph()
-        self.content_graph.create_indexes_and_constraints()
+        if not self.bulk_import:
+            # a bulk import creates the indexes and constraints after loading the nodes
+            self.content_graph.create_indexes_and_constraints()
 
     def _parse_and_model_content(
         self,
         packs_to_parse: Optional[Tuple[str, ...]] = None,
         connectors_to_parse: Optional[Tuple[str, ...]] = None,
     ) -> None:
-        # ``connectors`` is passed as a keyword argument so that existing test
-        # mocks of ``_create_content_dto`` that only accept ``(packs)`` keep
-        # working unchanged.
-        content_dto: ContentDTO = self._create_content_dto(
+        # ``connectors`` is passed as a keyword argument so that test mocks of
+        # ``_parse_graph_records`` that only accept ``(packs)`` keep working.
+        for nodes, relationships in self._parse_graph_records(
             packs_to_parse, connectors=connectors_to_parse
-        )
-        self._collect_nodes_and_relationships_from_model(content_dto)
+        ):
+            self.nodes.update(nodes)
+            self.relationships.update(relationships)
 
-    def _create_content_dto(
+    def _parse_graph_records(
         self,
         packs: Optional[Tuple[str, ...]],
         *,
         connectors: Optional[Tuple[str, ...]] = None,
-    ) -> ContentDTO:
-        """Parses the repository, then creates and returns a repository model.
+    ) -> Iterator[Tuple[Nodes, Relationships]]:
+        """Parses the repository, and yields the nodes and relationships of each of its packs and connectors.
+
+        The packs are converted to their nodes and relationships in the parse workers, which stream them back,
+        so the pack parsers and models are neither sent to this process nor kept in it.
 
         Args:
             packs: A list of pack names to parse. If not provided, parses all packs
@@ -78,25 +86,15 @@ class ContentGraphBuilder:
                 parse. Made keyword-only so test mocks with the original
                 single-positional signature (``mock(packs)``) stay compatible.
         """
-        return ContentDTO.from_path(
-            packs_to_parse=packs, connectors_to_parse=connectors
-        )
-
-    def _collect_nodes_and_relationships_from_model(
-        self, content_dto: ContentDTO
-    ) -> None:
-        for pack in content_dto.packs:
-            self.nodes.update(pack.to_nodes())
-            self.relationships.update(pack.relationships)
-        # Connectors are standalone top-level content items (no enclosing Pack),
-        # so we iterate them separately and collect their nodes/relationships
-        # the same way we do for packs.
-        for connector in content_dto.connectors:
-            self.nodes.update(connector.to_nodes())
-            self.relationships.update(connector.relationships)
+        return iter_graph_records(packs_to_parse=packs, connectors_to_parse=connectors)
 
     def create_graph(self) -> None:
         self._parse_and_model_content()
+        if self.bulk_import:
+            self.content_graph.create_graph_in_bulk(self.nodes, self.relationships)
+            gc.collect()
+            self.content_graph.remove_non_repo_items()
+            return
         self._create_or_update_graph()
 
     def _create_or_update_graph(self) -> None:
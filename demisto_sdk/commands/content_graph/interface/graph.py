@@ -3,7 +3,11 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
-from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.constants import (
+    CONNECTORS_FOLDER,
+    PACKS_FOLDER,
+    MarketplaceVersions,
+)
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.logger import logger
@@ -34,7 +38,9 @@ class ContentGraphInterface(ABC):
     repo_path = CONTENT_PATH  # type: ignore
     METADATA_FILE_NAME = "metadata.json"
     DEPENDS_ON_FILE_NAME = "depends_on.json"
+    ALL_LEVEL_RELATIONSHIPS_FILE_NAME = "all_level_relationships.json"
     _depends_on = None
+    _all_level_relationships: Optional[dict] = None
 
     @property
     @abstractmethod
@@ -45,6 +51,15 @@ class ContentGraphInterface(ABC):
     def clean_import_dir(self) -> None:
         pass
 
+    @abstractmethod
+    def get_snapshot(self) -> Optional[Dict[str, Any]]:
+        """The snapshot recorded in the graph (see `record_snapshot`), if any."""
+        pass
+
+    @abstractmethod
+    def save_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        pass
+
     @abstractmethod
     def move_to_import_dir(self, imported_path: Path) -> None:
         pass
@@ -98,12 +113,89 @@ class ContentGraphInterface(ABC):
                 sort_keys=True,
             )
 
+    @property
+    def all_level_relationships(self) -> Optional[dict]:
+        """The all level relationships table computed when the pack dependencies were created,
+        or None if the graph has changed since."""
+        if self._all_level_relationships is None:
+            try:
+                self._all_level_relationships = get_file(
+                    self.import_path / self.ALL_LEVEL_RELATIONSHIPS_FILE_NAME,
+                    raise_on_error=True,
+                )
+            except FileNotFoundError:
+                return None
+        return self._all_level_relationships
+
+    def dump_all_level_relationships(
+        self, all_level_relationships: Optional[dict]
+    ) -> None:
+        """Adds all_level_relationships.json to the graph import dir."""
+        if all_level_relationships:
+            write_dict(
+                self.import_path / self.ALL_LEVEL_RELATIONSHIPS_FILE_NAME,
+                data=all_level_relationships,
+            )
+
+    def clear_all_level_relationships(self) -> None:
+        """Drops the all level relationships table, as it no longer matches the graph."""
+        self._all_level_relationships = None
+        (self.import_path / self.ALL_LEVEL_RELATIONSHIPS_FILE_NAME).unlink(
+            missing_ok=True
+        )
+
     def _get_latest_content_parser_hash(self) -> Optional[str]:
         parsers_path = Path(__file__).parent.parent / "parsers"
         parsers_sha1 = sha1_dir(parsers_path)
         logger.debug(f"Content parser hash: {parsers_sha1}")
         return parsers_sha1
 
+    def _get_snapshot_id(self) -> Optional[str]:
+        """The identity of the content the graph is built from - the current commit and the hash of the
+        uncommitted changes to packs and connectors."""
+        try:
+            git_util = GitUtil()
+            snapshot_id = f"{git_util.get_current_commit_hash()}:{git_util.get_working_tree_hash((PACKS_FOLDER, CONNECTORS_FOLDER))}"
+        except Exception as e:
+            logger.debug(f"Could not compute the content graph snapshot id: {e}")
+            return None
+        logger.debug(f"Content graph snapshot id: {snapshot_id}")
+        return snapshot_id
+
+    def _get_current_snapshot(
+        self, dependencies: bool, private_content: bool
+    ) -> Optional[Dict[str, Any]]:
+        """The snapshot a graph built now with the given flags would be built from, or None if it can not be computed."""
+        if not (snapshot_id := self._get_snapshot_id()):
+            return None
+        return {
+            "snapshot_id": snapshot_id,
+            "content_parser_latest_hash": self._get_latest_content_parser_hash(),
+            "dependencies": dependencies,
+            "private_content": private_content,
+        }
+
+    def record_snapshot(self, dependencies: bool, private_content: bool) -> None:
+        """Records in the graph the snapshot it was built from, once it reflects the current commit and working tree.
+
+        Args:
+            dependencies (bool): Whether the pack dependencies were created.
+            private_content (bool): Whether the private content was synced into the graph.
+        """
+        if snapshot := self._get_current_snapshot(dependencies, private_content):
+            self.save_snapshot(snapshot)
+
+    def is_up_to_date_with_snapshot(
+        self, dependencies: bool, private_content: bool
+    ) -> bool:
+        """Whether the live graph was built from the current commit and working tree, with the current parsers
+        and the same flags.
+
+        When it is, updating the graph would reparse the exact same content, so the update can be skipped.
+        """
+        snapshot = self._get_current_snapshot(dependencies, private_content)
+        return bool(snapshot and self.is_alive() and self.get_snapshot() == snapshot)
+
     def _has_infra_graph_been_changed(self) -> bool:
         if not self.content_parser_latest_hash:
             logger.warning("The content parser hash is missing.")
@@ -133,6 +225,14 @@ class ContentGraphInterface(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    def create_graph_in_bulk(
+        self,
+        nodes: Dict[ContentType, List[Dict[str, Any]]],
+        relationships: Dict[RelationshipType, List[Dict[str, Any]]],
+    ) -> None:
+        pass
+
     @abstractmethod
     def remove_non_repo_items(self) -> None:
         pass
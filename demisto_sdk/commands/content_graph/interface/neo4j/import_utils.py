@@ -1,13 +1,17 @@
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 from zipfile import ZipFile
 
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.singleton import SingletonMeta
 from demisto_sdk.commands.content_graph.neo4j_service import get_neo4j_import_path
 
 GRAPHML_FILE_SUFFIX = ".graphml"
+JSON_LINES_FILE_SUFFIX = ".jsonl.gz"
+BULK_IMPORT_FILE_PREFIX = "bulk_"
+BULK_IMPORT_FILE_SUFFIX = ".jsonl"
 
 
 class Neo4jImportHandler(metaclass=SingletonMeta):
@@ -41,6 +45,34 @@ class Neo4jImportHandler(metaclass=SingletonMeta):
             if file.suffix == GRAPHML_FILE_SUFFIX
         ]
 
+    def get_json_lines_filenames(self) -> List[str]:
+        return sorted(
+            file.name
+            for file in self.import_path.iterdir()
+            if file.name.endswith(JSON_LINES_FILE_SUFFIX)
+        )
+
+    def write_bulk_import_file(self, name: str, rows: Iterable[Dict[str, Any]]) -> str:
+        """Writes rows of nodes or relationships data to a JSON lines file in the import dir, for neo4j to load.
+
+        Args:
+            name (str): The name of the file, without its prefix and suffix.
+            rows (Iterable[Dict[str, Any]]): The rows to write.
+
+        Returns:
+            str: The name of the written file in the import dir.
+        """
+        filename = f"{BULK_IMPORT_FILE_PREFIX}{name}{BULK_IMPORT_FILE_SUFFIX}"
+        with open(self.import_path / filename, "w") as bulk_file:
+            bulk_file.writelines(f"{json.dumps(row)}\n" for row in rows)
+        return filename
+
+    def remove_bulk_import_files(self) -> None:
+        for file in self.import_path.glob(
+            f"{BULK_IMPORT_FILE_PREFIX}*{BULK_IMPORT_FILE_SUFFIX}"
+        ):
+            file.unlink()
+
     def ensure_data_uniqueness(self) -> None:
         if len(sources := self._get_import_sources()) > 1:
             for idx, source in enumerate(sources, 1):
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from multiprocessing import Pool
 from pathlib import Path
@@ -12,13 +13,17 @@ from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import download_content_graph
+from demisto_sdk.commands.common.tracing import span
 from demisto_sdk.commands.content_graph.common import (
     NEO4J_DATABASE_URL,
+    NEO4J_EXPORT_FORMAT,
     NEO4J_PASSWORD,
     NEO4J_USERNAME,
     ContentType,
+    GraphExportFormat,
     Neo4jRelationshipResult,
     RelationshipType,
+    construct_trusted,
 )
 from demisto_sdk.commands.content_graph.interface.graph import (
     ContentGraphInterface,
@@ -34,15 +39,29 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.constraints impo
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.dependencies import (
     create_pack_dependencies,
     get_all_level_packs_relationships,
+    get_all_level_relationships_from_table,
+    get_all_level_relationships_table,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.import_export import (
+    bulk_load_nodes,
+    bulk_load_relationships,
+    create_import_id_index,
+    drop_import_id_index,
     export_graphml,
+    export_json_lines,
     import_graphml,
+    import_json_lines,
     merge_duplicate_commands,
+    merge_duplicate_commands_in_batches,
     merge_duplicate_content_items,
+    merge_duplicate_content_items_in_batches,
+    remove_import_ids,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.indexes import (
+    await_indexes,
     create_indexes,
+    drop_indexes,
+    get_index_names,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.nodes import (
     _match,
@@ -63,6 +82,12 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.relationships im
     get_sources_by_path,
     get_targets_by_path,
 )
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.snapshot import (
+    delete_snapshot,
+    get_snapshot,
+    pop_snapshot,
+    save_snapshot,
+)
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.validations import (
     get_agent_budget_dependencies,
     get_agentix_actions_using_content_items,
@@ -95,7 +120,11 @@ from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
 )
 from demisto_sdk.commands.content_graph.objects.pack import Pack
-from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
+from demisto_sdk.commands.content_graph.objects.relationship import (
+    CompactRelationshipsData,
+    RelationshipData,
+    RelationshipsStore,
+)
 from demisto_sdk.commands.content_graph.objects.script import Script
 
 
@@ -111,13 +140,13 @@ def _parse_node(element_id: str, node: dict) -> BaseNode:
     obj: BaseNode
     content_type = node.get("content_type", "")
     if node.get("not_in_repository"):
-        obj = UnknownContent.parse_obj(node)
+        obj = construct_trusted(UnknownContent, node)
 
     else:
         model = CONTENT_TYPE_TO_MODEL.get(content_type)
         if not model:
             raise NoModelException(f"No model for {content_type}")
-        obj = model.parse_obj(node)
+        obj = construct_trusted(model, node)
     obj.database_id = element_id
     return obj
 
@@ -132,6 +161,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
     ) -> None:
         self._import_handler = Neo4jImportHandler()
         self._id_to_obj: Dict[str, BaseNode] = {}
+        self._relationships_store = RelationshipsStore()
 
         if not self.is_alive():
             neo4j_service.start()
@@ -165,6 +195,14 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
     def move_to_import_dir(self, imported_path: Path) -> None:
         return self._import_handler.extract_files_from_path(imported_path)
 
+    def get_snapshot(self) -> Optional[Dict[str, Any]]:
+        with self.driver.session() as session:
+            return session.execute_read(get_snapshot)
+
+    def save_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        with self.driver.session() as session:
+            session.execute_write(save_snapshot, snapshot)
+
     def close(self) -> None:
         self.driver.close()
 
@@ -233,15 +271,19 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         for node_to, rel in zip(nodes_to, relationships):
             if not rel.start_node or not rel.end_node:
                 raise ValueError("Relationships must have start and end nodes")
+            relationship_type = RelationshipType(rel.type)
             obj.add_relationship(
-                RelationshipType(rel.type),
-                RelationshipData(
-                    relationship_type=rel.type,
-                    source_id=rel.start_node.element_id,
-                    target_id=rel.end_node.element_id,
-                    content_item_to=self._id_to_obj[node_to.element_id],
-                    is_direct=True,
-                    **rel,
+                relationship_type,
+                construct_trusted(
+                    RelationshipData,
+                    dict(
+                        rel,
+                        relationship_type=relationship_type,
+                        source_id=rel.start_node.element_id,
+                        target_id=rel.end_node.element_id,
+                        content_item_to=self._id_to_obj[node_to.element_id],
+                        is_direct=True,
+                    ),
                 ),
             )
 
@@ -259,13 +301,32 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             marketplace (MarketplaceVersions): Marketplace version to check for dependencies
             pack_nodes (List[graph.Node]): List of the pack nodes
         """
-        relationships: Dict[str, Neo4jRelationshipResult] = session.execute_read(
-            get_all_level_packs_relationships,
-            relationship_type,
-            node_ids,
-            marketplace,
-            True,
-        )
+        relationships: Dict[str, Neo4jRelationshipResult] = {}
+        table = self._get_all_level_relationships_table(relationship_type, marketplace)
+        if table is not None:
+            # nodes without a node id (e.g. unknown content) are not in the table
+            ids_to_targets = {}
+            node_ids_to_query = []
+            for node_id in node_ids:
+                if key := self._id_to_obj[node_id].node_id:
+                    if targets := table.get(key):
+                        ids_to_targets[node_id] = targets
+                else:
+                    node_ids_to_query.append(node_id)
+            relationships = session.execute_read(
+                get_all_level_relationships_from_table, ids_to_targets
+            )
+            node_ids = node_ids_to_query
+        if node_ids:
+            relationships.update(
+                session.execute_read(
+                    get_all_level_packs_relationships,
+                    relationship_type,
+                    node_ids,
+                    marketplace,
+                    True,
+                )
+            )
         nodes_to = []
         for content_item_relationship in relationships.values():
             nodes_to.extend(content_item_relationship.nodes_to)
@@ -283,16 +344,42 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                     target_id = content_item_id
                 obj.add_relationship(
                     relationship_type,
-                    RelationshipData(
-                        relationship_type=relationship_type,
-                        source_id=source_id,
-                        target_id=target_id,
-                        content_item_to=target,
-                        mandatorily=True,
-                        is_direct=False,
+                    construct_trusted(
+                        RelationshipData,
+                        dict(
+                            relationship_type=relationship_type,
+                            source_id=source_id,
+                            target_id=target_id,
+                            content_item_to=target,
+                            mandatorily=True,
+                            is_direct=False,
+                        ),
                     ),
                 )
 
+    def _get_all_level_relationships_table(
+        self,
+        relationship_type: RelationshipType,
+        marketplace: Optional[MarketplaceVersions] = None,
+    ) -> Optional[Dict[str, List[str]]]:
+        """Returns the precomputed all level relationships of the given type, if available.
+
+        Args:
+            relationship_type (RelationshipType): DEPENDS_ON or IMPORTS.
+            marketplace (MarketplaceVersions): The marketplace of the DEPENDS_ON relationships.
+
+        Returns:
+            Optional[Dict[str, List[str]]]: A mapping of node ids to the node ids of their all level targets,
+                or None if the graph has changed since the table was computed.
+        """
+        if not (table := self.all_level_relationships):
+            return None
+        if relationship_type == RelationshipType.DEPENDS_ON:
+            return table["depends_on"].get(MarketplaceVersions(marketplace).value, {})
+        if relationship_type == RelationshipType.IMPORTS:
+            return table["imported_by"]
+        return None
+
     def _add_nodes_to_mapping(self, nodes: Iterable[graph.Node]) -> None:
         """Add nodes to the content models mapping
 
@@ -303,9 +390,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             filter(lambda node: node.element_id not in self._id_to_obj, nodes)
         )
         if not nodes:
-            logger.debug(
-                "No nodes to parse packs because all of them in mapping",
-            )
+            logger.debug("No nodes to parse packs because all of them in mapping")
             # Log only the cache size; a full repr of _id_to_obj recurses
             # forever on circular relationships (e.g. Connector -> Pack -> ...).
             logger.debug(f"_id_to_obj cache size: {len(self._id_to_obj)}")
@@ -316,6 +401,10 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             )
             for result in results:
                 assert result.database_id is not None
+                # keep the relationships of the loaded nodes compactly, in a store shared by all of them
+                result.relationships_data = CompactRelationshipsData(
+                    self._relationships_store
+                )
                 self._id_to_obj[result.database_id] = result
 
     def _search(
@@ -373,7 +462,14 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
     def create_nodes(self, nodes: Dict[ContentType, List[Dict[str, Any]]]) -> None:
         logger.info("Creating graph nodes...")
         pack_ids = [p.get("object_id") for p in nodes.get(ContentType.PACK, [])]
-        with self.driver.session() as session:
+        self.clear_all_level_relationships()
+        with (
+            span(
+                "graph.create_nodes",
+                nodes=sum(len(nodes_of_type) for nodes_of_type in nodes.values()),
+            ),
+            self.driver.session() as session,
+        ):
             self._rels_to_preserve = session.execute_read(
                 get_relationships_to_preserve, pack_ids
             )
@@ -826,14 +922,76 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         self, relationships: Dict[RelationshipType, List[Dict[str, Any]]]
     ) -> None:
         logger.info("Creating graph relationships...")
-        with self.driver.session() as session:
+        self.clear_all_level_relationships()
+        with (
+            span(
+                "graph.create_relationships",
+                relationships=sum(len(rels) for rels in relationships.values()),
+            ),
+            self.driver.session() as session,
+        ):
             session.execute_write(create_relationships, relationships, timeout=120)
             if self._rels_to_preserve:
                 session.execute_write(
                     return_preserved_relationships, self._rels_to_preserve
                 )
 
+    def create_graph_in_bulk(
+        self,
+        nodes: Dict[ContentType, List[Dict[str, Any]]],
+        relationships: Dict[RelationshipType, List[Dict[str, Any]]],
+    ) -> None:
+        """Creates the nodes and relationships in an empty graph by bulk loading them, by:
+        1. Writing the nodes and relationships to JSON lines files in the import dir
+        2. Dropping the indexes and constraints, so they are not updated on every created node
+        3. Loading the nodes in batches, and removing their empty properties
+        4. Recreating the indexes and constraints, which the relationships queries use to match their nodes
+        5. Loading the relationships in batches
+
+        Args:
+            nodes (Dict[ContentType, List[Dict[str, Any]]]): The nodes to create.
+            relationships (Dict[RelationshipType, List[Dict[str, Any]]]): The relationships to create.
+        """
+        logger.warning(
+            "The bulk import is experimental, create the graph without --bulk-import if it fails."
+        )
+        logger.info("Creating graph nodes and relationships in bulk...")
+        self.clear_all_level_relationships()
+        with (
+            span(
+                "graph.create_in_bulk",
+                nodes=sum(len(nodes_of_type) for nodes_of_type in nodes.values()),
+                relationships=sum(len(rels) for rels in relationships.values()),
+            ),
+            self.driver.session() as session,
+        ):
+            try:
+                nodes_filenames = {
+                    content_type: self._import_handler.write_bulk_import_file(
+                        f"nodes_{content_type}", data
+                    )
+                    for content_type, data in nodes.items()
+                }
+                relationships_filenames = {
+                    relationship: self._import_handler.write_bulk_import_file(
+                        f"relationships_{relationship}", data
+                    )
+                    for relationship, data in relationships.items()
+                }
+                session.execute_write(drop_constraints)
+                session.execute_write(
+                    drop_indexes, session.execute_read(get_index_names)
+                )
+                session.execute_write(bulk_load_nodes, nodes_filenames)
+                session.execute_write(remove_empty_properties)
+                self.create_indexes_and_constraints()
+                session.execute_read(await_indexes)
+                session.execute_write(bulk_load_relationships, relationships_filenames)
+            finally:
+                self._import_handler.remove_bulk_import_files()
+
     def remove_non_repo_items(self) -> None:
+        self.clear_all_level_relationships()
         with self.driver.session() as session:
             # Removing content-private nodes should be a temporary workaround.
             # For more details: https://jira-hq.paloaltonetworks.local/browse/CIAC-7149
@@ -852,7 +1010,9 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         3. Import the GraphML files
         4. Merging duplicate nodes (conmmands/content items)
         5. Recreating the constraints
-        6. Remove empty properties
+
+        Graphs exported as JSON lines (see `DEMISTO_SDK_NEO4J_EXPORT_FORMAT`) are imported concurrently instead,
+        see `_import_files_concurrently`.
 
         Args:
             external_import_paths (List[Path]): A list of external repositories' import paths.
@@ -886,20 +1046,86 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         self._import_handler.extract_files_from_path(imported_path)
         self._import_handler.ensure_data_uniqueness()
         graphml_filenames = self._import_handler.get_graphml_filenames()
-        if not graphml_filenames:
-            # no ml files found in the import dir, nothing to import
+        json_lines_filenames = self._import_handler.get_json_lines_filenames()
+        files_count = len(graphml_filenames) + len(json_lines_filenames)
+        if not files_count:
+            # no graph files found in the import dir, nothing to import
             return False
-        with self.driver.session() as session:
-            session.execute_write(drop_constraints)
-            session.execute_write(import_graphml, graphml_filenames)
-            session.execute_write(merge_duplicate_commands)
-            session.execute_write(create_constraints)
-            if len(graphml_filenames) > 1:
-                session.execute_write(merge_duplicate_content_items)
+        with span("graph.import", files=files_count):
+            if json_lines_filenames:
+                self._import_files_concurrently(graphml_filenames, json_lines_filenames)
+            else:
+                with self.driver.session() as session:
+                    session.execute_write(drop_constraints)
+                    session.execute_write(import_graphml, graphml_filenames)
+                    # the imported graph is not the current working tree, whatever snapshot it was exported with
+                    session.execute_write(delete_snapshot)
+                    session.execute_write(merge_duplicate_commands)
+                    session.execute_write(create_constraints)
+                    if files_count > 1:
+                        session.execute_write(merge_duplicate_content_items)
         has_infra_graph_been_changed = self._has_infra_graph_been_changed()
         self._id_to_obj = {}
+        self._relationships_store = RelationshipsStore()
+        # the all level relationships table is imported with the graph, unless several graphs were merged
+        self._all_level_relationships = None
+        if files_count > 1:
+            self.clear_all_level_relationships()
         return not has_infra_graph_been_changed
 
+    def _import_files_concurrently(
+        self, graphml_filenames: List[str], json_lines_filenames: List[str]
+    ) -> None:
+        """Imports GraphML and JSON lines files to neo4j (experimental), by:
+        1. Dropping the constraints, and creating the index of the JSON lines import ids
+        2. Import the files concurrently, each in a session of its own
+        3. Removing the JSON lines import ids
+        4. Merging duplicate nodes (commands/content items) in batches
+        5. Recreating the constraints
+
+        Args:
+            graphml_filenames (List[str]): The GraphML files in the import dir.
+            json_lines_filenames (List[str]): The JSON lines files in the import dir.
+        """
+        with self.driver.session() as session:
+            session.execute_write(drop_constraints)
+            session.execute_write(create_import_id_index)
+            session.execute_read(await_indexes)
+        self._run_concurrently(
+            [(import_graphml, [filename]) for filename in graphml_filenames]
+            + [
+                (import_json_lines, filename, source)
+                for source, filename in enumerate(json_lines_filenames, 1)
+            ]
+        )
+        with self.driver.session() as session:
+            session.execute_write(remove_import_ids)
+            session.execute_write(drop_import_id_index)
+            # the imported graph is not the current working tree, whatever snapshot it was exported with
+            session.execute_write(delete_snapshot)
+            session.execute_write(merge_duplicate_commands_in_batches)
+            session.execute_write(create_constraints)
+            if len(graphml_filenames) + len(json_lines_filenames) > 1:
+                session.execute_write(merge_duplicate_content_items_in_batches)
+
+    def _run_concurrently(self, transactions: List[Tuple[Any, ...]]) -> None:
+        """Runs write transactions concurrently, each in a session of its own thread.
+
+        Args:
+            transactions (List[Tuple[Any, ...]]): The transaction functions, each with its arguments.
+        """
+
+        def run(transaction: Tuple[Any, ...]) -> None:
+            transaction_function, *args = transaction
+            with self.driver.session() as session:
+                session.execute_write(transaction_function, *args)
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(transactions), cpu_count())
+        ) as executor:
+            # consuming the results raises the exception of a failed transaction
+            list(executor.map(run, transactions))
+
     def export_graph(
         self,
         output_path: Optional[Path] = None,
@@ -907,22 +1133,36 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
         clean_import_dir: bool = True,
     ) -> None:
+        # read the all level relationships table before the import dir is cleaned
+        all_level_relationships = self.all_level_relationships
         if clean_import_dir:
             self.clean_import_dir()
         with self.driver.session() as session:
-            session.execute_write(export_graphml, self.repo_path.name)
+            # the snapshot describes the live graph only, so it is left out of the exported graph
+            snapshot = session.execute_write(pop_snapshot)
+            try:
+                if NEO4J_EXPORT_FORMAT == GraphExportFormat.JSON_LINES:
+                    session.execute_write(export_json_lines, self.repo_path.name)
+                else:
+                    session.execute_write(export_graphml, self.repo_path.name)
+            finally:
+                if snapshot:
+                    session.execute_write(save_snapshot, snapshot)
         self.dump_metadata(override_commit)
         self.dump_depends_on()
+        self.dump_all_level_relationships(all_level_relationships)
         if output_path:
             output_path = output_path / marketplace.value
             logger.info(f"Saving content graph in {output_path}.zip")
             self.zip_import_dir(output_path)  # type: ignore[arg-type]
 
     def clean_graph(self):
+        self.clear_all_level_relationships()
         with self.driver.session() as session:
             session.execute_write(delete_all_graph_relationships)
             session.execute_write(delete_all_graph_nodes)
         self._id_to_obj = {}
+        self._relationships_store = RelationshipsStore()
 
     def search(
         self,
@@ -963,6 +1203,9 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         logger.info("Creating pack dependencies...")
         with self.driver.session() as session:
             self._depends_on = session.execute_write(create_pack_dependencies)
+            self._all_level_relationships = session.execute_read(
+                get_all_level_relationships_table
+            )
 
     def is_alive(self):
         return neo4j_service.is_alive()
@@ -1,6 +1,7 @@
 import os
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Set, Tuple
 
 from neo4j import Transaction
 
@@ -68,6 +69,145 @@ def get_all_level_packs_relationships(
     }
 
 
+def get_all_level_relationships_from_table(
+    tx: Transaction,
+    ids_to_targets: Dict[str, List[str]],
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Retrieves the all level relationships of the given nodes from a precomputed table
+    (see `get_all_level_relationships_table`), instead of expanding variable-length paths.
+    The targets are matched by their node ids, and only they are returned (the caller reads only `nodes_to`).
+
+    Args:
+        tx (Transaction): The neo4j transaction.
+        ids_to_targets (Dict[str, List[str]]): A mapping of neo4j ids to the node ids of their all level targets.
+
+    Returns:
+        Dict[str, Neo4jRelationshipResult]: Dictionary of neo4j ids to Neo4jRelationshipResult
+    """
+    query = f"""// Retrieves the precomputed all level relationships targets
+UNWIND $data AS row
+MATCH (node_to:{ContentType.BASE_NODE})
+WHERE node_to.node_id IN row.targets
+RETURN row.id AS node_id, collect(node_to) AS nodes_to"""
+    result = run_query(
+        tx,
+        query,
+        data=[
+            {"id": node_id, "targets": targets}
+            for node_id, targets in ids_to_targets.items()
+        ],
+    )
+    return {
+        item.get("node_id"): Neo4jRelationshipResult(
+            node_from=None,  # type: ignore[arg-type]
+            nodes_to=item.get("nodes_to"),
+            relationships=[],
+        )
+        for item in result
+    }
+
+
+def get_all_level_relationships_table(tx: Transaction) -> Dict[str, dict]:
+    """Computes the transitive closure of the relationships used by `get_all_level_packs_relationships`,
+    so it is calculated once when the dependencies are created rather than on every query.
+
+    The table holds, by node ids:
+        - depends_on: For each marketplace, the packs every pack mandatorily depends on (not for tests),
+          up to MAX_DEPTH levels, through packs of that marketplace only.
+        - imported_by: The content items that import every content item, up to MAX_DEPTH levels.
+
+    Args:
+        tx (Transaction): The neo4j transaction.
+
+    Returns:
+        Dict[str, dict]: The all level relationships table.
+    """
+    packs_marketplaces = {
+        item["node_id"]: set(item["marketplaces"] or [])
+        for item in run_query(
+            tx,
+            f"""// Retrieves the marketplaces of all packs
+MATCH (pack:{ContentType.PACK})
+WHERE pack.node_id IS NOT NULL
+RETURN pack.node_id AS node_id, pack.marketplaces AS marketplaces""",
+        )
+    }
+    depends_on_edges = [
+        (item["source"], item["target"])
+        for item in run_query(
+            tx,
+            f"""// Retrieves the mandatory, non-test pack dependencies
+MATCH (p1:{ContentType.PACK})-[r:{RelationshipType.DEPENDS_ON}]->(p2:{ContentType.PACK})
+WHERE NOT r.is_test AND r.mandatorily = true
+RETURN p1.node_id AS source, p2.node_id AS target""",
+        )
+    ]
+    imported_by_edges = [
+        (item["source"], item["target"])
+        for item in run_query(
+            tx,
+            f"""// Retrieves the imports, from the imported content item to the importing one
+MATCH (node_from)-[:{RelationshipType.IMPORTS}]->(node_to)
+WHERE node_from.node_id <> "" AND node_to.node_id <> ""
+RETURN node_to.node_id AS source, node_from.node_id AS target""",
+        )
+    ]
+    marketplaces = {
+        marketplace
+        for pack_marketplaces in packs_marketplaces.values()
+        for marketplace in pack_marketplaces
+    }
+    table: Dict[str, dict] = {
+        "depends_on": {
+            marketplace: reachable_nodes(
+                (source, target)
+                for source, target in depends_on_edges
+                if marketplace in packs_marketplaces.get(source, ())
+                and marketplace in packs_marketplaces.get(target, ())
+            )
+            for marketplace in sorted(marketplaces)
+        },
+        "imported_by": reachable_nodes(imported_by_edges),
+    }
+    logger.debug("Computed the all level relationships table.")
+    return table
+
+
+def reachable_nodes(
+    edges: Iterable[Tuple[str, str]], max_depth: int = MAX_DEPTH
+) -> Dict[str, List[str]]:
+    """Returns the nodes reachable from every node within max_depth hops (excluding the node itself).
+
+    Args:
+        edges (Iterable[Tuple[str, str]]): The (source, target) edges of the graph.
+        max_depth (int): The maximal path length.
+
+    Returns:
+        Dict[str, List[str]]: A mapping of every node with outgoing edges to the sorted nodes it reaches.
+    """
+    adjacency: Dict[str, Set[str]] = defaultdict(set)
+    for source, target in edges:
+        adjacency[source].add(target)
+
+    reachable: Dict[str, List[str]] = {}
+    for source in adjacency:
+        visited = {source}
+        frontier = [source]
+        for _ in range(max_depth):
+            next_frontier = []
+            for node in frontier:
+                for target in adjacency.get(node, ()):
+                    if target not in visited:
+                        visited.add(target)
+                        next_frontier.append(target)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        visited.discard(source)
+        reachable[source] = sorted(visited)
+    return reachable
+
+
 def create_pack_dependencies(tx: Transaction) -> dict:
     remove_existing_depends_on_relationships(tx)
     update_uses_for_integration_commands(tx)
@@ -1,10 +1,72 @@
 from time import sleep
-from typing import List
+from typing import Dict, List
 
 from neo4j import Transaction
 
-from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
+from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
+    JSON_LINES_FILE_SUFFIX,
+)
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import run_query
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.nodes import (
+    build_create_nodes_query,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.relationships import (
+    build_relationships_query,
+    update_alert_to_incident_relationships,
+)
+
+BULK_LOAD_BATCH_SIZE = 10000
+MERGE_BATCH_SIZE = 1000
+
+# The temporary label and property matching the relationships of an imported JSON lines file to its nodes.
+IMPORTED_NODE_LABEL = "ImportedNode"
+IMPORT_ID = "import_id"
+IMPORT_ID_INDEX = "imported_node_import_id"
+
+RUN_IN_BATCHES_QUERY = """// Runs the action query on the rows of the iterate query, committing every batch in its own transaction
+CALL apoc.periodic.iterate(
+    $iterate_query,
+    $action_query,
+    {batchSize: $batch_size, batchMode: "BATCH", parallel: $parallel}
+)
+YIELD total, failedBatches, errorMessages
+RETURN total, failedBatches, errorMessages"""
+
+
+def run_in_batches(
+    tx: Transaction,
+    iterate_query: str,
+    action_query: str,
+    batch_size: int = BULK_LOAD_BATCH_SIZE,
+    parallel: bool = False,
+) -> int:
+    """Runs a query on the rows of another query with `apoc.periodic.iterate`, in batches.
+
+    Args:
+        tx (Transaction): The neo4j transaction.
+        iterate_query (str): The query returning the rows.
+        action_query (str): The query run on every batch, which unwinds the rows of `$_batch`.
+        batch_size (int): The number of rows in a batch.
+        parallel (bool): Whether to run the batches in parallel.
+
+    Returns:
+        int: The number of rows.
+    """
+    result = run_query(
+        tx,
+        RUN_IN_BATCHES_QUERY,
+        iterate_query=iterate_query,
+        action_query=action_query,
+        batch_size=batch_size,
+        parallel=parallel,
+    ).single()
+    if result["failedBatches"]:
+        raise RuntimeError(
+            f"Failed {result['failedBatches']} batches of query:\n{action_query}\n{result['errorMessages']}"
+        )
+    return result["total"]
 
 
 def import_graphml(tx: Transaction, graphml_filenames: List[str]) -> None:
@@ -19,6 +81,76 @@ def export_graphml(tx: Transaction, repo_name: str) -> None:
     run_query(tx, query)
 
 
+def export_json_lines(tx: Transaction, repo_name: str) -> None:
+    sleep(1)  # doesn't work without it
+    query = f'CALL apoc.export.json.all("{repo_name}{JSON_LINES_FILE_SUFFIX}", {{compression: "GZIP"}})'
+    run_query(tx, query)
+
+
+def load_json_lines(filename: str, record_type: str) -> str:
+    """Returns a query of the records of a type ("node" or "relationship") of an exported JSON lines file."""
+    return f"""CALL apoc.load.json("file:/{filename}", "", {{compression: "GZIP"}}) YIELD value
+WITH value WHERE value.type = "{record_type}"
+RETURN value"""
+
+
+def create_import_id_index(tx: Transaction) -> None:
+    run_query(
+        tx,
+        f"CREATE INDEX {IMPORT_ID_INDEX} IF NOT EXISTS FOR (n:{IMPORTED_NODE_LABEL}) ON (n.{IMPORT_ID})",
+    )
+
+
+def drop_import_id_index(tx: Transaction) -> None:
+    run_query(tx, f"DROP INDEX {IMPORT_ID_INDEX} IF EXISTS")
+
+
+def import_json_lines(tx: Transaction, filename: str, source: int) -> None:
+    """Imports the nodes and then the relationships of an exported JSON lines file, in batches.
+    The relationships are matched to their nodes by the ids of the file, prefixed by the source number of the file,
+    so files of different repositories can be imported at the same time.
+
+    Args:
+        tx (Transaction): The neo4j transaction.
+        filename (str): The name of the JSON lines file in the import dir.
+        source (int): The unique number of the file among the imported files.
+    """
+    nodes = run_in_batches(
+        tx,
+        load_json_lines(filename, "node"),
+        f"""// Creates the imported nodes, with the ids of their source
+UNWIND $_batch AS row
+WITH row.value AS value
+CALL apoc.create.node(value.labels + "{IMPORTED_NODE_LABEL}", coalesce(value.properties, {{}})) YIELD node
+SET node.{IMPORT_ID} = "{source}:" + value.id""",
+    )
+    relationships = run_in_batches(
+        tx,
+        load_json_lines(filename, "relationship"),
+        f"""// Creates the imported relationships between the nodes of their source
+UNWIND $_batch AS row
+WITH row.value AS value
+MATCH (source:{IMPORTED_NODE_LABEL}{{{IMPORT_ID}: "{source}:" + value.start.id}})
+MATCH (target:{IMPORTED_NODE_LABEL}{{{IMPORT_ID}: "{source}:" + value.end.id}})
+CALL apoc.create.relationship(source, value.label, coalesce(value.properties, {{}}), target) YIELD rel
+RETURN count(rel)""",
+    )
+    logger.debug(
+        f"Imported {nodes} nodes and {relationships} relationships from {filename}."
+    )
+
+
+def remove_import_ids(tx: Transaction) -> None:
+    run_in_batches(
+        tx,
+        f"MATCH (n:{IMPORTED_NODE_LABEL}) RETURN n",
+        f"""UNWIND $_batch AS row
+WITH row.n AS n
+REMOVE n:{IMPORTED_NODE_LABEL}, n.{IMPORT_ID}""",
+        parallel=True,
+    )
+
+
 def merge_duplicate_commands(tx: Transaction) -> None:
     run_query(
         tx,
@@ -30,6 +162,31 @@ RETURN node""",
     )
 
 
+def merge_duplicate_commands_in_batches(tx: Transaction) -> None:
+    """Merges the command nodes of the same object id, in batches.
+
+    Every batch is committed in its own transaction, so a retry of the calling transaction finds the batches
+    of the previous attempt committed. The duplicates are gathered again on every attempt, and every batch
+    merges only the nodes which still have the object id, if more than one is left.
+    """
+    run_in_batches(
+        tx,
+        f"""// Gets possible duplicate command nodes after import
+MATCH (c:{ContentType.COMMAND})
+WITH c.object_id AS object_id, collect(elementId(c)) AS ids
+WHERE size(ids) > 1
+RETURN object_id, ids""",
+        f"""// Merges the duplicate command nodes
+UNWIND $_batch AS row
+MATCH (c:{ContentType.COMMAND}) WHERE elementId(c) IN row.ids AND c.object_id = row.object_id
+WITH row, collect(c) AS cmds
+WHERE size(cmds) > 1
+CALL apoc.refactor.mergeNodes(cmds, {{properties: "combine", mergeRels: true}}) YIELD node
+RETURN count(node)""",
+        batch_size=MERGE_BATCH_SIZE,
+    )
+
+
 def merge_duplicate_content_items(tx: Transaction) -> None:
     run_query(
         tx,
@@ -42,3 +199,83 @@ WITH m, n
 CALL apoc.refactor.mergeNodes([m, n], {{properties: "discard", mergeRels: true}}) YIELD node
 RETURN node""",
     )
+
+
+def merge_duplicate_content_items_in_batches(tx: Transaction) -> None:
+    """Merges the content item nodes which are not in the repository into their duplicates which are, in batches.
+
+    Every batch is committed in its own transaction, so a retry of the calling transaction finds the batches
+    of the previous attempt committed. The duplicates are gathered again on every attempt, and every row
+    is merged only if its nodes are still a node of the repository and a node which is not in it.
+    A merged node keeps the properties of the node of the repository, so it is not gathered again.
+    """
+    run_in_batches(
+        tx,
+        f"""// Gets possible duplicate content item nodes after import
+MATCH (n:{ContentType.BASE_NODE}{{not_in_repository: true}})
+MATCH (m:{ContentType.BASE_NODE}{{content_type: n.content_type}})
+WHERE ((m.object_id = n.object_id AND m.object_id <> "") OR (m.name = n.name AND m.name <> ""))
+AND m.not_in_repository = false
+RETURN elementId(m) AS m_id, elementId(n) AS n_id""",
+        """// Merges the duplicate content item nodes (a node merged by a previous row is not matched again)
+UNWIND $_batch AS row
+MATCH (m) WHERE elementId(m) = row.m_id AND m.not_in_repository = false
+MATCH (n) WHERE elementId(n) = row.n_id AND n.not_in_repository = true
+CALL apoc.refactor.mergeNodes([m, n], {properties: "discard", mergeRels: true}) YIELD node
+RETURN count(node)""",
+        batch_size=MERGE_BATCH_SIZE,
+    )
+
+
+def to_batch_query(query: str, variable: str) -> str:
+    """Converts a query of the rows of the `$data` parameter to a query of the `$_batch` of `apoc.periodic.iterate`."""
+    unwind = f"UNWIND $data AS {variable}"
+    if unwind not in query:
+        raise ValueError(f"The query does not unwind $data as {variable}:\n{query}")
+    return query.replace(
+        unwind, f"UNWIND $_batch AS row\nWITH row.{variable} AS {variable}", 1
+    )
+
+
+def bulk_load(tx: Transaction, filename: str, variable: str, query: str) -> int:
+    """Runs a query of the `$data` parameter on the rows of a JSON lines file in the import dir, in batches.
+
+    Args:
+        tx (Transaction): The neo4j transaction.
+        filename (str): The name of the JSON lines file in the import dir.
+        variable (str): The variable the query unwinds the rows as.
+        query (str): The query, which unwinds the rows of `$data`.
+
+    Returns:
+        int: The number of loaded rows.
+    """
+    return run_in_batches(
+        tx,
+        f'CALL apoc.load.json("file:/{filename}") YIELD value RETURN value AS {variable}',
+        to_batch_query(query, variable),
+    )
+
+
+def bulk_load_nodes(tx: Transaction, filenames: Dict[ContentType, str]) -> None:
+    for content_type, filename in filenames.items():
+        total = bulk_load(
+            tx, filename, "node_data", build_create_nodes_query(content_type)
+        )
+        logger.debug(f"Loaded {total} nodes of type {content_type}.")
+
+
+def bulk_load_relationships(
+    tx: Transaction, filenames: Dict[RelationshipType, str]
+) -> None:
+    # as in `create_relationships`, the commands are merged before the relationships which use them
+    for relationship in sorted(
+        filenames, key=lambda relationship: relationship != RelationshipType.HAS_COMMAND
+    ):
+        total = bulk_load(
+            tx,
+            filenames[relationship],
+            "rel_data",
+            build_relationships_query(relationship),
+        )
+        logger.debug(f"Loaded {total} relationships of type {relationship}.")
+    run_query(tx, update_alert_to_incident_relationships())
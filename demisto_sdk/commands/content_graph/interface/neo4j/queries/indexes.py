@@ -35,6 +35,16 @@ CREATE_REL_INDEX_TEMPLATE = (
     "CREATE INDEX IF NOT EXISTS FOR ()-[r:{rel}]->() ON ({props})"
 )
 
+DROP_INDEX_TEMPLATE = "DROP INDEX {name} IF EXISTS"
+
+# The label and relationship type lookup indexes are kept, as neo4j uses them to scan by label.
+GET_INDEX_NAMES = """// Gets the names of the indexes which are not lookup indexes or owned by constraints
+SHOW INDEXES YIELD name, type, owningConstraint
+WHERE type <> "LOOKUP" AND owningConstraint IS NULL
+RETURN collect(name) AS names"""
+
+AWAIT_INDEXES_TIMEOUT = 600
+
 
 def create_indexes(tx: Transaction) -> None:
     for content_type in ContentType:
@@ -65,3 +75,17 @@ def create_single_relationship_index(
     properties = ", ".join([f"r.{p}" for p in indexed_properties])
     query = CREATE_REL_INDEX_TEMPLATE.format(rel=rel, props=properties)
     run_query(tx, query)
+
+
+def get_index_names(tx: Transaction) -> List[str]:
+    return run_query(tx, GET_INDEX_NAMES).single()["names"]
+
+
+def drop_indexes(tx: Transaction, names: List[str]) -> None:
+    for name in names:
+        run_query(tx, DROP_INDEX_TEMPLATE.format(name=f"`{name}`"))
+
+
+def await_indexes(tx: Transaction) -> None:
+    """Waits for the created indexes to be populated, so the queries which follow can use them."""
+    run_query(tx, f"CALL db.awaitIndexes({AWAIT_INDEXES_TIMEOUT})")
@@ -164,16 +164,19 @@ def remove_content_private_nodes(tx: Transaction) -> None:
     remove_nodes(tx, CONTENT_PRIVATE_ITEMS)
 
 
+def build_create_nodes_query(content_type: ContentType) -> str:
+    labels: str = ":".join(content_type.labels)
+    if content_type in ContentType.content_items():
+        return CREATE_CONTENT_ITEM_NODES_BY_TYPE_TEMPLATE.format(labels=labels)
+    return CREATE_NODES_BY_TYPE_TEMPLATE.format(labels=labels)
+
+
 def create_nodes_by_type(
     tx: Transaction,
     content_type: ContentType,
     data: List[Dict[str, Any]],
 ) -> None:
-    labels: str = ":".join(content_type.labels)
-    if content_type in ContentType.content_items():
-        query = CREATE_CONTENT_ITEM_NODES_BY_TYPE_TEMPLATE.format(labels=labels)
-    else:
-        query = CREATE_NODES_BY_TYPE_TEMPLATE.format(labels=labels)
+    query = build_create_nodes_query(content_type)
     result = run_query(tx, query, data=data).single()
     nodes_count: int = result["nodes_created"]
     logger.debug(f"Created {nodes_count} nodes of type {content_type}.")
@@ -231,11 +231,7 @@ def create_relationships(
     run_query(tx, update_alert_to_incident_relationships())
 
 
-def create_relationships_by_type(
-    tx: Transaction,
-    relationship: RelationshipType,
-    data: List[Dict[str, Any]],
-) -> None:
+def build_relationships_query(relationship: RelationshipType) -> str:
     if relationship == RelationshipType.HAS_COMMAND:
         query = build_has_command_relationships_query()
     elif relationship == RelationshipType.USES_BY_ID:
@@ -266,6 +262,15 @@ def create_relationships_by_type(
         query = build_depends_on_relationships_query()
     else:
         query = build_default_relationships_query(relationship)
+    return query
+
+
+def create_relationships_by_type(
+    tx: Transaction,
+    relationship: RelationshipType,
+    data: List[Dict[str, Any]],
+) -> None:
+    query = build_relationships_query(relationship)
     run_query(tx, query, data=data)
     logger.debug(f"Merged relationships of type {relationship}.")
 
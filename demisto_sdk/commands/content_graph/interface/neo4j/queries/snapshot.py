@@ -0,0 +1,42 @@
+from typing import Any, Dict, Optional
+
+from neo4j import Transaction
+
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import run_query
+
+# The label of the single node which records the snapshot the graph was built from
+SNAPSHOT_LABEL = "GraphSnapshot"
+
+
+def get_snapshot(tx: Transaction) -> Optional[Dict[str, Any]]:
+    query = f"""// Returns the snapshot the graph was built from
+MATCH (s:{SNAPSHOT_LABEL})
+RETURN properties(s) AS snapshot"""
+    if record := run_query(tx, query).single():
+        return record["snapshot"]
+    return None
+
+
+def save_snapshot(tx: Transaction, snapshot: Dict[str, Any]) -> None:
+    query = f"""// Records the snapshot the graph was built from
+MERGE (s:{SNAPSHOT_LABEL})
+SET s = $snapshot"""
+    run_query(tx, query, snapshot=snapshot)
+
+
+def delete_snapshot(tx: Transaction) -> None:
+    query = f"""// Deletes the snapshot of the graph
+MATCH (s:{SNAPSHOT_LABEL})
+DELETE s"""
+    run_query(tx, query)
+
+
+def pop_snapshot(tx: Transaction) -> Optional[Dict[str, Any]]:
+    query = f"""// Deletes the snapshot of the graph and returns it
+MATCH (s:{SNAPSHOT_LABEL})
+WITH s, properties(s) AS snapshot
+DELETE s
+RETURN snapshot"""
+    if record := run_query(tx, query).single():
+        return record["snapshot"]
+    return None
@@ -1,6 +1,7 @@
 import inspect
 from abc import ABC
 from collections import defaultdict
+from enum import Enum
 from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import (
@@ -39,20 +40,20 @@ from demisto_sdk.commands.content_graph.common import (
     RelationshipType,
 )
 from demisto_sdk.commands.content_graph.parsers import content_item
+from demisto_sdk.commands.content_graph.parsers.base_content import StructureErrors
 from demisto_sdk.commands.content_graph.parsers.content_item import (
     ContentItemParser,
     InvalidContentItemException,
     NotAContentItemException,
 )
 from demisto_sdk.commands.content_graph.parsers.pack import PackParser
-from demisto_sdk.commands.content_graph.strict_objects.base_strict_model import (
-    StructureError,
-)
 
 if TYPE_CHECKING:
     from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
 
 CONTENT_TYPE_TO_MODEL: Dict[ContentType, Type["BaseContent"]] = {}
+# values `to_dict` copies as they are, as `BaseModel.dict` does
+EXPORTED_AS_IS_TYPES = (str, int, float, Enum, Path, type(None))
 json = JSON_Handler()
 
 
@@ -93,6 +94,21 @@ class BaseContentMetaclass(ModelMetaclass):
         }:
             model_cls._lazy_properties = lazy_properties  # type: ignore[attr-defined]
 
+        # the attributes `to_dict` never exports, resolved once per class rather than on every call
+        model_cls._to_dict_excluded_attributes = frozenset(  # type: ignore[attr-defined]
+            {"commands", "database_id"}
+            | {
+                name
+                for name, value in inspect.getmembers(model_cls)
+                if isinstance(value, cached_property)
+            }
+            | {
+                name
+                for name, exclude in (model_cls.__exclude_fields__ or {}).items()  # type: ignore[attr-defined]
+                if exclude is True
+            }
+        )
+
         return model_cls
 
 
@@ -117,28 +133,31 @@ class BaseNode(ABC, BaseModel, metaclass=BaseContentMetaclass):
 
     def __getstate__(self):
         """Needed to for the object to be pickled correctly (to use multiprocessing)"""
-        if "relationships_data" not in self.__dict__:
+        if not self.__dict__.get("relationships_data"):
             # if we don't have relationships, we can use the default __getstate__ method
             return super().__getstate__()
+        from demisto_sdk.commands.content_graph.objects.relationship import (
+            RelationshipReferences,
+        )
+
+        state = super().__getstate__()
+        # The relationships are pickled by reference, with the first level of their target nodes only.
+        # This avoids circular references (and pickling the whole graph around the node).
+        state["__dict__"] = dict(
+            state["__dict__"],
+            relationships_data=RelationshipReferences(self.relationships_data),
+        )
+        return state
 
-        dict_copy = self.__dict__.copy()
-        # This avoids circular references when pickling store only the first level relationships.
-        relationships_data_copy = dict_copy["relationships_data"].copy()
-        dict_copy["relationships_data"] = defaultdict(set)
-        for _, relationship_data in relationships_data_copy.items():
-            for r in relationship_data:
-                # override the relationships_data of the content item to avoid circular references
-                r: RelationshipData  # type: ignore[no-redef]
-                r_copy = r.copy()
-                content_item_to_copy = r_copy.content_item_to.copy()
-                r_copy.content_item_to = content_item_to_copy
-                content_item_to_copy.relationships_data = defaultdict(set)
-                dict_copy["relationships_data"][r.relationship_type].add(r_copy)
-
-        return {
-            "__dict__": dict_copy,
-            "__fields_set__": self.__fields_set__,
-        }
+    def __setstate__(self, state):
+        from demisto_sdk.commands.content_graph.objects.relationship import (
+            RelationshipReferences,
+        )
+
+        super().__setstate__(state)
+        relationships_data = self.__dict__.get("relationships_data")
+        if isinstance(relationships_data, RelationshipReferences):
+            self.__dict__["relationships_data"] = relationships_data.link()
 
     @property
     def normalize_name(self) -> str:
@@ -166,18 +185,23 @@ class BaseNode(ABC, BaseModel, metaclass=BaseContentMetaclass):
         """
 
         self.__add_lazy_properties()
-        cached_properties = {
-            name
-            for name, value in inspect.getmembers(self.__class__)
-            if isinstance(value, cached_property)
-        }
-        json_dct = self.dict(
-            exclude={
-                "commands",
-                "database_id",
-            }
-            | cached_properties
-        )
+        excluded_attributes = self._to_dict_excluded_attributes  # type: ignore[attr-defined]
+        json_dct: Dict[str, Any] = {}
+        nested_attributes = set()
+        for name, value in self.__dict__.items():
+            if name in excluded_attributes:
+                continue
+            if isinstance(value, EXPORTED_AS_IS_TYPES):
+                json_dct[name] = value
+            elif type(value) is list and all(
+                isinstance(item, EXPORTED_AS_IS_TYPES) for item in value
+            ):
+                json_dct[name] = list(value)
+            else:
+                nested_attributes.add(name)
+        if nested_attributes:
+            # models, dicts and the like are exported by pydantic
+            json_dct.update(self.dict(include=nested_attributes))
         content_item_path = json_dct.get("path")
         if content_item_path and isinstance(content_item_path, Path):
             if content_item_path.is_absolute():
@@ -224,7 +248,13 @@ class BaseNode(ABC, BaseModel, metaclass=BaseContentMetaclass):
     def add_relationship(
         self, relationship_type: RelationshipType, relationship: "RelationshipData"
     ) -> None:
-        if relationship.content_item_to == self:
+        content_item_to = relationship.content_item_to
+        if self.database_id is not None and content_item_to.database_id is not None:
+            # nodes loaded from the graph are identified by their database id, which is cheaper than comparing models
+            is_circular = content_item_to.database_id == self.database_id
+        else:
+            is_circular = content_item_to == self
+        if is_circular:
             # skip adding circular dependency
             return
         self.relationships_data[relationship_type].add(relationship)
@@ -238,7 +268,9 @@ class BaseContent(BaseNode):
     git_sha: Optional[str]
     old_base_content_object: Optional["BaseContent"] = None
     related_content_dict: dict = Field({}, exclude=True)
-    structure_errors: List[StructureError] = Field(default_factory=list, exclude=True)
+    structure_errors: StructureErrors = Field(
+        default_factory=StructureErrors, exclude=True
+    )
     supportedModules: Optional[List[str]] = None
 
     def _save(
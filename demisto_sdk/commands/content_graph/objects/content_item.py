@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
     from demisto_sdk.commands.content_graph.objects.test_playbook import TestPlaybook
 
-from pydantic import DirectoryPath, Field, fields, validator
+from pydantic import DirectoryPath, Field, PrivateAttr, fields, validator
 
 from demisto_sdk.commands.common.constants import PACKS_FOLDER, MarketplaceVersions
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
@@ -31,17 +31,17 @@ from demisto_sdk.commands.common.tools import (
     replace_incident_to_alert,
     write_dict,
 )
+from demisto_sdk.commands.common.tracing import span
 from demisto_sdk.commands.content_graph.common import (
     ContentType,
     RelationshipType,
     append_supported_modules,
-    replace_marketplace_references,
 )
 from demisto_sdk.commands.content_graph.objects.base_content import (
     BaseContent,
 )
-from demisto_sdk.commands.prepare_content.preparers.marketplace_suffix_preparer import (
-    MarketplaceSuffixPreparer,
+from demisto_sdk.commands.prepare_content.preparers.marketplace_upload_preparer import (
+    MarketplaceUploadPreparer,
 )
 
 
@@ -59,6 +59,8 @@ class ContentItem(BaseContent):
     support: str = ""
     is_silent: bool = False
     upload_path: Optional[Path] = None
+    # A private copy of the file data, used instead of reading the file while dumping to several marketplaces.
+    _loaded_data: Optional[dict] = PrivateAttr(None)
 
     @validator("path", always=True)
     def validate_path(cls, v: Path, values) -> Path:
@@ -258,6 +260,8 @@ class ContentItem(BaseContent):
 
     @property
     def data(self) -> dict:
+        if self._loaded_data is not None:
+            return self._loaded_data
         return get_file(
             getattr(self, "path_to_read", None) or self.path, keep_order=False
         )
@@ -289,8 +293,6 @@ class ContentItem(BaseContent):
         if not self.path.exists():
             raise FileNotFoundError(f"Could not find file {self.path}")
         data = self.data
-        # Replace incorrect marketplace references
-        data = replace_marketplace_references(data, current_marketplace, str(self.path))
         if current_marketplace == MarketplaceVersions.PLATFORM:
             data = append_supported_modules(
                 data, self.supportedModules, self.pack.supportedModules
@@ -298,7 +300,8 @@ class ContentItem(BaseContent):
         else:
             if "supportedModules" in data:
                 del data["supportedModules"]
-        return MarketplaceSuffixPreparer.prepare(data, current_marketplace)
+        # Replace incorrect marketplace references and resolve the marketplace suffixes (in a single pass)
+        return MarketplaceUploadPreparer.prepare(data, current_marketplace)
 
     def summary(
         self,
@@ -398,14 +401,13 @@ class ContentItem(BaseContent):
             return
         dir.mkdir(exist_ok=True, parents=True)
         try:
-            write_dict(
-                dir / self.normalize_name,
-                data=self.prepare_for_upload(
-                    current_marketplace=marketplace,
-                    **kwargs,
-                ),
-                handler=self.handler,
-            )
+            with span("dump.content_item", item=self.object_id):
+                with span("dump.prepare_for_upload", item=self.object_id):
+                    data = self.prepare_for_upload(
+                        current_marketplace=marketplace,
+                        **kwargs,
+                    )
+                write_dict(dir / self.normalize_name, data=data, handler=self.handler)
             logger.debug(f"path to dumped file: {str(dir / self.normalize_name)}")
         except FileNotFoundError as e:
             logger.warning(f"Failed to dump {self.path} to {dir}: {e}")
@@ -1,3 +1,4 @@
+import copy
 import shutil
 from collections import defaultdict
 from configparser import ConfigParser
@@ -5,7 +6,7 @@ from configparser import Error as ConfigParserError
 from functools import cached_property
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Union
 
 import demisto_client
 from demisto_client.demisto_api.rest import ApiException
@@ -28,7 +29,7 @@ from demisto_sdk.commands.common.git_util import (
     GitFileNotFoundError,
     GitUtil,
 )
-from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.logger import lazy_logger, logger
 from demisto_sdk.commands.common.tools import (
     MarketplaceTagParser,
     get_file,
@@ -36,6 +37,7 @@ from demisto_sdk.commands.common.tools import (
     parse_ignore_list,
     write_dict,
 )
+from demisto_sdk.commands.common.tracing import span, traced
 from demisto_sdk.commands.content_graph.common import (
     PACK_METADATA_FILENAME,
     VERSION_CONFIG_FILENAME,
@@ -535,6 +537,76 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         except FileNotFoundError:
             logger.debug(f'No such file {self.path / "ReleaseNotes"}')
 
+    @staticmethod
+    def _should_dump_content_item(
+        content_item: ContentItem,
+        marketplace: MarketplaceVersions,
+        content_types_excluded_from_upload: Set[ContentType],
+    ) -> bool:
+        if content_item.content_type in content_types_excluded_from_upload:
+            logger.debug(
+                f"SKIPPING dump {content_item.content_type} {content_item.normalize_name}"
+                "whose type was passed in `exclude_content_types`"
+            )
+            return False
+
+        if marketplace not in content_item.marketplaces:
+            logger.debug(
+                f"SKIPPING dump {content_item.content_type} {content_item.normalize_name}"
+                f"to destination {marketplace=}"
+                f" - content item has marketplaces {content_item.marketplaces}"
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _content_item_folder(content_item: ContentItem) -> str:
+        folder = content_item.content_type.as_folder
+        if content_item.content_type == ContentType.SCRIPT and content_item.is_test:
+            folder = ContentType.TEST_PLAYBOOK.as_folder
+
+        # The content structure is different from the server
+        if folder == "CaseLayouts":
+            folder = "Layouts"
+        return folder
+
+    @traced("dump.pack_files")
+    def _dump_pack_files(
+        self, path: Path, marketplace: MarketplaceVersions, strip_internal: bool
+    ) -> None:
+        """Dumps the files of the pack itself (metadata, readme, release notes, etc.), after its content items."""
+        self.dump_metadata(
+            path / "metadata.json", marketplace, strip_internal=strip_internal
+        )
+        self.dump_readme(path / "README.md", marketplace)
+        self._dump_pack_metadata(
+            self.path / PACK_METADATA_FILENAME,
+            path / PACK_METADATA_FILENAME,
+            marketplace,
+            strip_internal=strip_internal,
+        )
+        try:
+            shutil.copy(
+                self.path / VERSION_CONFIG_FILENAME, path / VERSION_CONFIG_FILENAME
+            )
+        except FileNotFoundError:
+            logger.debug(f"No such file {self.path / VERSION_CONFIG_FILENAME}")
+
+        self.dump_release_notes(path / "ReleaseNotes", marketplace)
+
+        try:
+            shutil.copy(self.path / "Author_image.png", path / "Author_image.png")
+        except FileNotFoundError:
+            logger.debug(f'No such file {self.path / "Author_image.png"}')
+
+        try:
+            shutil.copytree(self.path / "doc_files", path / "doc_files")
+        except FileNotFoundError:
+            logger.debug(f'No such directory {self.path / "doc_files"}')
+
+        if self.object_id == BASE_PACK:
+            self._copy_base_pack_docs(path, marketplace)
+
     def dump(
         self,
         path: Path,
@@ -565,88 +637,130 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
             logger.warning(f"Pack {self.name} does not exist in {self.path}")
             return
 
-        try:
-            path.mkdir(exist_ok=True, parents=True)
-
-            content_types_excluded_from_upload = (
-                CONTENT_TYPES_EXCLUDED_FROM_UPLOAD.copy()
-            )
+        with span("dump.pack", pack=self.object_id, marketplace=marketplace.value):
+            try:
+                path.mkdir(exist_ok=True, parents=True)
 
-            if tpb:
-                content_types_excluded_from_upload.discard(ContentType.TEST_PLAYBOOK)
+                content_types_excluded_from_upload = (
+                    CONTENT_TYPES_EXCLUDED_FROM_UPLOAD.copy()
+                )
 
-            for content_item in self.content_items:
-                if content_item.content_type in content_types_excluded_from_upload:
-                    logger.debug(
-                        f"SKIPPING dump {content_item.content_type} {content_item.normalize_name}"
-                        "whose type was passed in `exclude_content_types`"
+                if tpb:
+                    content_types_excluded_from_upload.discard(
+                        ContentType.TEST_PLAYBOOK
                     )
-                    continue
 
-                if marketplace not in content_item.marketplaces:
-                    logger.debug(
-                        f"SKIPPING dump {content_item.content_type} {content_item.normalize_name}"
-                        f"to destination {marketplace=}"
-                        f" - content item has marketplaces {content_item.marketplaces}"
+                for content_item in self.content_items:
+                    if not self._should_dump_content_item(
+                        content_item, marketplace, content_types_excluded_from_upload
+                    ):
+                        continue
+                    dir = path / self._content_item_folder(content_item)
+                    content_item.upload_path = dir / content_item.normalize_name
+                    content_item.dump(
+                        dir=dir,
+                        marketplace=marketplace,
+                        **kwargs,
                     )
-                    continue
+                self._dump_pack_files(path, marketplace, strip_internal=strip_internal)
 
-                folder = content_item.content_type.as_folder
-                if (
-                    content_item.content_type == ContentType.SCRIPT
-                    and content_item.is_test
-                ):
-                    folder = ContentType.TEST_PLAYBOOK.as_folder
-
-                # The content structure is different from the server
-                if folder == "CaseLayouts":
-                    folder = "Layouts"
-                dir = path / folder
-                content_item.upload_path = dir / content_item.normalize_name
-                content_item.dump(
-                    dir=dir,
-                    marketplace=marketplace,
-                    **kwargs,
+                logger.info(f"Dumped pack {self.name}.")
+                lazy_logger.debug(
+                    "Pack {} files:\n{}",
+                    self.name,
+                    lambda: "\n".join(str(f) for f in path.iterdir()),
                 )
-            self.dump_metadata(
-                path / "metadata.json", marketplace, strip_internal=strip_internal
-            )
-            self.dump_readme(path / "README.md", marketplace)
-            self._dump_pack_metadata(
-                self.path / PACK_METADATA_FILENAME,
-                path / PACK_METADATA_FILENAME,
-                marketplace,
-                strip_internal=strip_internal,
-            )
-            try:
-                shutil.copy(
-                    self.path / VERSION_CONFIG_FILENAME, path / VERSION_CONFIG_FILENAME
-                )
-            except FileNotFoundError:
-                logger.debug(f"No such file {self.path / VERSION_CONFIG_FILENAME}")
 
-            self.dump_release_notes(path / "ReleaseNotes", marketplace)
+            except Exception:
+                logger.exception(f"Failed dumping pack {self.name}")
+                raise
 
-            try:
-                shutil.copy(self.path / "Author_image.png", path / "Author_image.png")
-            except FileNotFoundError:
-                logger.debug(f'No such file {self.path / "Author_image.png"}')
+    def dump_marketplaces(
+        self,
+        paths: Dict[MarketplaceVersions, Path],
+        **kwargs,
+    ):
+        """Dumps the pack for several marketplaces in a single pass over its content items.
+
+        Every content item is read once, and each marketplace gets its own copy of the read data to prepare,
+        as the preparation changes the data in place (so dumping the marketplaces one after the other
+        in the same process would leak the changes of one marketplace into the next).
+        The preparation itself (unify, marketplace references, supportedModules, suffixes) and the
+        writing are done per marketplace, as their output differs between the marketplaces.
+
+        Args:
+            paths: The output directory of every destination marketplace.
+            **kwargs: The flags of ``dump`` (``tpb``, ``strip_internal``).
+        """
+        tpb: bool = kwargs.pop("tpb", False)
+        strip_internal: bool = kwargs.get("strip_internal", False)
 
+        if not self.path.exists():
+            logger.warning(f"Pack {self.name} does not exist in {self.path}")
+            return
+
+        with span("dump.pack", pack=self.object_id, marketplaces=len(paths)):
             try:
-                shutil.copytree(self.path / "doc_files", path / "doc_files")
-            except FileNotFoundError:
-                logger.debug(f'No such directory {self.path / "doc_files"}')
+                for path in paths.values():
+                    path.mkdir(exist_ok=True, parents=True)
 
-            if self.object_id == BASE_PACK:
-                self._copy_base_pack_docs(path, marketplace)
+                content_types_excluded_from_upload = (
+                    CONTENT_TYPES_EXCLUDED_FROM_UPLOAD.copy()
+                )
+                if tpb:
+                    content_types_excluded_from_upload.discard(
+                        ContentType.TEST_PLAYBOOK
+                    )
 
-            pack_files = "\n".join([str(f) for f in path.iterdir()])
-            logger.info(f"Dumped pack {self.name}.")
-            logger.debug(f"Pack {self.name} files:\n{pack_files}")
+                # The dumped file of every content item, per marketplace (by the identity of the item)
+                upload_paths: Dict[MarketplaceVersions, Dict[int, Path]] = defaultdict(
+                    dict
+                )
+                for content_item in self.content_items:
+                    marketplaces = [
+                        marketplace
+                        for marketplace in paths
+                        if self._should_dump_content_item(
+                            content_item,
+                            marketplace,
+                            content_types_excluded_from_upload,
+                        )
+                    ]
+                    if not marketplaces:
+                        continue
+                    folder = self._content_item_folder(content_item)
+                    data = content_item.data
+                    for marketplace in marketplaces:
+                        dir = paths[marketplace] / folder
+                        content_item.upload_path = upload_paths[marketplace][
+                            id(content_item)
+                        ] = dir / content_item.normalize_name
+                        content_item._loaded_data = copy.deepcopy(data)
+                        try:
+                            content_item.dump(
+                                dir=dir, marketplace=marketplace, **kwargs
+                            )
+                        finally:
+                            content_item._loaded_data = None
+
+                # The pack properties (tags, author) are enhanced in place for the metadata of every marketplace,
+                # so they are reset to the ones read before dumping the next marketplace.
+                pack_properties = self.__dict__.copy()
+                for marketplace, path in paths.items():
+                    # The metadata of the marketplace is built from the files dumped to it
+                    for content_item in self.content_items:
+                        content_item.upload_path = upload_paths[marketplace].get(
+                            id(content_item)
+                        )
+                    self._dump_pack_files(
+                        path, marketplace, strip_internal=strip_internal
+                    )
+                    self.__dict__.update(pack_properties)
+                    logger.info(f"Dumped pack {self.name} to {marketplace}.")
 
-        except Exception:
-            logger.exception(f"Failed dumping pack {self.name}")
-            raise
+            except Exception:
+                logger.exception(f"Failed dumping pack {self.name}")
+                raise
 
     def upload(
         self,
@@ -1,8 +1,13 @@
-from typing import Optional
+from array import array
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 from pydantic import BaseModel
 
-from demisto_sdk.commands.content_graph.common import RelationshipType
+from demisto_sdk.commands.content_graph.common import (
+    RelationshipType,
+    construct_trusted,
+)
 from demisto_sdk.commands.content_graph.objects.base_content import BaseNode
 
 
@@ -44,3 +49,306 @@ class RelationshipData(BaseModel):
     def __eq__(self, __o: object) -> bool:
         """This is needed to check if the relationship already exists"""
         return hash(self) == hash(__o)
+
+
+RELATIONSHIP_PROPERTIES = (
+    "is_direct",
+    "mandatorily",
+    "is_test",
+    "target_min_version",
+    "description",
+    "deprecated",
+    "supportedModules",
+)
+
+
+def relationship_properties(relationship: Any) -> Tuple:
+    return tuple(
+        getattr(relationship, attribute) for attribute in RELATIONSHIP_PROPERTIES
+    )
+
+
+class RelationshipView:
+    """A read-only view of a relationship stored in `CompactRelationships`.
+    Exposes the same attributes, hash and equality as `RelationshipData`.
+    """
+
+    __slots__ = (
+        "relationship_type",
+        "source_id",
+        "target_id",
+        "content_item_to",
+        *RELATIONSHIP_PROPERTIES,
+    )
+
+    def __init__(
+        self,
+        relationship_type: RelationshipType,
+        source_id: str,
+        target_id: str,
+        content_item_to: BaseNode,
+        properties: Tuple,
+    ):
+        self.relationship_type = relationship_type
+        self.source_id = source_id
+        self.target_id = target_id
+        self.content_item_to = content_item_to
+        (
+            self.is_direct,
+            self.mandatorily,
+            self.is_test,
+            self.target_min_version,
+            self.description,
+            self.deprecated,
+            self.supportedModules,
+        ) = properties
+
+    def __hash__(self):
+        return hash((self.source_id, self.target_id, self.relationship_type))
+
+    def __eq__(self, __o: object) -> bool:
+        return hash(self) == hash(__o)
+
+    def __repr__(self) -> str:
+        return f"RelationshipView({self.relationship_type}, {self.source_id} -> {self.target_id})"
+
+    def copy(self) -> RelationshipData:
+        """Returns the relationship as a standalone RelationshipData"""
+        return construct_trusted(
+            RelationshipData,
+            {attribute: getattr(self, attribute) for attribute in self.__slots__},
+        )
+
+
+class RelationshipsStore:
+    """The tables shared by the compact relationships of the nodes loaded from the content graph.
+
+    Every relationship is stored as four integers (source id, target id, target node and properties),
+    which index the database ids, the nodes and the interned relationship properties of this store.
+    """
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.nodes: List[BaseNode] = []
+        self.properties: List[Tuple] = []
+        self._id_to_index: Dict[str, int] = {}
+        self._node_to_index: Dict[int, int] = {}
+        self._properties_to_index: Dict[Tuple, int] = {}
+
+    def id_index(self, database_id: str) -> int:
+        if (index := self._id_to_index.get(database_id)) is None:
+            index = self._id_to_index[database_id] = len(self.ids)
+            self.ids.append(database_id)
+        return index
+
+    def node_index(self, node: BaseNode) -> int:
+        if (index := self._node_to_index.get(id(node))) is None:
+            index = self._node_to_index[id(node)] = len(self.nodes)
+            self.nodes.append(node)
+        return index
+
+    def properties_index(self, properties: Tuple) -> int:
+        key = properties[:-1] + (
+            None if properties[-1] is None else tuple(properties[-1]),
+        )
+        if (index := self._properties_to_index.get(key)) is None:
+            index = self._properties_to_index[key] = len(self.properties)
+            self.properties.append(properties)
+        return index
+
+
+class CompactRelationships:
+    """The relationships of a single type of a node, stored compactly in a `RelationshipsStore`.
+
+    Behaves like the set of RelationshipData it replaces: adding a relationship which already exists
+    (same source, target and type) is a no-op, and iterating yields `RelationshipView` objects.
+    """
+
+    __slots__ = (
+        "store",
+        "relationship_type",
+        "_sources",
+        "_targets",
+        "_nodes",
+        "_properties",
+        "_keys",
+    )
+
+    def __init__(
+        self, store: RelationshipsStore, relationship_type: RelationshipType
+    ) -> None:
+        self.store = store
+        self.relationship_type = relationship_type
+        self._sources = array("I")
+        self._targets = array("I")
+        self._nodes = array("I")
+        self._properties = array("I")
+        self._keys: set = set()
+
+    def add(self, relationship: Any) -> None:
+        self.add_reference(
+            relationship.source_id,
+            relationship.target_id,
+            relationship.content_item_to,
+            relationship_properties(relationship),
+        )
+
+    def add_reference(
+        self, source_id: str, target_id: str, node: BaseNode, properties: Tuple
+    ) -> None:
+        """Adds a relationship by its ids, its target node and its properties (by `RELATIONSHIP_PROPERTIES`)."""
+        source = self.store.id_index(source_id)
+        target = self.store.id_index(target_id)
+        key = source << 32 | target
+        if key in self._keys:
+            return
+        self._keys.add(key)
+        self._sources.append(source)
+        self._targets.append(target)
+        self._nodes.append(self.store.node_index(node))
+        self._properties.append(self.store.properties_index(properties))
+
+    def references(self) -> Iterator[Tuple[str, str, BaseNode, Tuple]]:
+        """The relationships as their ids, target node and properties, without creating views of them."""
+        ids, nodes, properties = (
+            self.store.ids,
+            self.store.nodes,
+            self.store.properties,
+        )
+        for source, target, node, properties_index in zip(
+            self._sources, self._targets, self._nodes, self._properties
+        ):
+            yield ids[source], ids[target], nodes[node], properties[properties_index]
+
+    def __iter__(self) -> Iterator[RelationshipView]:
+        ids, nodes, properties = (
+            self.store.ids,
+            self.store.nodes,
+            self.store.properties,
+        )
+        for source, target, node, properties_index in zip(
+            self._sources, self._targets, self._nodes, self._properties
+        ):
+            yield RelationshipView(
+                self.relationship_type,
+                ids[source],
+                ids[target],
+                nodes[node],
+                properties[properties_index],
+            )
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __contains__(self, relationship: object) -> bool:
+        if getattr(relationship, "relationship_type", None) != self.relationship_type:
+            return False
+        source = self.store._id_to_index.get(relationship.source_id)  # type: ignore[attr-defined]
+        target = self.store._id_to_index.get(relationship.target_id)  # type: ignore[attr-defined]
+        if source is None or target is None:
+            return False
+        return (source << 32 | target) in self._keys
+
+    def copy(self) -> set:
+        return set(self)
+
+
+class CompactRelationshipsData(dict):
+    """A drop-in replacement of the `relationships_data` of a BaseNode, which keeps its relationships
+    in a shared `RelationshipsStore` instead of a set of RelationshipData objects per relationship type.
+    """
+
+    def __init__(self, store: RelationshipsStore) -> None:
+        super().__init__()
+        self.store = store
+
+    def __missing__(self, relationship_type: RelationshipType) -> CompactRelationships:
+        relationships = self[relationship_type] = CompactRelationships(
+            self.store, relationship_type
+        )
+        return relationships
+
+    def copy(self) -> "CompactRelationshipsData":  # type: ignore[override]
+        relationships_data = CompactRelationshipsData(self.store)
+        relationships_data.update(self)
+        return relationships_data
+
+
+class RelationshipReferences:
+    """The `relationships_data` of a node as it is pickled (to be sent to another process), without copying models.
+
+    Every relationship is kept as its type, ids, properties and the index of its target node in a table of the
+    target nodes. Each target node is kept once, as its model state without its excluded fields (as `copy` did),
+    so neither its own relationships nor the graph around it are pickled along.
+    On unpickling, the relationships are linked again to the target nodes, in a `CompactRelationshipsData`.
+    """
+
+    __slots__ = ("relationships", "targets")
+
+    def __init__(self, relationships_data: Dict[RelationshipType, Any]) -> None:
+        self.relationships: List[Tuple[RelationshipType, str, str, int, Tuple]] = []
+        self.targets: List[Tuple[Type[BaseModel], Dict[str, Any]]] = []
+        target_indexes: Dict[int, int] = {}
+        for relationship_type, relationships in relationships_data.items():
+            references = (
+                relationships.references()
+                if isinstance(relationships, CompactRelationships)
+                else (
+                    (
+                        relationship.source_id,
+                        relationship.target_id,
+                        relationship.content_item_to,
+                        relationship_properties(relationship),
+                    )
+                    for relationship in relationships
+                )
+            )
+            for source_id, target_id, node, properties in references:
+                if (index := target_indexes.get(id(node))) is None:
+                    index = target_indexes[id(node)] = len(self.targets)
+                    self.targets.append((type(node), target_node_state(node)))
+                self.relationships.append(
+                    (relationship_type, source_id, target_id, index, properties)
+                )
+
+    def __getstate__(self):
+        return self.relationships, self.targets
+
+    def __setstate__(self, state) -> None:
+        self.relationships, self.targets = state
+
+    def link(self) -> CompactRelationshipsData:
+        """The relationships, linked to their target nodes."""
+        nodes = []
+        for model, state in self.targets:
+            node = model.__new__(model)
+            BaseModel.__setstate__(node, state)
+            node.__dict__["relationships_data"] = defaultdict(set)
+            nodes.append(node)
+        relationships_data = CompactRelationshipsData(RelationshipsStore())
+        for (
+            relationship_type,
+            source_id,
+            target_id,
+            index,
+            properties,
+        ) in self.relationships:
+            relationships_data[relationship_type].add_reference(
+                source_id, target_id, nodes[index], properties
+            )
+        return relationships_data
+
+
+def target_node_state(node: BaseNode) -> Dict[str, Any]:
+    """
+    The pickled state of the model of a relationship target node, without its excluded fields (as `copy` does),
+    which are its relationships and the nodes it belongs to or contains (e.g. the pack of a content item).
+    """
+    excluded = node.__exclude_fields__ or {}
+    state = BaseModel.__getstate__(node)
+    state["__dict__"] = {
+        key: value
+        for key, value in state["__dict__"].items()
+        if excluded.get(key) is not True
+    }
+    return state
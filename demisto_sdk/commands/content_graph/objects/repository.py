@@ -3,7 +3,7 @@ import time
 from functools import lru_cache
 from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import tqdm
 from pydantic import BaseModel, DirectoryPath
@@ -12,6 +12,8 @@ from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tracing import span
+from demisto_sdk.commands.content_graph.common import Nodes, Relationships
 from demisto_sdk.commands.content_graph.objects.connector import Connector
 from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.parsers.repository import RepositoryParser
@@ -51,6 +53,30 @@ def from_path(
             explicitly, mirroring the pack-narrowing semantics).
     """
     repo_parser = RepositoryParser(path)
+    packs, connectors = _paths_to_parse(
+        repo_parser, packs_to_parse, connectors_to_parse
+    )
+    with tqdm.tqdm(
+        total=len(packs) + len(connectors),
+        unit="items",
+        desc="Parsing packs and connectors",
+        position=0,
+        leave=True,
+    ) as progress_bar:
+        repo_parser.parse(
+            packs_to_parse=packs,
+            progress_bar=progress_bar,
+            connectors_to_parse=connectors,
+        )
+    return ContentDTO.from_orm(repo_parser)
+
+
+def _paths_to_parse(
+    repo_parser: RepositoryParser,
+    packs_to_parse: Optional[Tuple[str, ...]],
+    connectors_to_parse: Optional[Tuple[str, ...]],
+) -> Tuple[Tuple[Path, ...], Tuple[Path, ...]]:
+    """The paths of the packs and of the connectors to parse, by the narrowing matrix of `from_path`."""
     if packs_to_parse:
         packs = tuple(repo_parser.iter_packs(packs_to_parse))
     elif connectors_to_parse is not None:
@@ -66,6 +92,38 @@ def from_path(
         connectors = tuple(repo_parser.iter_connectors())
     else:
         connectors = ()
+    return packs, connectors
+
+
+def _parse_pack_graph_records(
+    pack_path: Path,
+) -> Optional[Tuple[Nodes, Relationships]]:
+    """
+    Parses a pack and converts it to its graph nodes and relationships, in the parse worker.
+    Only they are sent back to the main process, rather than the pack parser with its parsed data.
+    """
+    if not (pack_parser := RepositoryParser.parse_pack(pack_path)):
+        return None
+    with span("parse.graph_records", pack=pack_path.name):
+        pack = Pack.from_orm(pack_parser)
+        return pack.to_nodes(), pack.relationships
+
+
+def iter_graph_records(
+    path: Path = CONTENT_PATH,
+    packs_to_parse: Optional[Tuple[str, ...]] = None,
+    connectors_to_parse: Optional[Tuple[str, ...]] = None,
+) -> Iterator[Tuple[Nodes, Relationships]]:
+    """
+    Parses the packs and connectors of the content repository (narrowed as in `from_path`),
+    and yields the graph nodes and relationships of each of them as soon as it is parsed.
+
+    Unlike `from_path`, the packs are converted to their nodes and relationships in the parse workers,
+    so neither the pack parsers nor the pack models are sent to (and kept in) the main process.
+    """
+    packs, connectors = _paths_to_parse(
+        RepositoryParser(path), packs_to_parse, connectors_to_parse
+    )
     with tqdm.tqdm(
         total=len(packs) + len(connectors),
         unit="items",
@@ -73,12 +131,15 @@ def from_path(
         position=0,
         leave=True,
     ) as progress_bar:
-        repo_parser.parse(
-            packs_to_parse=packs,
-            progress_bar=progress_bar,
-            connectors_to_parse=connectors,
-        )
-    return ContentDTO.from_orm(repo_parser)
+        for graph_records in RepositoryParser.iter_parsed_packs(
+            packs, _parse_pack_graph_records
+        ):
+            progress_bar.update(1)
+            yield graph_records
+        for connector_parser in RepositoryParser.iter_parsed_connectors(connectors):
+            connector = Connector.from_orm(connector_parser)
+            progress_bar.update(1)
+            yield connector.to_nodes(), connector.relationships
 
 
 class ContentDTO(BaseModel):
@@ -97,6 +158,12 @@ class ContentDTO(BaseModel):
         """
         return from_path(path, packs_to_parse, connectors_to_parse)
 
+    def graph_records(self) -> Iterator[Tuple[Nodes, Relationships]]:
+        """The graph nodes and relationships of each of the packs and connectors."""
+        contents: List[Union[Pack, Connector]] = [*self.packs, *self.connectors]
+        for content in contents:
+            yield content.to_nodes(), content.relationships
+
     def dump(
         self,
         dir: DirectoryPath,
@@ -160,9 +227,78 @@ class ContentDTO(BaseModel):
         logger.debug(f"Repository dump ended. Took {time_taken} seconds")
 
         if zip:
-            shutil.make_archive(str(dir.parent / output_stem), "zip", dir)
+            with span("dump.zip", marketplace=marketplace.value):
+                shutil.make_archive(str(dir.parent / output_stem), "zip", dir)
             shutil.rmtree(dir)
 
+    def dump_marketplaces(
+        self,
+        dirs: Dict[MarketplaceVersions, DirectoryPath],
+        zip: bool = True,
+        packs_to_dump: Optional[list] = None,
+        output_stem: str = "content_packs",  # without extension
+        **kwargs,
+    ):
+        """Dumps all (or selected) packs to the directory of every marketplace in ``dirs``.
+
+        Same as calling ``dump`` for every marketplace, but every pack is dumped in a single pass
+        (see ``Pack.dump_marketplaces``), so the content items are read once for all the marketplaces.
+        When zipping, the archive of every marketplace is named ``<output_stem>_<marketplace>.zip``.
+
+        Args:
+            **kwargs: Optional flags forwarded to ``Pack.dump_marketplaces``.
+        """
+        for dir in dirs.values():
+            dir.mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Got packs to dump: {packs_to_dump}")
+        packs_to_dump = (
+            [pack for pack in self.packs if pack.object_id in packs_to_dump]
+            if packs_to_dump is not None
+            else self.packs
+        )
+
+        if not packs_to_dump:
+            logger.debug("didn't got packs to dump, skipping")
+            return
+
+        logger.debug(
+            f"Starting repository dump to {list(dirs)} for packs: {[pack.object_id for pack in packs_to_dump]}"
+        )
+        start_time = time.time()
+        pack_paths = [
+            (
+                pack,
+                {
+                    marketplace: dir / pack.path.name
+                    for marketplace, dir in dirs.items()
+                },
+            )
+            for pack in packs_to_dump
+        ]
+        if USE_MULTIPROCESSING:
+            from functools import partial
+
+            dump_fn = partial(Pack.dump_marketplaces, **kwargs)
+            with Pool(processes=cpu_count()) as pool:
+                pool.starmap(dump_fn, pack_paths)
+
+        else:
+            for pack, paths in pack_paths:
+                pack.dump_marketplaces(paths, **kwargs)
+
+        time_taken = time.time() - start_time
+        logger.debug(f"Repository dump ended. Took {time_taken} seconds")
+
+        if zip:
+            for marketplace, dir in dirs.items():
+                with span("dump.zip", marketplace=marketplace.value):
+                    shutil.make_archive(
+                        str(dir.parent / f"{output_stem}_{marketplace.value}"),
+                        "zip",
+                        dir,
+                    )
+                shutil.rmtree(dir)
+
     class Config:
         orm_mode = True
         allow_population_by_field_name = True
@@ -1,4 +1,6 @@
-from typing import List
+from functools import partial
+from pathlib import Path
+from typing import Callable, List
 
 import pydantic
 
@@ -35,16 +37,25 @@ class AssetsModelingRuleParser(
         In AssetModelingRule, we need to check two files: the schema json and the yml, so we override the
         method for combing all the pydantic errors from the both files.
         """
-        directory_pydantic_error = []
-        directory = self.path if self.path.is_dir() else self.path.parent
-        for file in directory.iterdir():
-            try:
-                if file.suffix == ".yml":
-                    StrictAssetsModelingRule.parse_obj(get_file(file))
-                elif file.suffix == ".json":
-                    StrictAssetsModelingRuleSchema.parse_obj(get_file(file))
-            except pydantic.error_wrappers.ValidationError as e:
-                directory_pydantic_error += [
-                    StructureError(path=file, **error) for error in e.errors()
-                ]
-        return directory_pydantic_error
+        return validate_assets_modeling_rule_structure(self.path)
+
+    @property
+    def deferred_structure_validation(self) -> Callable[[], List[StructureError]]:
+        return partial(validate_assets_modeling_rule_structure, self.path)
+
+
+def validate_assets_modeling_rule_structure(path: Path) -> List[StructureError]:
+    """Validates the structure of the assets modeling rule yml and schema json in the directory of the given path."""
+    directory_pydantic_error = []
+    directory = path if path.is_dir() else path.parent
+    for file in directory.iterdir():
+        try:
+            if file.suffix == ".yml":
+                StrictAssetsModelingRule.parse_obj(get_file(file))
+            elif file.suffix == ".json":
+                StrictAssetsModelingRuleSchema.parse_obj(get_file(file))
+        except pydantic.error_wrappers.ValidationError as e:
+            directory_pydantic_error += [
+                StructureError(path=file, **error) for error in e.errors()
+            ]
+    return directory_pydantic_error
@@ -1,10 +1,9 @@
 from abc import ABC, abstractmethod
 from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import Callable, Iterator, List, Optional, Sequence, Type, Union
 
 import pydantic
-from pydantic import Field
 
 from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.content_constant_paths import (
@@ -30,8 +29,6 @@ class BaseContentParser(ABC):
 
     def __init__(self, path: Path) -> None:
         self.path: Path = path
-        # The validate_structure method is called in the first child(JsonContentItem, YamlContentItem)
-        self.structure_errors: List[StructureError] = Field(default_factory=list)
 
     @property
     @abstractmethod
@@ -45,6 +42,23 @@ class BaseContentParser(ABC):
         """
         return validate_structure(self.strict_object, self.raw_data, self.path)
 
+    @property
+    def deferred_structure_validation(self) -> Callable[[], List[StructureError]]:
+        """
+        A callable which validates the structure of the content object when called.
+        It must not reference the parser (nor its parsed data), as it outlives it on the parsed model
+        (and is pickled with it).
+        """
+        raise NotImplementedError  # implemented in inheriting classes
+
+    @cached_property
+    def structure_errors(self) -> "StructureErrors":
+        """
+        The structure errors of the content object, read during the ST110 validation run.
+        The validation itself runs only when they are first read, as most flows (e.g. the graph creation) never read them.
+        """
+        return StructureErrors(self.deferred_structure_validation)
+
     @cached_property
     def field_mapping(self):
         return {}
@@ -91,3 +105,81 @@ def validate_structure(
     except pydantic.error_wrappers.ValidationError as e:
         return [StructureError(path=path, **error) for error in e.errors()]
     return []
+
+
+def validate_file_structure(
+    strict_object: Type[BaseStrictModel],
+    path: Path,
+    load_file: Callable[..., dict],
+    git_sha: Optional[str] = None,
+) -> List[StructureError]:
+    """Loads the file of a content item and validates its structure (see validate_structure)."""
+    return validate_structure(
+        strict_object, load_file(str(path), git_sha=git_sha), path
+    )
+
+
+class StructureErrors(Sequence[StructureError]):
+    """
+    The structure errors of a content object, computed by the given validation on first access.
+    The validation is dropped once it ran, and a pending validation is pickled as is (it is a picklable callable),
+    so parsing in worker processes never validates the structure.
+    """
+
+    __slots__ = ("_validate", "_errors")
+
+    def __init__(
+        self, validate: Optional[Callable[[], List[StructureError]]] = None
+    ) -> None:
+        self._validate = validate
+        self._errors: Optional[List[StructureError]] = None if validate else []
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Union["StructureErrors", list]) -> "StructureErrors":
+        if isinstance(value, StructureErrors):
+            return value
+        if isinstance(value, list):
+            structure_errors = cls()
+            structure_errors._errors = value
+            return structure_errors
+        raise TypeError(f"Expected StructureErrors or a list, got {type(value)}")
+
+    @property
+    def is_validated(self) -> bool:
+        return self._errors is not None
+
+    @property
+    def errors(self) -> List[StructureError]:
+        if self._errors is None:
+            self._errors = self._validate()  # type: ignore[misc]
+            self._validate = None
+        return self._errors
+
+    def __getitem__(self, index):
+        return self.errors[index]
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def __iter__(self) -> Iterator[StructureError]:
+        return iter(self.errors)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, StructureErrors):
+            other = other.errors
+        return self.errors == other
+
+    def __repr__(self) -> str:
+        if self._errors is None:
+            return f"{type(self).__name__}(<not validated>)"
+        return f"{type(self).__name__}({self._errors!r})"
+
+    def __getstate__(self):
+        return self._validate, self._errors
+
+    def __setstate__(self, state) -> None:
+        self._validate, self._errors = state
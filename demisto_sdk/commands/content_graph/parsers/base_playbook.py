@@ -2,13 +2,11 @@ from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import networkx
-
 from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.playbook_tasks_graph import PlaybookTasksGraph
 from demisto_sdk.commands.common.tools import get_value
 from demisto_sdk.commands.common.update_id_set import (
     BUILT_IN_FIELDS,
-    build_tasks_graph,
     get_fields_by_script_argument,
 )
 from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
@@ -52,7 +50,7 @@ class BasePlaybookParser(YAMLContentItemParser, content_type=ContentType.BASE_PL
         )
         self.tags: List[str] = self.yml_data.get("tags", [])
         self.is_test: bool = is_test_playbook
-        self.graph: networkx.DiGraph = build_tasks_graph(self.yml_data)
+        self.graph = PlaybookTasksGraph.from_playbook_data(self.yml_data)
         self.connect_to_dependencies()
         self.connect_to_tests()
 
@@ -73,7 +71,7 @@ class BasePlaybookParser(YAMLContentItemParser, content_type=ContentType.BASE_PL
 
     def is_mandatory_dependency(self, task_id: str) -> bool:
         try:
-            return self.graph.nodes[task_id]["mandatory"]
+            return self.graph.is_mandatory(task_id)
         except KeyError:
             # task is not connected to a branch
             return False
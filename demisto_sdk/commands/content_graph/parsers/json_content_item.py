@@ -1,6 +1,6 @@
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from demisto_sdk.commands.common.constants import (
     DEFAULT_CONTENT_ITEM_FROM_VERSION,
@@ -9,11 +9,17 @@ from demisto_sdk.commands.common.constants import (
     MarketplaceVersions,
 )
 from demisto_sdk.commands.common.tools import get_json, get_value
+from demisto_sdk.commands.content_graph.parsers.base_content import (
+    validate_file_structure,
+)
 from demisto_sdk.commands.content_graph.parsers.content_item import (
     ContentItemParser,
     InvalidContentItemException,
     NotAContentItemException,
 )
+from demisto_sdk.commands.content_graph.strict_objects.base_strict_model import (
+    StructureError,
+)
 
 
 class JSONContentItemParser(ContentItemParser):
@@ -36,7 +42,6 @@ class JSONContentItemParser(ContentItemParser):
             else self.path
         )
         self.original_json_data: Dict[str, Any] = self.json_data
-        self.structure_errors = self.validate_structure()
         self.supportedModules: List[str] = self.json_data.get(
             "supportedModules", pack_supported_modules
         )
@@ -53,6 +58,16 @@ class JSONContentItemParser(ContentItemParser):
     def raw_data(self) -> dict:
         return self.json_data
 
+    @property
+    def deferred_structure_validation(self) -> Callable[[], List[StructureError]]:
+        return partial(
+            validate_file_structure,
+            self.strict_object,
+            self.path,
+            get_json,
+            git_sha=self.git_sha,
+        )
+
     @cached_property
     def field_mapping(self):
         super().field_mapping.update(
@@ -1,6 +1,6 @@
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Callable, List, Optional, Set
 
 import pydantic
 
@@ -67,19 +67,28 @@ class ModelingRuleParser(YAMLContentItemParser, content_type=ContentType.MODELIN
         In ModelingRule, we need to check two files: the schema json and the yml, so we override the
         method for combing all the pydantic errors from the both files.
         """
-        directory_pydantic_error = []
-        directory = self.path if self.path.is_dir() else self.path.parent
-        for file in directory.iterdir():
-            # Skip testdata.json files as they have a different structure
-            if file.name.endswith("testdata.json"):
-                continue
-            try:
-                if file.suffix == ".yml":
-                    StrictModelingRule.parse_obj(get_file(file))
-                elif file.suffix == ".json":
-                    StrictModelingRuleSchema.parse_obj(get_file(file))
-            except pydantic.error_wrappers.ValidationError as e:
-                directory_pydantic_error += [
-                    StructureError(path=file, **error) for error in e.errors()
-                ]
-        return directory_pydantic_error
+        return validate_modeling_rule_structure(self.path)
+
+    @property
+    def deferred_structure_validation(self) -> Callable[[], List[StructureError]]:
+        return partial(validate_modeling_rule_structure, self.path)
+
+
+def validate_modeling_rule_structure(path: Path) -> List[StructureError]:
+    """Validates the structure of the modeling rule yml and schema json in the directory of the given path."""
+    directory_pydantic_error = []
+    directory = path if path.is_dir() else path.parent
+    for file in directory.iterdir():
+        # Skip testdata.json files as they have a different structure
+        if file.name.endswith("testdata.json"):
+            continue
+        try:
+            if file.suffix == ".yml":
+                StrictModelingRule.parse_obj(get_file(file))
+            elif file.suffix == ".json":
+                StrictModelingRuleSchema.parse_obj(get_file(file))
+        except pydantic.error_wrappers.ValidationError as e:
+            directory_pydantic_error += [
+                StructureError(path=file, **error) for error in e.errors()
+            ]
+    return directory_pydantic_error
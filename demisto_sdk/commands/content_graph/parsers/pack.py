@@ -1,7 +1,7 @@
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
 import pydantic
 import regex
@@ -297,7 +297,6 @@ class PackParser(BaseContentParser, PackMetadataParser):
             path = path.parent
         BaseContentParser.__init__(self, path)
         self.private_pack_path = private_pack_path
-        self.structure_errors: List[StructureError] = self.validate_structure()
 
         try:
             metadata = get_json(path / PACK_METADATA_FILENAME, git_sha=git_sha)
@@ -487,19 +486,28 @@ class PackParser(BaseContentParser, PackMetadataParser):
         In Pack, we need to check two files: the metadata and the RNs json files, so we override the
         method for combing all the pydantic errors from the both files.
         """
-        pydantic_error_list: List[StructureError] = []
+        return validate_pack_structure(self.path)
 
-        # validate Rn's files
-        for file in self.path.glob("ReleaseNotes/*.json"):
-            validate_structure(file, pydantic_error_list)
+    @property
+    def deferred_structure_validation(self) -> Callable[[], List[StructureError]]:
+        return partial(validate_pack_structure, self.path)
 
-        # validate pack metadata file
-        validate_structure(
-            Path(self.path, PACK_METADATA_FILENAME),
-            pydantic_error_list,
-        )
 
-        return pydantic_error_list
+def validate_pack_structure(path: Path) -> List[StructureError]:
+    """Validates the structure of the pack metadata and the release notes config files of the pack in the given path."""
+    pydantic_error_list: List[StructureError] = []
+
+    # validate Rn's files
+    for file in path.glob("ReleaseNotes/*.json"):
+        validate_structure(file, pydantic_error_list)
+
+    # validate pack metadata file
+    validate_structure(
+        Path(path, PACK_METADATA_FILENAME),
+        pydantic_error_list,
+    )
+
+    return pydantic_error_list
 
 
 def validate_structure(file: Path, pydantic_error_list: list) -> None:
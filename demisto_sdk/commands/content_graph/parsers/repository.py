@@ -1,13 +1,14 @@
 import multiprocessing
 import traceback
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar
 
 from tqdm import tqdm
 
 from demisto_sdk.commands.common.constants import CONNECTORS_FOLDER, PACKS_FOLDER
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tracing import span
 from demisto_sdk.commands.content_graph.parsers.connector import ConnectorParser
 from demisto_sdk.commands.content_graph.parsers.content_item import (
     NotAContentItemException,
@@ -16,6 +17,8 @@ from demisto_sdk.commands.content_graph.parsers.pack import PackParser
 
 IGNORED_PACKS_FOR_PARSING = ["NonSupported"]
 
+T = TypeVar("T")
+
 
 class RepositoryParser:
     """
@@ -51,38 +54,66 @@ class RepositoryParser:
             # of being silently re-expanded to a full scan.
             packs_to_parse = tuple(self.iter_packs())
         try:
-            logger.debug("Parsing packs...")
-            with multiprocessing.Pool(processes=cpu_count()) as pool:
-                for pack in pool.imap_unordered(
-                    RepositoryParser.parse_pack, packs_to_parse
-                ):
-                    if pack:
-                        self.packs.append(pack)
-                        if progress_bar:
-                            progress_bar.update(1)
+            for pack in self.iter_parsed_packs(
+                packs_to_parse, RepositoryParser.parse_pack
+            ):
+                self.packs.append(pack)
+                if progress_bar:
+                    progress_bar.update(1)
         except Exception as e:
             logger.error(e)
             logger.error(traceback.format_exc())
             raise
 
+        if connectors_to_parse is None:
+            connectors_to_parse = tuple(self.iter_connectors())
+        for connector in self.iter_parsed_connectors(connectors_to_parse):
+            self.connectors.append(connector)
+            if progress_bar:
+                progress_bar.update(1)
+
+    @staticmethod
+    def iter_parsed_packs(
+        packs_to_parse: Tuple[Path, ...],
+        parse_pack: Callable[[Path], Optional[T]],
+    ) -> Iterator[T]:
+        """Parses the packs in a pool of processes, and yields the result of each valid pack as soon as it is parsed.
+
+        Args:
+            packs_to_parse (Tuple[Path, ...]): The paths of the packs to parse.
+            parse_pack (Callable[[Path], Optional[T]]): Parses a pack in a worker, returns None for an invalid pack.
+                It is sent to the workers, so it must be picklable (e.g. a module level function).
+        """
+        logger.debug("Parsing packs...")
+        with (
+            span("parse.packs", packs=len(packs_to_parse)),
+            multiprocessing.Pool(processes=cpu_count()) as pool,
+        ):
+            for pack in pool.imap_unordered(parse_pack, packs_to_parse):
+                if pack:
+                    yield pack
+
+    @staticmethod
+    def iter_parsed_connectors(
+        connectors_to_parse: Tuple[Path, ...],
+    ) -> Iterator[ConnectorParser]:
+        """Parses the connectors, and yields each valid connector as soon as it is parsed."""
         # Connectors live outside of Packs/ and are parsed sequentially.
         # They are typically few in number (tens, not thousands) so the cost
         # of multiprocessing setup is not worth it here.
-        if connectors_to_parse is None:
-            connectors_to_parse = tuple(self.iter_connectors())
-        if connectors_to_parse:
-            logger.debug("Parsing connectors...")
+        if not connectors_to_parse:
+            return
+        logger.debug("Parsing connectors...")
+        with span("parse.connectors", connectors=len(connectors_to_parse)):
             for connector_path in connectors_to_parse:
-                connector = RepositoryParser.parse_connector(connector_path)
-                if connector:
-                    self.connectors.append(connector)
-                    if progress_bar:
-                        progress_bar.update(1)
+                if connector := RepositoryParser.parse_connector(connector_path):
+                    yield connector
 
     @staticmethod
     def parse_pack(pack_path: Path) -> Optional[PackParser]:
         try:
-            return PackParser(pack_path)
+            with span("parse.pack", pack=pack_path.name):
+                return PackParser(pack_path)
         except (NotAContentItemException, FileNotFoundError):
             logger.warning(f"Pack {pack_path.name} is not a valid pack. Skipping")
             return None
@@ -1,7 +1,7 @@
 import re
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from demisto_sdk.commands.common.constants import (
     DEFAULT_CONTENT_ITEM_FROM_VERSION,
@@ -11,11 +11,17 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.common.tools import get_value, get_yaml
 from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
+from demisto_sdk.commands.content_graph.parsers.base_content import (
+    validate_file_structure,
+)
 from demisto_sdk.commands.content_graph.parsers.content_item import (
     ContentItemParser,
     InvalidContentItemException,
     NotAContentItemException,
 )
+from demisto_sdk.commands.content_graph.strict_objects.base_strict_model import (
+    StructureError,
+)
 
 
 class YAMLContentItemParser(ContentItemParser):
@@ -43,7 +49,6 @@ class YAMLContentItemParser(ContentItemParser):
         self.supportedModules: List[str] = self.yml_data.get(
             "supportedModules", pack_supported_modules
         )
-        self.structure_errors = self.validate_structure()
         if not isinstance(self.yml_data, dict):
             raise InvalidContentItemException(
                 f"The content of {self.path} must be in a JSON dictionary format"
@@ -56,6 +61,16 @@ class YAMLContentItemParser(ContentItemParser):
     def raw_data(self) -> dict:
         return self.yml_data
 
+    @property
+    def deferred_structure_validation(self) -> Callable[[], List[StructureError]]:
+        return partial(
+            validate_file_structure,
+            self.strict_object,
+            self.path,
+            get_yaml,
+            git_sha=self.git_sha,
+        )
+
     @cached_property
     def field_mapping(self):
         super().field_mapping.update(
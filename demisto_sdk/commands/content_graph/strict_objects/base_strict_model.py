@@ -33,6 +33,7 @@ class _CommonFields(BaseStrictModel):
 
 CommonFields = create_model(
     model_name="CommonFields",
+    module=__name__,
     base_models=(
         _CommonFields,
         ID_DYNAMIC_MODEL,
@@ -68,6 +69,7 @@ HIDDEN_MARKETPLACE_V2_DYNAMIC_MODEL = create_dynamic_model(
 
 Argument = create_model(
     model_name="Argument",
+    module=__name__,
     base_models=(
         _Argument,
         NAME_DYNAMIC_MODEL,
@@ -105,7 +107,9 @@ class _Important(BaseModel):
 
 
 Important = create_model(
-    model_name="Important", base_models=(_Important, DESCRIPTION_DYNAMIC_MODEL)
+    model_name="Important",
+    module=__name__,
+    base_models=(_Important, DESCRIPTION_DYNAMIC_MODEL),
 )
 
 
@@ -154,6 +158,7 @@ class _BaseIntegrationScript(BaseStrictModel):
 
 BaseIntegrationScript = create_model(
     model_name="BaseIntegrationScript",
+    module=__name__,
     base_models=(
         _BaseIntegrationScript,
         NAME_DYNAMIC_MODEL,
@@ -206,6 +211,7 @@ class _StrictGenericIncidentType(BaseStrictModel):
 
 StrictGenericIncidentType = create_model(
     model_name="StrictGenericIncidentType",
+    module=__name__,
     base_models=(
         _StrictGenericIncidentType,
         NAME_DYNAMIC_MODEL,
@@ -80,6 +80,7 @@ class _StrictCaseField(BaseStrictModel):
 
 StrictCaseField = create_model(
     model_name="StrictCaseField",
+    module=__name__,
     base_models=(
         _StrictCaseField,
         BaseOptionalVersionJson,
@@ -44,6 +44,7 @@ class _StrictClassifier(BaseStrictModel):
 
 StrictClassifier = create_model(
     model_name="StrictClassifier",
+    module=__name__,
     base_models=(
         _StrictClassifier,
         NAME_DYNAMIC_MODEL,
@@ -25,6 +25,7 @@ class _StrictCollection(BaseStrictModel):
 
 StrictCollection = create_model(
     model_name="StrictCollection",
+    module=__name__,
     base_models=(
         _StrictCollection,
         BaseOptionalVersionYaml,
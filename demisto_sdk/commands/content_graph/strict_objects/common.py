@@ -77,13 +77,18 @@ class BaseStrictModel(BaseModel, ABC):
         return value
 
 
-def create_model(model_name: str, base_models: tuple, **kwargs) -> BaseModel:
+def create_model(
+    model_name: str, base_models: tuple, module: str = __name__, **kwargs: Any
+) -> BaseModel:
     """
     Wrapper for pydantic.create_model so type:ignore[call-overload] appears only once.
+    The module is the one the model is assigned to (as an attribute of its name), so the model is pickled by reference.
     """
-    return pydantic.create_model(
-        __model_name=model_name, __base__=base_models, **kwargs
+    model = pydantic.create_model(
+        __model_name=model_name, __base__=base_models, __module__=module, **kwargs
     )  # type:ignore[call-overload]
+    model.__qualname__ = model_name
+    return model
 
 
 def create_dynamic_model(
@@ -117,6 +122,7 @@ def create_dynamic_model(
     return create_model(
         model_name=f"Dynamic{field_name.title()}Model",
         base_models=(BaseStrictModel,),
+        module=__name__,
         **fields,
     )
 
@@ -238,6 +244,7 @@ class _LeftOrRight(BaseStrictModel):
 
 LeftOrRight = create_model(
     model_name="LeftOrRight",
+    module=__name__,
     base_models=(_LeftOrRight, VALUE_DYNAMIC_MODEL, IS_CONTEXT_DYNAMIC_MODEL),
 )
 
@@ -41,6 +41,7 @@ class _StrictCorrelationRule(BaseStrictModel):
 
 StrictCorrelationRule = create_model(
     model_name="StrictCorrelationRule",
+    module=__name__,
     base_models=(
         _StrictCorrelationRule,
         BaseOptionalVersionYaml,
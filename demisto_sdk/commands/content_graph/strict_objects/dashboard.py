@@ -77,6 +77,7 @@ class _DashboardLayout(BaseStrictModel):
 
 DashboardLayout = create_model(
     model_name="DashboardLayout",
+    module=__name__,
     base_models=(
         _DashboardLayout,
         ID_DYNAMIC_MODEL,
@@ -101,6 +102,7 @@ class _StrictDashboard(BaseStrictModel):
 
 StrictDashboard = create_model(
     model_name="StrictDashboard",
+    module=__name__,
     base_models=(
         _StrictDashboard,
         BaseOptionalVersionJson,
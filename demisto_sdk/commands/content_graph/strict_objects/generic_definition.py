@@ -25,6 +25,7 @@ class _StrictGenericDefinition(BaseStrictModel):
 
 StrictGenericDefinition = create_model(
     model_name="StrictGenericDefinition",
+    module=__name__,
     base_models=(
         _StrictGenericDefinition,
         NAME_DYNAMIC_MODEL,
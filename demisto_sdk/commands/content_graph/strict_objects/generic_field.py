@@ -71,6 +71,7 @@ class _StrictGenericField(BaseStrictModel):
 
 StrictGenericField = create_model(
     model_name="StrictGenericField",
+    module=__name__,
     base_models=(
         _StrictGenericField,
         BaseOptionalVersionJson,
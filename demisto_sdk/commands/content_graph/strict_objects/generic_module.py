@@ -42,6 +42,7 @@ class _StrictGenericModule(BaseStrictModel):
 
 StrictGenericModule = create_model(
     model_name="StrictGenericModule",
+    module=__name__,
     base_models=(
         _StrictGenericModule,
         NAME_DYNAMIC_MODEL,
@@ -16,5 +16,6 @@ class _StrictGenericType(BaseStrictModel):
 
 StrictGenericType = create_model(
     model_name="StrictGenericType",
+    module=__name__,
     base_models=(_StrictGenericType, StrictGenericIncidentType),
 )
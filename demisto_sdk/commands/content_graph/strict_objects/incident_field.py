@@ -19,7 +19,9 @@ class _Aliases(BaseStrictModel):
     type_: IncidentFieldType = Field(..., alias="type")
 
 
-Aliases = create_model(model_name="Aliases", base_models=(_Aliases, NAME_DYNAMIC_MODEL))
+Aliases = create_model(
+    model_name="Aliases", module=__name__, base_models=(_Aliases, NAME_DYNAMIC_MODEL)
+)
 
 
 class _StrictIncidentField(BaseStrictModel):
@@ -47,5 +49,6 @@ class _StrictIncidentField(BaseStrictModel):
 
 StrictIncidentField = create_model(
     model_name="StrictIncidentField",
+    module=__name__,
     base_models=(_StrictIncidentField, StrictIndicatorField),
 )
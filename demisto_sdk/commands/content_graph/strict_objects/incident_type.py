@@ -23,5 +23,6 @@ class _StrictIncidentType(BaseStrictModel):
 
 StrictIncidentType = create_model(
     model_name="StrictIncidentType",
+    module=__name__,
     base_models=(_StrictIncidentType, StrictGenericIncidentType),
 )
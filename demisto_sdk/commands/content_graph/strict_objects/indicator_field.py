@@ -64,6 +64,7 @@ class _StrictIndicatorField(BaseStrictModel):
 
 StrictIndicatorField = create_model(
     model_name="StrictIndicatorField",
+    module=__name__,
     base_models=(
         _StrictIndicatorField,
         NAME_DYNAMIC_MODEL,
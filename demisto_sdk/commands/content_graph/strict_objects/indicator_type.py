@@ -53,6 +53,7 @@ class _StrictIndicatorType(BaseStrictModel):
 
 StrictIndicatorType = create_model(
     model_name="StrictIndicatorType",
+    module=__name__,
     base_models=(
         _StrictIndicatorType,
         BaseOptionalVersionJson,
@@ -77,6 +77,7 @@ class _Configuration(BaseStrictModel):
 
 Configuration = create_model(
     model_name="Configuration",
+    module=__name__,
     base_models=(
         _Configuration,
         REQUIRED_DYNAMIC_MODEL,
@@ -119,6 +120,7 @@ class _Command(BaseStrictModel):
 
 Command = create_model(
     model_name="Command",
+    module=__name__,
     base_models=(
         _Command,
         DEPRECATED_DYNAMIC_MODEL,
@@ -157,6 +159,7 @@ class _Script(BaseStrictModel):
 
 Script = create_model(
     model_name="Script",
+    module=__name__,
     base_models=(_Script, IS_FETCH_DYNAMIC_MODEL, IS_FETCH_EVENTS_DYNAMIC_MODEL),
 )
 
@@ -167,6 +170,7 @@ class _CommonFieldsIntegration(BaseStrictModel):
 
 CommonFieldsIntegration = create_model(
     model_name="CommonFieldsIntegration",
+    module=__name__,
     base_models=(
         _CommonFieldsIntegration,
         CommonFields,
@@ -275,6 +279,7 @@ class _StrictIntegration(BaseStrictModel):
 
 StrictIntegration = create_model(
     model_name="StrictIntegration",
+    module=__name__,
     base_models=(
         _StrictIntegration,
         BaseIntegrationScript,
@@ -112,6 +112,7 @@ class _StrictJob(BaseStrictModel):
 
 StrictJob = create_model(
     model_name="StrictJob",
+    module=__name__,
     base_models=(
         _StrictJob,
         NAME_DYNAMIC_MODEL,
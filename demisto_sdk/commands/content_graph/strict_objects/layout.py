@@ -37,7 +37,9 @@ class _SectionField(BaseStrictModel):
 
 
 SectionField = create_model(
-    model_name="SectionField", base_models=(_SectionField, ID_DYNAMIC_MODEL)
+    model_name="SectionField",
+    module=__name__,
+    base_models=(_SectionField, ID_DYNAMIC_MODEL),
 )
 
 
@@ -59,6 +61,7 @@ class _Section(BaseStrictModel):
 
 Section = create_model(
     model_name="Section",
+    module=__name__,
     base_models=(
         _Section,
         ID_DYNAMIC_MODEL,
@@ -117,6 +120,7 @@ class _StrictLayout(BaseStrictModel):
 
 StrictLayout = create_model(
     model_name="StrictLayout",
+    module=__name__,
     base_models=(
         _StrictLayout,
         DESCRIPTION_DYNAMIC_MODEL,
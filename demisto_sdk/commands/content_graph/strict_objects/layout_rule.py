@@ -30,5 +30,6 @@ class _StrictLayoutRule(BaseStrictModel):
 
 StrictLayoutRule = create_model(
     model_name="StrictLayoutRule",
+    module=__name__,
     base_models=(_StrictLayoutRule, DESCRIPTION_DYNAMIC_MODEL),
 )
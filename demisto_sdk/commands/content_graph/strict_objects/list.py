@@ -46,6 +46,7 @@ class _StrictList(BaseStrictModel):
 
 StrictList = create_model(
     model_name="StrictList",
+    module=__name__,
     base_models=(
         _StrictList,
         NAME_DYNAMIC_MODEL,
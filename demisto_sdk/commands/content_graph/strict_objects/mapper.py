@@ -33,6 +33,7 @@ class _StrictMapper(BaseStrictModel):
 
 StrictMapper = create_model(
     model_name="StrictMapper",
+    module=__name__,
     base_models=(
         _StrictMapper,
         BaseOptionalVersionJson,
@@ -26,6 +26,7 @@ class _StrictModelingRule(BaseStrictModel):
 
 StrictModelingRule = create_model(
     model_name="StrictModelingRule",
+    module=__name__,
     base_models=(
         _StrictModelingRule,
         NAME_DYNAMIC_MODEL,
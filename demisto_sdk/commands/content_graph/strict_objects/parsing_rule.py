@@ -26,6 +26,7 @@ class _StrictParsingRule(BaseStrictModel):
 
 StrictParsingRule = create_model(
     model_name="StrictParsingRule",
+    module=__name__,
     base_models=(
         _StrictParsingRule,
         NAME_DYNAMIC_MODEL,
@@ -49,6 +49,7 @@ class _PlaybookOutput(BaseStrictModel):
 
 PlaybookOutput = create_model(
     model_name="PlaybookOutput",
+    module=__name__,
     base_models=(
         _PlaybookOutput,
         DESCRIPTION_DYNAMIC_MODEL,
@@ -64,6 +65,7 @@ class _OutputsSectionPlaybook(BaseStrictModel):
 
 OutputsSectionPlaybook = create_model(
     model_name="OutputsSectionPlaybook",
+    module=__name__,
     base_models=(
         _OutputsSectionPlaybook,
         NAME_DYNAMIC_MODEL,
@@ -82,6 +84,7 @@ class _PlaybookInput(BaseStrictModel):
 
 InputPlaybook = create_model(
     model_name="InputPlaybook",
+    module=__name__,
     base_models=(
         _PlaybookInput,
         KEY_DYNAMIC_MODEL,
@@ -101,6 +104,7 @@ class _PlaybookInputsSection(BaseStrictModel):
 
 InputsSectionPlaybook = create_model(
     model_name="InputsSectionPlaybook",
+    module=__name__,
     base_models=(
         _PlaybookInputsSection,
         NAME_DYNAMIC_MODEL,
@@ -121,6 +125,7 @@ class _ArgFilter(BaseStrictModel):
 
 ArgFilter = create_model(
     model_name="ArgFilter",
+    module=__name__,
     base_models=(_ArgFilter, RIGHT_DYNAMIC_MODEL, LEFT_DYNAMIC_MODEL),
 )
 
@@ -184,6 +189,7 @@ class _SubTaskPlaybook(BaseStrictModel):
 
 SubTaskPlaybook = create_model(
     model_name="SubTaskPlaybook",
+    module=__name__,
     base_models=(
         _SubTaskPlaybook,
         NAME_DYNAMIC_MODEL,
@@ -206,6 +212,7 @@ class _Loop(BaseStrictModel):
 
 Loop = create_model(
     model_name="Loop",
+    module=__name__,
     base_models=(
         _Loop,
         SCRIPT_ID_DYNAMIC_MODEL,
@@ -267,6 +274,7 @@ class _TaskPlaybook(BaseStrictModel):
 
 TaskPlaybook = create_model(
     model_name="TaskPlaybook",
+    module=__name__,
     base_models=(
         _TaskPlaybook,
         FORM_DYNAMIC_MODEL,
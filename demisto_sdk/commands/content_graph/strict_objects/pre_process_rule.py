@@ -52,6 +52,7 @@ class _StrictPreProcessRule(BaseStrictModel):
 
 StrictPreProcessRule = create_model(
     model_name="StrictPreProcessRule",
+    module=__name__,
     base_models=(
         _StrictPreProcessRule,
         NAME_DYNAMIC_MODEL,
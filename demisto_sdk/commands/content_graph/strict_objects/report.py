@@ -43,7 +43,9 @@ class _Widget(BaseStrictModel):
 
 
 Widget = create_model(
-    model_name="Widget", base_models=(_Widget, NAME_DYNAMIC_MODEL, ID_DYNAMIC_MODEL)
+    model_name="Widget",
+    module=__name__,
+    base_models=(_Widget, NAME_DYNAMIC_MODEL, ID_DYNAMIC_MODEL),
 )
 
 
@@ -57,7 +59,9 @@ class _Layout(BaseStrictModel):
     widget: Optional[Widget] = None  # type:ignore[valid-type]
 
 
-Layout = create_model(model_name="Layout", base_models=(_Layout, ID_DYNAMIC_MODEL))
+Layout = create_model(
+    model_name="Layout", module=__name__, base_models=(_Layout, ID_DYNAMIC_MODEL)
+)
 
 
 class _Dashboard(BaseStrictModel):
@@ -74,6 +78,7 @@ class _Dashboard(BaseStrictModel):
 
 Dashboard = create_model(
     model_name="Dashboard",
+    module=__name__,
     base_models=(_Dashboard, NAME_DYNAMIC_MODEL, ID_DYNAMIC_MODEL),
 )
 
@@ -85,7 +90,9 @@ class _DecoderItem(BaseStrictModel):
 
 
 DecoderItem = create_model(
-    model_name="DecoderItem", base_models=(_DecoderItem, DESCRIPTION_DYNAMIC_MODEL)
+    model_name="DecoderItem",
+    module=__name__,
+    base_models=(_DecoderItem, DESCRIPTION_DYNAMIC_MODEL),
 )
 
 
@@ -128,6 +135,7 @@ class _StrictReport(BaseStrictModel):
 
 StrictReport = create_model(
     model_name="StrictReport",
+    module=__name__,
     base_models=(
         _StrictReport,
         BaseOptionalVersionJson,
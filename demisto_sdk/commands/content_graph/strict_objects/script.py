@@ -180,6 +180,7 @@ class _StrictScript(BaseIntegrationScript):  # type:ignore[misc,valid-type]
 
 StrictScript = create_model(
     model_name="StrictScript",
+    module=__name__,
     base_models=(
         _StrictScript,
         COMMENT_DYNAMIC_MODEL,
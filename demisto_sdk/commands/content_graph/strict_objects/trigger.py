@@ -66,6 +66,7 @@ class _StrictTrigger(BaseStrictModel):
 
 StrictTrigger = create_model(
     model_name="StrictTrigger",
+    module=__name__,
     base_models=(
         _StrictTrigger,
         BaseOptionalVersionJson,
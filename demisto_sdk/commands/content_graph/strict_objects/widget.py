@@ -45,6 +45,7 @@ class _StrictWidget(BaseStrictModel):
 
 StrictWidget = create_model(
     model_name="StrictWidget",
+    module=__name__,
     base_models=(
         _StrictWidget,
         BaseOptionalVersionJson,
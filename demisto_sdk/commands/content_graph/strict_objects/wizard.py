@@ -27,6 +27,7 @@ class _Integrations(BaseStrictModel):
 
 Integrations = create_model(
     model_name="Integrations",
+    module=__name__,
     base_models=(
         _Integrations,
         NAME_DYNAMIC_MODEL,
@@ -42,6 +43,7 @@ class _Playbook(BaseStrictModel):
 
 Playbook = create_model(
     model_name="Playbook",
+    module=__name__,
     base_models=(
         _Playbook,
         NAME_DYNAMIC_MODEL,
@@ -55,7 +57,9 @@ class _NextWizard(BaseStrictModel):
 
 
 NextWizard = create_model(
-    model_name="NextWizard", base_models=(_NextWizard, NAME_DYNAMIC_MODEL)
+    model_name="NextWizard",
+    module=__name__,
+    base_models=(_NextWizard, NAME_DYNAMIC_MODEL),
 )
 
 
@@ -93,6 +97,7 @@ class _StrictWizard(BaseStrictModel):
 
 StrictWizard = create_model(
     model_name="StrictWizard",
+    module=__name__,
     base_models=(
         _StrictWizard,
         NAME_DYNAMIC_MODEL,
@@ -25,6 +25,7 @@ class _StrictXDRCTemplate(BaseStrictModel):
 
 StrictXDRCTemplate = create_model(
     model_name="StrictXDRCTemplate",
+    module=__name__,
     base_models=(
         _StrictXDRCTemplate,
         BaseOptionalVersionJson,
@@ -26,6 +26,7 @@ class _Layout(BaseStrictModel):
 
 Layout = create_model(
     model_name="Layout",
+    module=__name__,
     base_models=(
         _Layout,
         SUFFIXED_ID_DYNAMIC_MODEL,
@@ -46,6 +47,7 @@ class _DashboardsData(BaseStrictModel):
 
 DashboardsData = create_model(
     model_name="DashboardsData",
+    module=__name__,
     base_models=(
         _DashboardsData,
         NAME_DYNAMIC_MODEL,
@@ -66,6 +68,7 @@ class _WidgetsData(BaseStrictModel):
 
 WidgetsData = create_model(
     model_name="WidgetsData",
+    module=__name__,
     base_models=(
         _WidgetsData,
         DESCRIPTION_DYNAMIC_MODEL,
@@ -87,6 +90,7 @@ class _StrictXSIAMDashboard(BaseStrictModel):
 
 StrictXSIAMDashboard = create_model(
     model_name="StrictXSIAMDashboard",
+    module=__name__,
     base_models=(
         _StrictXSIAMDashboard,
         BaseOptionalVersionJson,
@@ -25,6 +25,7 @@ class _Layout(BaseStrictModel):
 
 Layout = create_model(
     model_name="Layout",
+    module=__name__,
     base_models=(
         _Layout,
         SUFFIXED_ID_DYNAMIC_MODEL,
@@ -61,6 +62,7 @@ class _WidgetsData(BaseStrictModel):
 
 WidgetsData = create_model(
     model_name="WidgetsData",
+    module=__name__,
     base_models=(
         _WidgetsData,
         DESCRIPTION_DYNAMIC_MODEL,
@@ -76,6 +78,7 @@ class _StrictXSIAMReport(BaseStrictModel):
 
 StrictXSIAMReport = create_model(
     model_name="StrictXSIAMReport",
+    module=__name__,
     base_models=(
         _StrictXSIAMReport,
         BaseOptionalVersionJson,
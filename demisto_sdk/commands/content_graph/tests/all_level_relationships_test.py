@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from demisto_sdk.commands.content_graph.interface.neo4j.queries import dependencies
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.dependencies import (
+    get_all_level_relationships_table,
+    reachable_nodes,
+)
+
+
+@pytest.mark.parametrize(
+    "edges, max_depth, expected",
+    [
+        pytest.param(
+            [("A", "B"), ("B", "C"), ("C", "D")],
+            5,
+            {"A": ["B", "C", "D"], "B": ["C", "D"], "C": ["D"]},
+            id="chain",
+        ),
+        pytest.param(
+            [("A", "B"), ("B", "C"), ("C", "D")],
+            2,
+            {"A": ["B", "C"], "B": ["C", "D"], "C": ["D"]},
+            id="depth limit",
+        ),
+        pytest.param(
+            [("A", "B"), ("B", "A"), ("B", "C")],
+            5,
+            {"A": ["B", "C"], "B": ["A", "C"]},
+            id="cycle does not include the source",
+        ),
+        pytest.param([], 5, {}, id="no edges"),
+    ],
+)
+def test_reachable_nodes(edges, max_depth, expected):
+    """
+    Given:
+        - Edges of a directed graph and a maximal depth.
+    When:
+        - Computing the nodes reachable from every node.
+    Then:
+        - Ensure every node maps to the nodes reachable within max_depth hops, excluding itself.
+    """
+    assert reachable_nodes(edges, max_depth) == expected
+
+
+def test_get_all_level_relationships_table(mocker):
+    """
+    Given:
+        - Packs A -> B -> C where C is not in marketplacev2, and an API module imported by a script
+          which is imported by an integration.
+    When:
+        - Computing the all level relationships table.
+    Then:
+        - Ensure the xsoar dependencies include all levels.
+        - Ensure the marketplacev2 dependencies do not pass through packs of other marketplaces.
+        - Ensure the importers of the API module include all levels.
+    """
+    query_results = [
+        [
+            {"node_id": "Pack:A", "marketplaces": ["xsoar", "marketplacev2"]},
+            {"node_id": "Pack:B", "marketplaces": ["xsoar", "marketplacev2"]},
+            {"node_id": "Pack:C", "marketplaces": ["xsoar"]},
+        ],
+        [
+            {"source": "Pack:A", "target": "Pack:B"},
+            {"source": "Pack:B", "target": "Pack:C"},
+        ],
+        [
+            {"source": "Script:ApiModule", "target": "Script:Helper"},
+            {"source": "Script:Helper", "target": "Integration:Integ"},
+        ],
+    ]
+    mocker.patch.object(dependencies, "run_query", side_effect=query_results)
+
+    table = get_all_level_relationships_table(MagicMock())
+
+    assert table["depends_on"]["xsoar"] == {
+        "Pack:A": ["Pack:B", "Pack:C"],
+        "Pack:B": ["Pack:C"],
+    }
+    assert table["depends_on"]["marketplacev2"] == {"Pack:A": ["Pack:B"]}
+    assert table["imported_by"]["Script:ApiModule"] == [
+        "Integration:Integ",
+        "Script:Helper",
+    ]
@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 import pytest
+from pydantic import BaseModel, ValidationError, root_validator
 from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedScalarString is OK
     FoldedScalarString,
 )
@@ -8,7 +9,9 @@ from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedSc
 from demisto_sdk.commands.content_graph.common import (
     ContentType,
     MarketplaceVersions,
+    RelationshipType,
     append_supported_modules,
+    construct_trusted,
     replace_marketplace_references,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
@@ -416,3 +419,117 @@ def test_append_supported_modules(
     )
     assert id(result) == original_id
     assert result == expected
+
+
+SCRIPT_NODE = {
+    "object_id": "SampleScript",
+    "node_id": "Script:SampleScript",
+    "content_type": "Script",
+    "source_repo": "content",
+    "path": "Packs/SamplePack/Scripts/SampleScript/SampleScript.yml",
+    "marketplaces": ["xsoar", "marketplacev2"],
+    "name": "SampleScript",
+    "display_name": "SampleScript",
+    "fromversion": "5.0.0",
+    "toversion": "99.99.99",
+    "deprecated": False,
+    "type": "python3",
+    "docker_image": "demisto/python3:3.10.11.54799",
+    "tags": ["transformer"],
+    "skip_prepare": [],
+    "is_test": False,
+    "not_in_repository": False,
+}
+
+
+def test_construct_trusted_equals_parse_obj():
+    """
+    Given:
+        - A script node, as returned from the content graph.
+    When:
+        - Constructing the Script model with construct_trusted.
+    Then:
+        - Make sure the model is equal to the one parsed with parse_obj, including the validated fields.
+    """
+    from demisto_sdk.commands.content_graph.objects.script import Script
+
+    expected = Script.parse_obj(SCRIPT_NODE)
+    script = construct_trusted(Script, SCRIPT_NODE)
+
+    assert script.__dict__ == expected.__dict__
+    assert script.__fields_set__ == expected.__fields_set__
+    assert script.marketplaces == [
+        MarketplaceVersions.XSOAR,
+        MarketplaceVersions.MarketplaceV2,
+    ]
+
+
+def test_construct_trusted_invalid_data():
+    """
+    Given:
+        - A script node without the required node_id field.
+    When:
+        - Constructing the Script model with construct_trusted.
+    Then:
+        - Make sure the pydantic ValidationError is raised, as in parse_obj.
+    """
+    from demisto_sdk.commands.content_graph.objects.script import Script
+
+    node = dict(SCRIPT_NODE)
+    node.pop("node_id")
+    with pytest.raises(ValidationError):
+        construct_trusted(Script, node)
+
+
+def test_construct_trusted_relationship():
+    """
+    Given:
+        - Relationship data with a relationship type string and a target content item.
+    When:
+        - Constructing the RelationshipData model with construct_trusted.
+    Then:
+        - Make sure the relationship type is converted to RelationshipType.
+        - Make sure the target content item is kept as-is rather than copied.
+    """
+    from demisto_sdk.commands.content_graph.objects.relationship import (
+        RelationshipData,
+    )
+    from demisto_sdk.commands.content_graph.objects.script import Script
+
+    script = construct_trusted(Script, SCRIPT_NODE)
+    relationship = construct_trusted(
+        RelationshipData,
+        {
+            "relationship_type": "USES",
+            "source_id": "1",
+            "target_id": "2",
+            "content_item_to": script,
+            "mandatorily": True,
+        },
+    )
+
+    assert relationship.relationship_type == RelationshipType.USES
+    assert relationship.content_item_to is script
+    assert relationship.mandatorily
+    assert not relationship.is_test
+
+
+def test_construct_trusted_root_validator():
+    """
+    Given:
+        - A model with a root validator.
+    When:
+        - Constructing the model with construct_trusted.
+    Then:
+        - Make sure the model is parsed with parse_obj, so the root validator is applied.
+    """
+
+    class ModelWithRootValidator(BaseModel):
+        name: str
+
+        @root_validator
+        def upper_name(cls, values):
+            values["name"] = values["name"].upper()
+            return values
+
+    assert construct_trusted(ModelWithRootValidator, {"name": "test"}).name == "TEST"
@@ -0,0 +1,176 @@
+import pickle
+from collections import defaultdict
+
+from demisto_sdk.commands.content_graph.common import RelationshipType
+from demisto_sdk.commands.content_graph.objects.relationship import (
+    CompactRelationshipsData,
+    RelationshipData,
+    RelationshipsStore,
+    RelationshipView,
+)
+from demisto_sdk.commands.content_graph.tests.create_content_graph_test import (
+    mock_integration,
+    mock_pack,
+    mock_script,
+)
+
+
+def test_compact_relationships_behave_like_set():
+    """
+    Given:
+        - A script with compact relationships data, using two other scripts, one of them twice.
+    When:
+        - Adding the USES relationships and reading them back.
+    Then:
+        - Ensure duplicated relationships are added once.
+        - Ensure the relationships are returned as views with the same attributes.
+        - Ensure the relationship properties are interned in the store.
+        - Ensure membership checks work with RelationshipData objects.
+    """
+    store = RelationshipsStore()
+    script = mock_script("Script")
+    script.relationships_data = CompactRelationshipsData(store)
+    used_scripts = [mock_script("UsedScript1"), mock_script("UsedScript2")]
+    relationships = [
+        RelationshipData(
+            relationship_type=RelationshipType.USES,
+            source_id="1",
+            target_id=str(index),
+            content_item_to=used_script,
+            mandatorily=True,
+        )
+        for index, used_script in enumerate(used_scripts, start=2)
+    ]
+    for relationship in relationships + relationships[:1]:
+        script.add_relationship(RelationshipType.USES, relationship)
+
+    uses = script.relationships_data[RelationshipType.USES]
+    assert len(uses) == 2
+    assert all(isinstance(relationship, RelationshipView) for relationship in uses)
+    assert [relationship.content_item_to for relationship in uses] == used_scripts
+    assert [relationship.target_id for relationship in uses] == ["2", "3"]
+    assert all(relationship.mandatorily for relationship in uses)
+    assert len(store.properties) == 1
+    assert relationships[0] in uses
+    assert set(uses) == set(relationships)
+    assert script.relationships_data.get(RelationshipType.IMPORTS) is None
+
+
+def test_compact_relationships_properties():
+    """
+    Given:
+        - An integration with compact relationships data and a HAS_COMMAND relationship with properties.
+    When:
+        - Setting the integration commands from its relationships.
+    Then:
+        - Ensure the commands are set from the relationship properties.
+    """
+    integration = mock_integration()
+    integration.database_id = "1"
+    integration.relationships_data = CompactRelationshipsData(RelationshipsStore())
+    command = integration.commands[0]
+    command.database_id = "2"
+    integration.add_relationship(
+        RelationshipType.HAS_COMMAND,
+        RelationshipData(
+            relationship_type=RelationshipType.HAS_COMMAND,
+            source_id="1",
+            target_id="2",
+            content_item_to=command,
+            description="A command",
+            deprecated=True,
+            supportedModules=["module"],
+        ),
+    )
+
+    integration.set_commands()
+
+    assert integration.commands[0].name == "test-command"
+    assert integration.commands[0].description == "A command"
+    assert integration.commands[0].deprecated
+    assert integration.commands[0].supportedModules == ["module"]
+
+
+def test_compact_relationships_pickle():
+    """
+    Given:
+        - A script with compact relationships data, using a script which has relationships of its own.
+    When:
+        - Pickling and unpickling the script.
+    Then:
+        - Ensure the unpickled script has the relationships linked to a copy of the used script,
+          in compact relationships data of its own.
+        - Ensure the used script is unpickled without its relationships.
+    """
+    store = RelationshipsStore()
+    script = mock_script("Script")
+    script.relationships_data = CompactRelationshipsData(store)
+    used_script = mock_script("UsedScript")
+    used_script.relationships_data = CompactRelationshipsData(store)
+    used_script.add_relationship(
+        RelationshipType.USES,
+        RelationshipData(
+            relationship_type=RelationshipType.USES,
+            source_id="2",
+            target_id="1",
+            content_item_to=script,
+        ),
+    )
+    script.add_relationship(
+        RelationshipType.USES,
+        RelationshipData(
+            relationship_type=RelationshipType.USES,
+            source_id="1",
+            target_id="2",
+            content_item_to=used_script,
+            mandatorily=True,
+        ),
+    )
+
+    unpickled_script = pickle.loads(pickle.dumps(script))
+
+    assert isinstance(unpickled_script.relationships_data, CompactRelationshipsData)
+    assert unpickled_script.relationships_data.store is not store
+    (relationship,) = unpickled_script.relationships_data[RelationshipType.USES]
+    assert (relationship.source_id, relationship.target_id) == ("1", "2")
+    assert relationship.mandatorily
+    assert relationship.content_item_to is not used_script
+    assert relationship.content_item_to.object_id == "UsedScript"
+    assert relationship.content_item_to.relationships_data == defaultdict(set)
+
+
+def test_relationships_pickled_by_reference():
+    """
+    Given:
+        - A script in a pack, with relationships data of RelationshipData sets, using another script
+          by two relationship types.
+    When:
+        - Pickling and unpickling the script.
+    Then:
+        - Ensure both relationships are linked to the same unpickled used script.
+        - Ensure the used script is unpickled without its excluded fields (its pack and relationships),
+          as models are copied.
+    """
+    script = mock_script("Script")
+    used_script = mock_script("UsedScript")
+    used_script.pack = mock_pack()
+    uses_relationship = RelationshipData(
+        relationship_type=RelationshipType.USES,
+        source_id="1",
+        target_id="2",
+        content_item_to=used_script,
+    )
+    script.add_relationship(RelationshipType.USES, uses_relationship)
+    script.add_relationship(
+        RelationshipType.IMPORTS,
+        uses_relationship.copy(update={"relationship_type": RelationshipType.IMPORTS}),
+    )
+
+    unpickled_script = pickle.loads(pickle.dumps(script))
+
+    (uses,) = unpickled_script.relationships_data[RelationshipType.USES]
+    (imports,) = unpickled_script.relationships_data[RelationshipType.IMPORTS]
+    assert uses.content_item_to is imports.content_item_to
+    assert uses.content_item_to.dict() == used_script.copy().dict()
+    assert "pack" not in uses.content_item_to.__dict__
+    assert uses.content_item_to.relationships_data == defaultdict(set)
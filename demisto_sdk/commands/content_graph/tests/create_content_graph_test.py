@@ -15,6 +15,9 @@ from demisto_sdk.commands.content_graph.common import (
     Relationships,
     RelationshipType,
 )
+from demisto_sdk.commands.content_graph.content_graph_builder import (
+    ContentGraphBuilder,
+)
 from demisto_sdk.commands.content_graph.objects import IncidentField, Layout, Mapper
 from demisto_sdk.commands.content_graph.objects.classifier import Classifier
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
@@ -44,8 +47,8 @@ def repository(mocker):
         packs=[],
     )
     mocker.patch(
-        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._create_content_dto",
-        return_value=repository,
+        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._parse_graph_records",
+        side_effect=lambda *args, **kwargs: repository.graph_records(),
     )
     return repository
 
@@ -976,3 +979,36 @@ def test_add_relationship__to_Pydentic_and_back___assertion_error(
             mandatorily=mandatorily,
         )
         assert e._assert_start_repr == "AssertionError('assert "
+
+
+def test_create_graph_in_bulk(repository: ContentDTO, mocker):
+    """
+    Given:
+        - A repository with a pack of an integration.
+        - A content graph builder in bulk import mode.
+    When:
+        - Initializing the database and creating the graph.
+    Then:
+        - The indexes and constraints are not created before the graph (the bulk import creates them).
+        - The nodes and relationships are created in bulk, and not in transactions.
+    """
+    pack = mock_pack(repository=repository)
+    mock_integration(pack=pack)
+    content_graph = mocker.MagicMock()
+
+    builder = ContentGraphBuilder(content_graph, bulk_import=True)
+    builder.init_database()
+    builder.create_graph()
+
+    content_graph.clean_graph.assert_called_once()
+    content_graph.create_indexes_and_constraints.assert_not_called()
+    content_graph.create_nodes.assert_not_called()
+    content_graph.create_relationships.assert_not_called()
+    nodes, relationships = content_graph.create_graph_in_bulk.call_args.args
+    assert [node["object_id"] for node in nodes[ContentType.PACK]] == ["SamplePack"]
+    assert [node["object_id"] for node in nodes[ContentType.INTEGRATION]] == [
+        "SampleIntegration"
+    ]
+    assert RelationshipType.IN_PACK in relationships
+    assert RelationshipType.HAS_COMMAND in relationships
+    content_graph.remove_non_repo_items.assert_called_once()
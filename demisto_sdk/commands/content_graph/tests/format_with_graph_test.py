@@ -291,7 +291,7 @@ def repository(mocker, repo) -> ContentDTO:
 
     def mock__create_content_dto(packs_to_update: List[str], **kwargs) -> ContentDTO:
         # **kwargs absorbs the keyword-only ``connectors`` parameter that
-        # ContentGraphBuilder._create_content_dto now accepts.
+        # ContentGraphBuilder._parse_graph_records accepts.
         if not packs_to_update:
             return repository
         repo_copy = repository.copy()
@@ -299,8 +299,10 @@ def repository(mocker, repo) -> ContentDTO:
         return repo_copy
 
     mocker.patch(
-        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._create_content_dto",
-        side_effect=mock__create_content_dto,
+        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._parse_graph_records",
+        side_effect=lambda *args, **kwargs: mock__create_content_dto(
+            *args, **kwargs
+        ).graph_records(),
     )
     return repository
 
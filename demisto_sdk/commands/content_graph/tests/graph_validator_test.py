@@ -374,8 +374,8 @@ def repository(mocker) -> ContentDTO:
     pack4.content_items.playbook.append(mock_playbook("SamplePlaybook"))
     repository.packs.extend([pack1, pack2, pack3, pack4])
     mocker.patch(
-        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._create_content_dto",
-        return_value=repository,
+        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._parse_graph_records",
+        side_effect=lambda *args, **kwargs: repository.graph_records(),
     )
     return repository
 
@@ -1,8 +1,53 @@
+from pathlib import Path
 from typing import List
 
 import pytest
 
-from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    GraphExportFormat,
+    RelationshipType,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j import neo4j_graph
+from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
+    Neo4jImportHandler,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
+    Neo4jContentGraphInterface,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.constraints import (
+    create_constraints,
+    drop_constraints,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.import_export import (
+    create_import_id_index,
+    drop_import_id_index,
+    export_graphml,
+    import_graphml,
+    import_json_lines,
+    merge_duplicate_commands,
+    merge_duplicate_commands_in_batches,
+    merge_duplicate_content_items,
+    merge_duplicate_content_items_in_batches,
+    remove_import_ids,
+    to_batch_query,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.nodes import (
+    build_create_nodes_query,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.relationships import (
+    build_relationships_query,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.snapshot import (
+    delete_snapshot,
+    pop_snapshot,
+    save_snapshot,
+)
+from demisto_sdk.commands.content_graph.objects.repository import (
+    _parse_pack_graph_records,
+)
+from TestSuite.repo import Repo
 
 
 class TestNeo4jQueries:
@@ -72,3 +117,208 @@ class TestNeo4jQueries:
             )
             == "{object_id: rel_data.source_id, content_type: rel_data.source_type}"
         )
+
+    @pytest.mark.parametrize(
+        "query, variable",
+        [
+            (build_create_nodes_query(content_type), "node_data")
+            for content_type in ContentType
+        ]
+        + [
+            (build_relationships_query(relationship), "rel_data")
+            for relationship in RelationshipType
+        ],
+    )
+    def test_to_batch_query(self, query: str, variable: str):
+        """
+        Given:
+            - A query creating nodes or relationships of the rows of the `$data` parameter.
+        When:
+            - Converting it to a query of the batches of a bulk load.
+        Then:
+            - Make sure the query unwinds the `$_batch` rows, and the rest of it is unchanged.
+        """
+        batch_query = to_batch_query(query, variable)
+
+        assert "$data" not in batch_query
+        assert (
+            f"UNWIND $_batch AS row\nWITH row.{variable} AS {variable}" in batch_query
+        )
+        assert (
+            batch_query.replace(
+                f"UNWIND $_batch AS row\nWITH row.{variable} AS {variable}",
+                f"UNWIND $data AS {variable}",
+            )
+            == query
+        )
+
+    def test_to_batch_query_without_data(self):
+        """
+        Given:
+            - A query which does not unwind the `$data` parameter.
+        When:
+            - Converting it to a query of the batches of a bulk load.
+        Then:
+            - Make sure a ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            to_batch_query("MATCH (n) RETURN n", "node_data")
+
+
+def test_write_bulk_import_files(graph_repo: Repo, tmp_path: Path, mocker):
+    """
+    Given:
+        - The nodes and relationships of a pack with an integration, a script and a playbook.
+        - An import dir with a GraphML file.
+    When:
+        - Writing the nodes and relationships of every type to bulk import files, and then removing them.
+    Then:
+        - Make sure every file has a JSON line of every node or relationship data.
+        - Make sure only the bulk import files are removed.
+    """
+    pack = graph_repo.create_pack("BulkPack")
+    pack.create_integration("BulkIntegration").create_default_integration()
+    pack.create_script("BulkScript").create_default_script()
+    pack.create_playbook("BulkPlaybook").create_default_playbook()
+    nodes, relationships = _parse_pack_graph_records(Path(pack.path))
+    import_handler = Neo4jImportHandler()
+    mocker.patch.object(import_handler, "import_path", tmp_path)
+    (tmp_path / "content.graphml").touch()
+
+    for name, data in [
+        *((f"nodes_{content_type}", rows) for content_type, rows in nodes.items()),
+        *(
+            (f"relationships_{relationship}", rows)
+            for relationship, rows in relationships.items()
+        ),
+    ]:
+        filename = import_handler.write_bulk_import_file(name, data)
+        with open(tmp_path / filename) as bulk_file:
+            assert [json.loads(line) for line in bulk_file] == data
+
+    assert len(list(tmp_path.iterdir())) == len(nodes) + len(relationships) + 1
+    import_handler.remove_bulk_import_files()
+    assert [file.name for file in tmp_path.iterdir()] == ["content.graphml"]
+
+
+def test_import_graph_concurrently(tmp_path: Path, mocker):
+    """
+    Given:
+        - An import dir with a GraphML file, two JSON lines files and a bulk import file.
+    When:
+        - Importing the graph.
+    Then:
+        - Make sure every graph file is imported in a session of its own, and every JSON lines file has its own source.
+        - Make sure the constraints are dropped and the import id index is created before the files are imported.
+        - Make sure the import ids are removed, and the duplicate nodes are merged, after the files are imported.
+    """
+    for filename in (
+        "content.graphml",
+        "private.jsonl.gz",
+        "connectors.jsonl.gz",
+        "bulk_nodes_Pack.jsonl",
+    ):
+        (tmp_path / filename).touch()
+    import_handler = Neo4jImportHandler()
+    mocker.patch.object(import_handler, "import_path", tmp_path)
+    interface = Neo4jContentGraphInterface.__new__(Neo4jContentGraphInterface)
+    interface._import_handler = import_handler
+    interface.driver = mocker.MagicMock()
+    mocker.patch.object(
+        Neo4jContentGraphInterface, "_has_infra_graph_been_changed", return_value=False
+    )
+
+    assert interface.import_graph()
+
+    session = interface.driver.session.return_value.__enter__.return_value
+    transactions = [call.args for call in session.execute_write.call_args_list]
+    imports = transactions[2:5]
+    assert sorted(imports, key=str) == sorted(
+        [
+            (import_graphml, ["content.graphml"]),
+            (import_json_lines, "connectors.jsonl.gz", 1),
+            (import_json_lines, "private.jsonl.gz", 2),
+        ],
+        key=str,
+    )
+    assert transactions[:2] == [(drop_constraints,), (create_import_id_index,)]
+    assert transactions[5:] == [
+        (remove_import_ids,),
+        (drop_import_id_index,),
+        (delete_snapshot,),
+        (merge_duplicate_commands_in_batches,),
+        (create_constraints,),
+        (merge_duplicate_content_items_in_batches,),
+    ]
+    assert interface.driver.session.call_count == 5
+
+
+def test_import_graphml_files(tmp_path: Path, mocker):
+    """
+    Given:
+        - An import dir with two GraphML files and a bulk import file.
+    When:
+        - Importing the graph.
+    Then:
+        - Make sure the GraphML files are imported in a single session, one after another.
+        - Make sure the duplicate nodes are merged without batches.
+    """
+    for filename in ("content.graphml", "private.graphml"):
+        (tmp_path / filename).write_text(
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns"><graph/></graphml>'
+        )
+    (tmp_path / "bulk_nodes_Pack.jsonl").touch()
+    import_handler = Neo4jImportHandler()
+    mocker.patch.object(import_handler, "import_path", tmp_path)
+    interface = Neo4jContentGraphInterface.__new__(Neo4jContentGraphInterface)
+    interface._import_handler = import_handler
+    interface.driver = mocker.MagicMock()
+    mocker.patch.object(
+        Neo4jContentGraphInterface, "_has_infra_graph_been_changed", return_value=False
+    )
+
+    assert interface.import_graph()
+
+    session = interface.driver.session.return_value.__enter__.return_value
+    transactions = [call.args for call in session.execute_write.call_args_list]
+    assert transactions[0] == (drop_constraints,)
+    assert transactions[1][0] is import_graphml
+    assert sorted(transactions[1][1]) == ["content.graphml", "private.graphml"]
+    assert transactions[2:] == [
+        (delete_snapshot,),
+        (merge_duplicate_commands,),
+        (create_constraints,),
+        (merge_duplicate_content_items,),
+    ]
+    assert interface.driver.session.call_count == 1
+
+
+def test_export_graph_without_snapshot(tmp_path: Path, mocker):
+    """
+    Given:
+        - A graph with a recorded snapshot.
+    When:
+        - Exporting the graph.
+    Then:
+        - Make sure the snapshot is removed before the graph is exported, and recorded again after it.
+    """
+    import_handler = Neo4jImportHandler()
+    mocker.patch.object(import_handler, "import_path", tmp_path)
+    interface = Neo4jContentGraphInterface.__new__(Neo4jContentGraphInterface)
+    interface._import_handler = import_handler
+    interface.driver = mocker.MagicMock()
+    mocker.patch.object(Neo4jContentGraphInterface, "dump_metadata")
+    mocker.patch.object(neo4j_graph, "NEO4J_EXPORT_FORMAT", GraphExportFormat.GRAPHML)
+    snapshot = {"snapshot_id": "commit:tree"}
+    session = interface.driver.session.return_value.__enter__.return_value
+    session.execute_write.side_effect = lambda query, *args: (
+        snapshot if query is pop_snapshot else None
+    )
+
+    interface.export_graph()
+
+    assert [call.args for call in session.execute_write.call_args_list] == [
+        (pop_snapshot,),
+        (export_graphml, interface.repo_path.name),
+        (save_snapshot, snapshot),
+    ]
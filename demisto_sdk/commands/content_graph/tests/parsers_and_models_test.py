@@ -1,5 +1,8 @@
+import inspect
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Set
+from zipfile import ZipFile
 
 import pytest
 from pydantic import DirectoryPath
@@ -803,6 +806,95 @@ class TestParsersAndModels:
         assert MarketplaceVersions.PLATFORM in model.marketplaces
         assert MarketplaceVersions.XSOAR in model.marketplaces
 
+    def test_to_dict(self, pack: Pack, mocker):
+        """
+        Given:
+            - A playbook model.
+        When:
+            - Calling to_dict, which exports the model as a graph node.
+        Then:
+            - Verify the export is the pydantic export of the model without the database id
+              and the cached properties, with a path relative to the content path.
+        """
+        from demisto_sdk.commands.content_graph.objects import base_content
+
+        playbook = pack.create_playbook(yml=load_yaml("playbook.yml"))
+        content_path = Path(playbook.path).parents[3]
+        mocker.patch.object(base_content, "CONTENT_PATH", content_path)
+        model = BaseContent.from_path(Path(playbook.path))
+        assert model.data  # loads a cached property
+
+        expected = model.dict(
+            exclude={"database_id"}
+            | {
+                name
+                for name, value in inspect.getmembers(type(model))
+                if isinstance(value, cached_property)
+            }
+        )
+        expected["path"] = model.path.relative_to(content_path).as_posix()
+        expected["content_type"] = ContentType.PLAYBOOK
+
+        assert model.to_dict() == expected
+        assert "data" not in model.to_dict()
+
+    def test_structure_errors_are_deferred(self, pack: Pack):
+        """
+        Given:
+            - A playbook and an incident field, each with a field which is not in its strict schema.
+        When:
+            - Parsing them, pickling the parsed models and reading the structure errors of the models.
+        Then:
+            - Verify the structure is validated only when the errors are first read, from the file.
+            - Verify the pickled models do not hold the file data.
+            - Verify the errors are those of the eager validation.
+        """
+        import pickle
+
+        from demisto_sdk.commands.content_graph.objects.incident_field import (
+            IncidentField,
+        )
+        from demisto_sdk.commands.content_graph.objects.playbook import Playbook
+        from demisto_sdk.commands.content_graph.parsers.incident_field import (
+            IncidentFieldParser,
+        )
+        from demisto_sdk.commands.content_graph.parsers.playbook import PlaybookParser
+
+        playbook_data = load_yaml("playbook.yml")
+        playbook_data["not_a_playbook_field"] = True
+        playbook = pack.create_playbook(yml=playbook_data)
+        incident_field_data = load_json("incident_field.json")
+        incident_field_data["not_an_incident_field_field"] = True
+        incident_field = pack.create_incident_field(
+            "TestIncidentField", content=incident_field_data
+        )
+
+        for parser, model_cls, field_name in (
+            (
+                PlaybookParser(Path(playbook.path), list(MarketplaceVersions), []),
+                Playbook,
+                "not_a_playbook_field",
+            ),
+            (
+                IncidentFieldParser(
+                    Path(incident_field.path), list(MarketplaceVersions), []
+                ),
+                IncidentField,
+                "not_an_incident_field_field",
+            ),
+        ):
+            pickled_model = pickle.dumps(model_cls.from_orm(parser))
+            assert field_name.encode() not in pickled_model
+            model = pickle.loads(pickled_model)
+            assert not model.structure_errors.is_validated
+
+            tools.get_file.cache_clear()
+            assert [error.field_name for error in model.structure_errors] == [
+                (field_name,)
+            ]
+            assert model.structure_errors.is_validated
+            assert model.structure_errors == parser.validate_structure()
+
     def test_unified_integration_parser(self, pack: Pack):
         """
         Given:
@@ -3535,3 +3627,123 @@ class TestAgentixBaseParser:
             agentix_action_path, list(MarketplaceVersions), pack_supported_modules=[]
         )
         assert parser.toversion == DEFAULT_CONTENT_ITEM_TO_VERSION
+
+
+def test_pack_dump_marketplaces(repo: Repo, tmp_path: Path):
+    """
+    Given:
+        - A pack of several marketplaces, with an integration and a script which mention Cortex XSOAR.
+    When:
+        - Dumping the pack to all of its marketplaces in a single pass (`dump_marketplaces`).
+    Then:
+        - Verify the output of every marketplace is the same as dumping the pack to it alone,
+          even though the marketplacev2 dump replaces the Cortex XSOAR references (and the author) first.
+    """
+    marketplaces = [
+        MarketplaceVersions.MarketplaceV2,
+        MarketplaceVersions.XSOAR,
+        MarketplaceVersions.PLATFORM,
+    ]
+    marketplace_names = [marketplace.value for marketplace in marketplaces]
+    pack = repo.create_pack("MyPack")
+    pack.pack_metadata.update(
+        {"marketplaces": marketplace_names, "author": "Cortex XSOAR"}
+    )
+    integration = pack.create_integration("MyIntegration")
+    integration.create_default_integration()
+    integration.yml.update(
+        {"description": "Use with Cortex XSOAR 6.5", "marketplaces": marketplace_names}
+    )
+    script = pack.create_script("MyScript")
+    script.create_default_script()
+    script.yml.update(
+        {"comment": "A Cortex XSOAR script", "marketplaces": marketplace_names}
+    )
+
+    def load_pack() -> PackModel:
+        tools.get_file.cache_clear()
+        BaseContent.from_path.cache_clear()
+        return BaseContent.from_path(Path(pack.path))  # type: ignore[return-value]
+
+    with ChangeCWD(repo.path):
+        for marketplace in marketplaces:
+            load_pack().dump(tmp_path / "single" / marketplace / "MyPack", marketplace)
+        load_pack().dump_marketplaces(
+            {
+                marketplace: tmp_path / "multi" / marketplace / "MyPack"
+                for marketplace in marketplaces
+            }
+        )
+
+    single_files = sorted(
+        path.relative_to(tmp_path / "single")
+        for path in (tmp_path / "single").rglob("*")
+        if path.is_file()
+    )
+    assert single_files == sorted(
+        path.relative_to(tmp_path / "multi")
+        for path in (tmp_path / "multi").rglob("*")
+        if path.is_file()
+    )
+    for path in single_files:
+        assert (tmp_path / "single" / path).read_text() == (
+            tmp_path / "multi" / path
+        ).read_text(), path
+    xsoar_metadata = (
+        tmp_path / "multi" / MarketplaceVersions.XSOAR / "MyPack" / "metadata.json"
+    ).read_text()
+    assert '"author": "Cortex XSOAR"' in xsoar_metadata
+
+
+def test_content_item_loaded_data_survives_copy(repo: Repo):
+    """
+    Given:
+        - A script with a private copy of its data (as set while dumping to several marketplaces).
+    When:
+        - Copying the script model (as the validate initializer does for the BC validators).
+    Then:
+        - Verify the copy still returns the private data, and the script reads the file once it is reset.
+    """
+    pack = repo.create_pack("MyPack")
+    script = pack.create_script("MyScript")
+    script.create_default_script()
+    with ChangeCWD(repo.path):
+        model = BaseContent.from_path(Path(script.yml.path))
+    assert isinstance(model, Script)
+    model._loaded_data = {"name": "Loaded"}
+    assert model.copy(deep=True).data == {"name": "Loaded"}
+    model._loaded_data = None
+    assert model.data["name"] == model.name
+
+
+def test_content_dto_dump_marketplaces_zip(repo: Repo, tmp_path: Path):
+    """
+    Given:
+        - A pack of the xsoar and marketplacev2 marketplaces.
+    When:
+        - Dumping the repository to both of the marketplaces (as `prepare-content -a --additional-marketplace` does).
+    Then:
+        - Verify every marketplace is zipped to its own archive, with the pack in it.
+    """
+    pack = repo.create_pack("MyPack")
+    pack.pack_metadata.update({"marketplaces": ["xsoar", "marketplacev2"]})
+    pack.create_script("MyScript").create_default_script()
+    with ChangeCWD(repo.path):
+        pack_model = BaseContent.from_path(Path(pack.path))
+        assert isinstance(pack_model, PackModel)
+        ContentDTO(packs=[pack_model]).dump_marketplaces(
+            {
+                marketplace: tmp_path / f"tmp-{marketplace.value}"
+                for marketplace in (
+                    MarketplaceVersions.XSOAR,
+                    MarketplaceVersions.MarketplaceV2,
+                )
+            }
+        )
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "content_packs_marketplacev2.zip",
+        "content_packs_xsoar.zip",
+    ]
+    with ZipFile(tmp_path / "content_packs_xsoar.zip") as zip_file:
+        assert "MyPack/metadata.json" in zip_file.namelist()
@@ -63,8 +63,8 @@ def repository(mocker):
         packs=[],
     )
     mocker.patch(
-        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._create_content_dto",
-        return_value=repository,
+        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._parse_graph_records",
+        side_effect=lambda *args, **kwargs: repository.graph_records(),
     )
     return repository
 
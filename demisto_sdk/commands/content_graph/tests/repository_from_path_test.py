@@ -29,7 +29,9 @@ from demisto_sdk.commands.content_graph.objects import repository as repository_
 from demisto_sdk.commands.content_graph.objects.repository import (
     ContentDTO,
     from_path,
+    iter_graph_records,
 )
+from TestSuite.repo import Repo
 
 
 @pytest.fixture(autouse=True)
@@ -172,3 +174,34 @@ class TestFromPathNarrowing:
         assert mock_repo_parser.iter_packs.call_args.args == (("MyPack",),)
         assert mock_repo_parser.iter_connectors.call_count == 1
         assert mock_repo_parser.iter_connectors.call_args.args == (("datadog",),)
+
+
+def test_iter_graph_records_same_as_content_dto(graph_repo: Repo):
+    """
+    Given:
+        - A repository with two packs of an integration, a script and a playbook using the script.
+    When:
+        - Parsing it with iter_graph_records, which converts the packs to their nodes and relationships
+          in the parse workers.
+    Then:
+        - The packs are yielded one by one, with the same nodes and relationships as the packs of the
+          ContentDTO parsed by from_path.
+    """
+    for name in ("PackA", "PackB"):
+        pack = graph_repo.create_pack(name)
+        pack.create_integration(f"{name}Integration").create_default_integration()
+        pack.create_script(f"{name}Script").create_default_script()
+        pack.create_playbook(f"{name}Playbook").create_default_playbook()
+
+    graph_records = list(iter_graph_records(Path(graph_repo.path)))
+    expected = list(from_path(Path(graph_repo.path)).graph_records())
+
+    def by_pack(records):
+        return sorted(records, key=lambda record: str(record[0]))
+
+    assert len(graph_records) == 2
+    for (nodes, relationships), (expected_nodes, expected_relationships) in zip(
+        by_pack(graph_records), by_pack(expected)
+    ):
+        assert nodes == expected_nodes
+        assert relationships == expected_relationships
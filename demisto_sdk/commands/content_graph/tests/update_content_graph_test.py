@@ -207,7 +207,7 @@ def repository(mocker) -> ContentDTO:
 
     def mock__create_content_dto(packs_to_update: List[str], **kwargs) -> ContentDTO:
         # **kwargs absorbs the keyword-only ``connectors`` parameter that
-        # ContentGraphBuilder._create_content_dto now accepts.
+        # ContentGraphBuilder._parse_graph_records accepts.
         if not packs_to_update:
             return repository
         repo_copy = repository.copy()
@@ -215,8 +215,10 @@ def repository(mocker) -> ContentDTO:
         return repo_copy
 
     mocker.patch(
-        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._create_content_dto",
-        side_effect=mock__create_content_dto,
+        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._parse_graph_records",
+        side_effect=lambda *args, **kwargs: mock__create_content_dto(
+            *args, **kwargs
+        ).graph_records(),
     )
     return repository
 
@@ -231,21 +233,6 @@ def external_repository(mocker) -> ContentDTO:
     pack1 = mock_pack("ExternalPack")
     repository.packs.extend([pack1])
 
-    def mock__create_content_dto(
-        packs_to_update: List[str], **kwargs
-    ) -> List[ContentDTO]:
-        # **kwargs absorbs the keyword-only ``connectors`` parameter.
-        if not packs_to_update:
-            return [repository]
-        repo_copy = repository.copy()
-        repo_copy.packs = [p for p in repo_copy.packs if p.object_id in packs_to_update]
-        return [repo_copy]
-
-    mocker.patch(
-        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._create_content_dto",
-        side_effect=mock__create_content_dto,
-    )
-
     def mock__create_content_dto(packs_to_update: List[str], **kwargs) -> ContentDTO:
         # **kwargs absorbs the keyword-only ``connectors`` parameter.
         if not packs_to_update:
@@ -255,8 +242,10 @@ def external_repository(mocker) -> ContentDTO:
         return repo_copy
 
     mocker.patch(
-        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._create_content_dto",
-        side_effect=mock__create_content_dto,
+        "demisto_sdk.commands.content_graph.content_graph_builder.ContentGraphBuilder._parse_graph_records",
+        side_effect=lambda *args, **kwargs: mock__create_content_dto(
+            *args, **kwargs
+        ).graph_records(),
     )
     return repository
 
@@ -726,6 +715,7 @@ class TestUpdateContentGraph:
                 file.suffix == ".graphml"
                 or file.name == "metadata.json"
                 or file.name == "depends_on.json"
+                or file.name == "all_level_relationships.json"
                 for file in extracted_files
             )
 
@@ -826,6 +816,7 @@ class TestUpdateContentGraph:
                 file.suffix == ".graphml"
                 or file.name == "metadata.json"
                 or file.name == "depends_on.json"
+                or file.name == "all_level_relationships.json"
                 for file in extracted_files
             )
 
@@ -1011,6 +1002,7 @@ class TestUpdateContentGraphCommitHandling:
         )
         mock_interface._get_latest_content_parser_hash.return_value = "hash1"
         mock_interface.import_graph.return_value = True
+        mock_interface.is_up_to_date_with_snapshot.return_value = False
 
         mock_git_util = MagicMock()
         mock_git_util.get_all_changed_pack_ids.return_value = {"NewBrandNewPack"}
@@ -1047,6 +1039,189 @@ class TestUpdateContentGraphCommitHandling:
         ), "get_all_changed_pack_ids should not be called with boolean True"
 
 
+class TestUpdateContentGraphSnapshot:
+    """Tests for skipping the update when the graph matches the current snapshot."""
+
+    @pytest.fixture
+    def mock_interface(self):
+        mock_interface = MagicMock()
+        mock_interface.is_up_to_date_with_snapshot.return_value = True
+        return mock_interface
+
+    def test_skip_update_when_snapshot_matches(self, mocker, mock_interface):
+        """
+        Given:
+            - A live content graph which was built from the current commit and working tree.
+        When:
+            - Updating the content graph with use_git=True.
+        Then:
+            - Git is not diffed, the graph is not updated and dependencies are not recreated.
+        """
+        mock_git_util = mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.GitUtil"
+        )
+        mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.is_external_repository",
+            return_value=False,
+        )
+        mock_builder = mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.ContentGraphBuilder"
+        )
+
+        update_content_graph(mock_interface, use_git=True, dependencies=True)
+
+        mock_interface.is_up_to_date_with_snapshot.assert_called_once_with(True, False)
+        mock_git_util.return_value.get_all_changed_pack_ids.assert_not_called()
+        mock_builder.assert_not_called()
+        mock_interface.create_pack_dependencies.assert_not_called()
+        mock_interface.export_graph.assert_not_called()
+
+    def test_skip_update_zips_existing_export(self, mocker, mock_interface, tmp_path):
+        """
+        Given:
+            - A live content graph which matches the current snapshot.
+        When:
+            - Updating the content graph with an output path.
+        Then:
+            - The already exported graph is zipped to the output path without re-exporting it.
+        """
+        mocker.patch("demisto_sdk.commands.content_graph.commands.update.GitUtil")
+        mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.is_external_repository",
+            return_value=False,
+        )
+        mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.ContentGraphBuilder"
+        )
+
+        update_content_graph(mock_interface, use_git=True, output_path=tmp_path)
+
+        mock_interface.zip_import_dir.assert_called_once_with(
+            tmp_path / MarketplaceVersions.XSOAR.value
+        )
+        mock_interface.export_graph.assert_not_called()
+
+    def test_explicit_packs_ignore_snapshot(self, mocker, mock_interface):
+        """
+        Given:
+            - A live content graph which matches the current snapshot.
+        When:
+            - Updating the content graph with an explicit list of packs to update.
+        Then:
+            - The requested packs are updated as usual.
+        """
+        mocker.patch("demisto_sdk.commands.content_graph.commands.update.GitUtil")
+        mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.is_external_repository",
+            return_value=False,
+        )
+        mock_builder = mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.ContentGraphBuilder"
+        )
+
+        update_content_graph(mock_interface, packs_to_update=["MyPack"])
+
+        mock_builder.return_value.update_graph.assert_called_once_with(
+            packs_to_update=("MyPack",), connectors_to_update=None
+        )
+
+    def test_imported_path_ignores_snapshot(self, mocker, mock_interface, tmp_path):
+        """
+        Given:
+            - A live content graph which matches the current snapshot.
+        When:
+            - Updating the content graph from an explicitly imported path.
+        Then:
+            - The graph is imported and updated as usual.
+        """
+        mocker.patch("demisto_sdk.commands.content_graph.commands.update.GitUtil")
+        mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.is_external_repository",
+            return_value=False,
+        )
+        mock_builder = mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.ContentGraphBuilder"
+        )
+        imported_path = tmp_path / "content_graph.zip"
+
+        update_content_graph(mock_interface, imported_path=imported_path)
+
+        mock_interface.import_graph.assert_called_once_with(imported_path)
+        mock_builder.return_value.update_graph.assert_called_once()
+
+    def test_update_records_snapshot(self, mocker, mock_interface):
+        """
+        Given:
+            - A live content graph which does not match the current snapshot.
+        When:
+            - Updating the content graph with use_git=True and without dependencies.
+        Then:
+            - The graph is updated, and the snapshot it was built from is recorded with the flags of the update.
+        """
+        mock_interface.is_up_to_date_with_snapshot.return_value = False
+        mock_interface.import_graph.return_value = True
+        mock_interface.commit = None
+        mocker.patch("demisto_sdk.commands.content_graph.commands.update.GitUtil")
+        mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.is_external_repository",
+            return_value=False,
+        )
+        mocker.patch(
+            "demisto_sdk.commands.content_graph.commands.update.ContentGraphBuilder"
+        )
+
+        update_content_graph(mock_interface, use_git=True, dependencies=False)
+
+        mock_interface.is_up_to_date_with_snapshot.assert_called_once_with(False, False)
+        mock_interface.export_graph.assert_called_once()
+        mock_interface.record_snapshot.assert_called_once_with(False, False)
+
+    @pytest.mark.parametrize(
+        "recorded_flags, dependencies, private_content, expected",
+        [
+            ({"dependencies": True, "private_content": False}, True, False, True),
+            ({"dependencies": False, "private_content": False}, True, False, False),
+            ({"dependencies": True, "private_content": True}, True, False, False),
+            (None, True, False, False),
+        ],
+    )
+    def test_is_up_to_date_with_snapshot(
+        self, mocker, recorded_flags, dependencies, private_content, expected
+    ):
+        """
+        Given:
+            - A live content graph built from the current commit and working tree, with or without dependencies
+              and private content, or without a recorded snapshot.
+        When:
+            - Checking whether the graph is up to date for an update with the given flags.
+        Then:
+            - The graph is up to date only if the snapshot recorded in the graph has the same flags.
+        """
+        from demisto_sdk.commands.content_graph.interface.graph import (
+            ContentGraphInterface as BaseContentGraphInterface,
+        )
+
+        mocker.patch.multiple(
+            BaseContentGraphInterface,
+            __abstractmethods__=frozenset(),
+            _get_snapshot_id=MagicMock(return_value="abc123:def456"),
+            _get_latest_content_parser_hash=MagicMock(return_value="hash1"),
+            is_alive=MagicMock(return_value=True),
+        )
+        interface = BaseContentGraphInterface()  # type: ignore[abstract]
+        recorded_snapshot = recorded_flags and {
+            "snapshot_id": "abc123:def456",
+            "content_parser_latest_hash": "hash1",
+            **recorded_flags,
+        }
+        mocker.patch.object(interface, "get_snapshot", return_value=recorded_snapshot)
+
+        assert (
+            interface.is_up_to_date_with_snapshot(dependencies, private_content)
+            is expected
+        )
+
+
 class TestExtractPackIdsFromDiffFiles:
     """Tests for the extract_pack_ids_from_diff_files function."""
 
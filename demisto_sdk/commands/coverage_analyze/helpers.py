@@ -1,14 +1,17 @@
 import io
+import multiprocessing
 import os
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from tempfile import TemporaryDirectory
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import coverage
 import requests
 
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
 
@@ -78,13 +81,113 @@ def get_coverage_obj(
     if load_old:
         coverage_obj.load()
     if combine_from_content_repo:
-        coverage_obj.combine(coverage_files())
+        combine_coverage_files(coverage_obj, list(coverage_files()))
     # uncomment the following for debug purposes
     # self._cov.set_option('json:pretty_print', True)
 
     return coverage_obj
 
 
+def _merge_coverage_data(
+    target_and_sources: Tuple[str, List[str], Dict[str, str]],
+) -> Tuple[str, List[str]]:
+    """
+    Merges the coverage data of the source files into the target file (created if missing).
+
+    Args:
+        target_and_sources: a tuple of the target data file, the data files to merge into it,
+            and a mapping of source data files to the real path of the code file they measure.
+            Sources present in the mapping are fixed (see fix_file_path) before they are merged.
+
+    Returns:
+        Tuple[str, List[str]]: the target data file, and the source files which could not be read.
+            As coverage's combine does, these are skipped with a warning (and are not removed).
+    """
+    target, sources, code_file_paths = target_and_sources
+    combined_data = coverage.CoverageData(basename=target)
+    combined_data.read()
+    unreadable_sources = []
+    for source in sources:
+        try:
+            if code_file_path := code_file_paths.get(source):
+                fix_file_path(source, code_file_path)
+                if not Path(source).exists():
+                    continue
+            source_data = coverage.CoverageData(basename=source)
+            source_data.read()
+        except (coverage.exceptions.CoverageException, sqlite3.DatabaseError) as e:
+            logger.warning(f"Couldn't combine data file {source}: {e}")
+            unreadable_sources.append(source)
+            continue
+        combined_data.update(source_data)
+    combined_data.write()
+    return target, unreadable_sources
+
+
+def combine_coverage_files(
+    coverage_obj: coverage.Coverage,
+    data_files: List[str],
+    code_file_paths: Optional[Dict[str, str]] = None,
+    keep: bool = False,
+    processes: Optional[int] = None,
+) -> None:
+    """
+    Combines many .coverage files into the coverage object's data file.
+
+    The files are merged in a worker pool by a pairwise (tree) reduction - every round merges
+    pairs of data files in parallel until a single file is left, which is then combined into
+    the coverage object. The result is the same as calling coverage_obj.combine(data_files):
+    nothing is combined when there are no files, and files which can't be read are skipped with a warning.
+
+    Args:
+        coverage_obj(coverage.Coverage): the coverage object to combine the data into.
+        data_files(list): the .coverage files to combine.
+        code_file_paths(dict): a mapping of .coverage files to the real absolute path of the code file
+            they measure. the paths of these files are fixed before they are merged (see fix_file_path).
+        keep(bool): keep the original .coverage files after combining them.
+        processes(int): the number of worker processes (the default is cpu_count()).
+    """
+    if not data_files:
+        logger.debug("no coverage files to combine")
+        return
+    code_file_paths = code_file_paths or {}
+
+    with TemporaryDirectory() as tmp_dir:
+        # the first round reads the original files, later rounds merge the intermediate files in place.
+        tasks = [
+            (
+                os.path.join(tmp_dir, f".coverage.{index}"),
+                data_files[index : index + 2],
+                code_file_paths,
+            )
+            for index in range(0, len(data_files), 2)
+        ]
+        if len(tasks) == 1:
+            merged_file, unreadable_files = _merge_coverage_data(tasks[0])
+        else:
+            with multiprocessing.Pool(processes=processes or cpu_count()) as pool:
+                results = pool.map(_merge_coverage_data, tasks)
+                unreadable_files = [
+                    data_file for _, unreadable in results for data_file in unreadable
+                ]
+                merged_files = [merged for merged, _ in results]
+                while len(merged_files) > 1:
+                    tasks = [
+                        (merged_files[index], merged_files[index + 1 : index + 2], {})
+                        for index in range(0, len(merged_files), 2)
+                    ]
+                    merged_files = [
+                        merged for merged, _ in pool.map(_merge_coverage_data, tasks)
+                    ]
+            merged_file = merged_files[0]
+        logger.debug(f"combined {len(data_files)} coverage files")
+        coverage_obj.combine([merged_file])
+
+    if not keep:
+        for data_file in set(data_files).difference(unreadable_files):
+            Path(data_file).unlink(missing_ok=True)
+
+
 def coverage_files() -> Iterable[str]:
     """
     iterate over the '.coverage' files in the repo.
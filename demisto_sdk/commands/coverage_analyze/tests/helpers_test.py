@@ -15,6 +15,7 @@ from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.coverage_analyze.helpers import (
     CoverageSummary,
     InvalidReportType,
+    combine_coverage_files,
     coverage_files,
     export_report,
     fix_file_path,
@@ -359,6 +360,137 @@ class TestFixFilePath:
         )
 
 
+def read_measured_files(data_file) -> dict:
+    data = coverage.CoverageData(basename=data_file)
+    data.read()
+    return {
+        measured_file: sorted(data.lines(measured_file) or [])
+        for measured_file in data.measured_files()
+    }
+
+
+class TestCombineCoverageFiles:
+    cov_file_names = [
+        "HealthCheckAnalyzeLargeInvestigations",
+        "Vertica",
+        "VirusTotalV3",
+        "VirusTotal_V3_Premium",
+    ]
+
+    def copy_cov_files(self, tmpdir, dir_name):
+        os.makedirs(tmpdir.join(dir_name))
+        cov_files_paths = []
+        for cov_file_name in self.cov_file_names:
+            cov_file_path = str(tmpdir.join(dir_name, cov_file_name))
+            copy_file(os.path.join(COVERAGE_FILES_DIR, cov_file_name), cov_file_path)
+            cov_files_paths.append(cov_file_path)
+        return cov_files_paths
+
+    @pytest.mark.parametrize("files_count", [1, 2, 3, 4])
+    def test_same_as_serial_combine(self, tmpdir, files_count):
+        """
+        Given:
+            - Several .coverage files.
+        When:
+            - Combining them with the parallel pairwise reduction.
+        Then:
+            - Ensure the result is the same as combining them with coverage.combine.
+            - Ensure the original files are removed.
+        """
+        serial_files = self.copy_cov_files(tmpdir, "serial")[:files_count]
+        serial_cov = coverage.Coverage(data_file=str(tmpdir.join("serial.coverage")))
+        serial_cov.combine(serial_files)
+
+        parallel_files = self.copy_cov_files(tmpdir, "parallel")[:files_count]
+        parallel_cov = coverage.Coverage(
+            data_file=str(tmpdir.join("parallel.coverage"))
+        )
+        combine_coverage_files(parallel_cov, parallel_files, processes=2)
+
+        assert read_measured_files(
+            str(tmpdir.join("parallel.coverage"))
+        ) == read_measured_files(str(tmpdir.join("serial.coverage")))
+        assert not any(Path(cov_file).exists() for cov_file in parallel_files)
+
+    def test_keep(self, tmpdir):
+        cov_files = self.copy_cov_files(tmpdir, "keep")
+        cov_obj = coverage.Coverage(data_file=str(tmpdir.join(".coverage")))
+        combine_coverage_files(cov_obj, cov_files, keep=True, processes=2)
+        assert all(Path(cov_file).exists() for cov_file in cov_files)
+
+    def test_fix_file_path(self, tmpdir):
+        """
+        Given:
+            - Two .coverage files and the real paths of the code files they measure.
+        When:
+            - Combining them.
+        Then:
+            - Ensure the paths are fixed in the combined data.
+        """
+        cov_files = self.copy_cov_files(tmpdir, "fix")[:2]
+        combined_file = str(tmpdir.join(".coverage"))
+        cov_obj = coverage.Coverage(data_file=combined_file)
+        combine_coverage_files(
+            cov_obj,
+            cov_files,
+            code_file_paths={cov_files[0]: "first_path", cov_files[1]: "second_path"},
+            processes=2,
+        )
+        assert set(read_measured_files(combined_file)) == {
+            "first_path",
+            "second_path",
+        }
+
+    def test_no_files(self, tmpdir):
+        """
+        Given:
+            - No .coverage files.
+        When:
+            - Combining them.
+        Then:
+            - Ensure nothing is combined (as with coverage.combine([])).
+        """
+        cov_obj = coverage.Coverage(data_file=str(tmpdir.join(".coverage")))
+        combine_coverage_files(cov_obj, [])
+        assert not tmpdir.join(".coverage").exists()
+
+    @pytest.mark.parametrize("fix_paths", [False, True])
+    def test_unreadable_file(self, tmpdir, fix_paths):
+        """
+        Given:
+            - Two .coverage files and a corrupt one.
+        When:
+            - Combining them, with or without fixing their paths.
+        Then:
+            - Ensure the readable files are combined, and the corrupt one is skipped and kept.
+        """
+        cov_files = self.copy_cov_files(tmpdir, "unreadable")[:2]
+        corrupt_file = tmpdir.join("unreadable", ".coverage.corrupt")
+        corrupt_file.write("not a coverage file")
+        data_files = [cov_files[0], str(corrupt_file), cov_files[1]]
+        expected_files = set(read_measured_files(cov_files[0])) | set(
+            read_measured_files(cov_files[1])
+        )
+        code_file_paths = {}
+        if fix_paths:
+            code_file_paths = {
+                cov_files[0]: "first_path",
+                str(corrupt_file): "corrupt_path",
+                cov_files[1]: "second_path",
+            }
+            expected_files = {"first_path", "second_path"}
+        combined_file = str(tmpdir.join(".coverage"))
+        cov_obj = coverage.Coverage(data_file=combined_file)
+
+        combine_coverage_files(
+            cov_obj, data_files, code_file_paths=code_file_paths, processes=2
+        )
+
+        assert set(read_measured_files(combined_file)) == expected_files
+        assert corrupt_file.exists()
+        assert not any(Path(cov_file).exists() for cov_file in cov_files)
+
+
 class TestGetCoverageObj:
     def test_without_data(self, monkeypatch, tmpdir):
         monkeypatch.chdir(tmpdir)
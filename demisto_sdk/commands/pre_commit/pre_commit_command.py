@@ -4,6 +4,7 @@ import re
 import subprocess
 import sys
 from collections import defaultdict
+from contextlib import nullcontext
 from functools import partial
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
@@ -23,7 +24,7 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH, PYTHONPATH
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.docker_helper import get_python_version_or_default
-from demisto_sdk.commands.common.git_util import GitUtil
+from demisto_sdk.commands.common.git_util import GitUtil, RepositoryFileIndex
 from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import should_disable_multiprocessing, write_dict
@@ -633,14 +634,16 @@ def pre_commit_manager(
         logger.info("No arguments were given, running on staged files and git changes.")
         git_diff = True
 
-    files_to_run = preprocess_files(
-        input_files=input_files,
-        staged_only=staged_only,
-        commited_only=commited_only,
-        use_git=git_diff,
-        all_files=all_files,
-        prev_version=prev_version,
-    )
+    # all the files of the repository are listed once, instead of checking the related files of each
+    with RepositoryFileIndex.scope() if all_files else nullcontext():
+        files_to_run = preprocess_files(
+            input_files=input_files,
+            staged_only=staged_only,
+            commited_only=commited_only,
+            use_git=git_diff,
+            all_files=all_files,
+            prev_version=prev_version,
+        )
     if not files_to_run:
         logger.info("No files were changed, skipping pre-commit.")
         return 0
@@ -734,19 +737,21 @@ def add_related_files(file: Path) -> Set[Path]:
     """
     files_to_run = {file}
     test_data_changed = False
+    index = RepositoryFileIndex.active(file)
+    exists = index.exists if index else os.path.exists
     if ".yml" in file.suffix:
         py_file_path = file.with_suffix(".py")
         ps1_file_path = file.with_suffix(".ps1")
-        if py_file_path.exists():
+        if exists(py_file_path):
             files_to_run.add(py_file_path)
-        elif ps1_file_path.exists():
+        elif exists(ps1_file_path):
             files_to_run.add(ps1_file_path)
 
         # Pull in the sibling README.md so README-targeting hooks
         # (e.g. markdownlint-cli2 with `files: "^(.*/)?README\\.md$"`)
         # fire whenever the integration/script manifest is touched.
         readme_path = file.with_name("README.md")
-        if readme_path.exists():
+        if exists(readme_path):
             files_to_run.add(readme_path)
 
     # Identifying test files
@@ -782,7 +787,14 @@ def add_related_files(file: Path) -> Set[Path]:
         path_file = file
 
     test_files = []
-    if path_file.parent.exists():
+    if index:
+        test_files = [
+            _file
+            for _file in index.list_dir(path_file.parent, recursive=False)
+            if _file.name.endswith(test_file_suffix)
+        ]
+        files_to_run.update(test_files)
+    elif path_file.parent.exists():
         test_files = [
             _file
             for _file in path_file.parent.iterdir()
@@ -883,8 +895,13 @@ def preprocess_files(
 
     files_to_run: Set[Path] = set()
     for file in raw_files:
-        if file.is_dir():
-            dir_files = {path for path in file.rglob("*") if path.is_file()}
+        index = RepositoryFileIndex.active(file)
+        if index.is_dir(file) if index else file.is_dir():
+            dir_files = (
+                set(index.list_dir(file))
+                if index
+                else {path for path in file.rglob("*") if path.is_file()}
+            )
             files_to_run.update(dir_files)
         else:
             files_to_run.update(add_related_files(file))
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import List
 
 import typer
 
@@ -74,6 +75,13 @@ def prepare_content(
         help="The marketplace the content items are created for, "
         "that determines usage of marketplace unique text.",
     ),
+    additional_marketplaces: List[MarketplaceVersions] = typer.Option(
+        [],
+        "--additional-marketplace",
+        help="Used with -a. Also prepare the content packs for this marketplace, "
+        "in the same pass over the packs. Can be passed multiple times. "
+        "Every marketplace is zipped to content_packs_<marketplace>.zip.",
+    ),
     console_log_threshold: str = typer.Option(
         None,
         "--console-log-threshold",
@@ -104,10 +112,21 @@ def prepare_content(
     if all:
         content_dto = ContentDTO.from_path()
         output_path = output or Path(".")
-        content_dto.dump(
-            dir=output_path / "prepare-content-tmp",
-            marketplace=parse_marketplace_kwargs({"marketplace": marketplace}),
-        )
+        main_marketplace = parse_marketplace_kwargs({"marketplace": marketplace})
+        if additional_marketplaces:
+            marketplaces = dict.fromkeys([main_marketplace, *additional_marketplaces])
+            content_dto.dump_marketplaces(
+                dirs={
+                    target_marketplace: output_path
+                    / f"prepare-content-tmp-{target_marketplace.value}"
+                    for target_marketplace in marketplaces
+                },
+            )
+        else:
+            content_dto.dump(
+                dir=output_path / "prepare-content-tmp",
+                marketplace=main_marketplace,
+            )
         raise typer.Exit(0)
 
     # Split and process inputs
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List, Set, Tuple
 
 from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.logger import logger
@@ -79,6 +79,63 @@ def _remove_managed_and_source_keys(data: dict) -> None:
             data.pop(key, None)
 
 
+def marketplace_suffixes(
+    current_marketplace: MarketplaceVersions,
+) -> Tuple[List[str], Set[str]]:
+    """Returns the suffixes of the current marketplace (the more specific first), and the suffixes of all marketplaces."""
+    suffix = f"{SEPARATOR}{current_marketplace.value}"
+    suffixes = [suffix]
+    if current_marketplace == MarketplaceVersions.XSOAR_ON_PREM:
+        suffixes.append(f"{SEPARATOR}{MarketplaceVersions.XSOAR.value}")
+    if current_marketplace == MarketplaceVersions.XSOAR_SAAS:
+        suffixes.append(f"{SEPARATOR}{MarketplaceVersions.XSOAR.value}")
+    return suffixes, {f"{SEPARATOR}{mp.value}" for mp in MarketplaceVersions}
+
+
+def resolve_suffixed_keys(
+    datum: dict, suffixes: List[str], all_marketplace_suffixes: Set[str]
+) -> None:
+    """
+    Resolves the marketplace-suffixed keys of a single dict (not recursively):
+    a key with a suffix of the current marketplace replaces the key without the suffix,
+    and a key with a suffix of another marketplace is deleted.
+    """
+    for key in tuple(
+        datum.keys()
+    ):  # deliberately not iterating over .items(), as the dict changes during iteration
+        if not isinstance(key, str) or SEPARATOR not in key:
+            continue
+        value = datum[key]
+        for suffix in suffixes:
+            # iterate each suffix to see if it's relevant for the key.
+            # the order of the suffixes matter, as XSOAR_SAAS and XSOAR_ON_PREM are more specific
+            suffix_len = len(suffix)
+            if key.casefold().endswith(suffix):
+                clean_key = key[:-suffix_len]  # without suffix
+                if clean_key not in datum:
+                    logger.info(
+                        "Deleting field %s as it has no counterpart without suffix",
+                        key,
+                    )
+                    datum.pop(key, None)
+                    continue
+                logger.debug(f"Replacing {clean_key}={datum[clean_key]} to {value}.")
+                datum[clean_key] = value
+                datum.pop(key, None)
+                break
+        else:
+            key_suffix = key[key.rfind(SEPARATOR) :]
+            if key_suffix in all_marketplace_suffixes and key_suffix not in suffixes:
+                logger.debug(
+                    f"Field {key} ends with a marketplace suffix ({key_suffix}) that is not the current marketplace, deleting"
+                )
+                datum.pop(key, None)
+            else:
+                logger.debug(
+                    f"Field {key} does not end with any relevant suffix, keeping"
+                )
+
+
 class MarketplaceSuffixPreparer:
     @staticmethod
     def prepare(
@@ -96,65 +153,17 @@ class MarketplaceSuffixPreparer:
         Returns: A (possibliy) modified content item data
 
         """
-        suffix = f"{SEPARATOR}{current_marketplace.value}"
-        suffixes = [suffix]
-        if current_marketplace == MarketplaceVersions.XSOAR_ON_PREM:
-            suffixes.append(f"{SEPARATOR}{MarketplaceVersions.XSOAR.value}")
-        if current_marketplace == MarketplaceVersions.XSOAR_SAAS:
-            suffixes.append(f"{SEPARATOR}{MarketplaceVersions.XSOAR.value}")
+        suffixes, all_marketplace_suffixes = marketplace_suffixes(current_marketplace)
 
         def fix_recursively(datum: Any) -> Any:
             if isinstance(datum, list):
                 return [fix_recursively(item) for item in datum]
 
             elif isinstance(datum, dict):
-                for key in tuple(
-                    datum.keys()
-                ):  # deliberately not iterating over .items(), as the dict changes during iteration
-                    value = datum[key]
+                for value in datum.values():
                     if isinstance(value, (list, dict)):
                         fix_recursively(value)
-                    if SEPARATOR not in key:
-                        continue
-                    for suffix in suffixes:
-                        # iterate each suffix to see if it's relevant for the key.
-                        # the order of the suffixes matter, as XSOAR_SAAS and XSOAR_ON_PREM are more specific
-                        suffix_len = len(suffix)
-                        if isinstance(key, str) and key.casefold().endswith(suffix):
-                            clean_key = key[:-suffix_len]  # without suffix
-                            if clean_key not in datum:
-                                logger.info(
-                                    "Deleting field %s as it has no counterpart without suffix",
-                                    key,
-                                )
-                                datum.pop(key, None)
-                                continue
-                            logger.debug(
-                                f"Replacing {clean_key}={datum[clean_key]} to {value}."
-                            )
-                            datum[clean_key] = value
-                            datum.pop(key, None)
-                            break
-                    else:
-                        all_marketplace_suffixes = {
-                            f"{SEPARATOR}{mp.value}" for mp in MarketplaceVersions
-                        }
-                        key_suffix = (
-                            key[key.rfind(SEPARATOR) :] if SEPARATOR in key else None
-                        )
-                        if (
-                            key_suffix
-                            and key_suffix in all_marketplace_suffixes
-                            and key_suffix not in suffixes
-                        ):
-                            logger.debug(
-                                f"Field {key} ends with a marketplace suffix ({key_suffix}) that is not the current marketplace, deleting"
-                            )
-                            datum.pop(key, None)
-                        else:
-                            logger.debug(
-                                f"Field {key} does not end with any relevant suffix, keeping"
-                            )
+                resolve_suffixed_keys(datum, suffixes, all_marketplace_suffixes)
             return datum
 
         if not isinstance(result := fix_recursively(data), dict):  # to calm mypy
@@ -0,0 +1,78 @@
+from typing import Any
+
+from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedScalarString is OK
+    FoldedScalarString,
+)
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.content_graph.common import (
+    MARKETPLACES_REPLACING_XSOAR_REFERENCES,
+    replace_xsoar_references,
+)
+from demisto_sdk.commands.prepare_content.preparers.marketplace_suffix_preparer import (
+    marketplace_suffixes,
+    resolve_suffixed_keys,
+)
+
+
+class MarketplaceUploadPreparer:
+    @staticmethod
+    def prepare(
+        data: dict,
+        current_marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
+    ) -> dict:
+        """
+        Applies the marketplace rewrites of a content item in a single walk over its data:
+        replaces the incorrect "Cortex XSOAR" references (as `replace_marketplace_references`),
+        and resolves the marketplace-suffixed fields (as `MarketplaceSuffixPreparer.prepare`).
+
+        Every dict is handled once: its values are walked first, then its keys are renamed (references)
+        and resolved (suffixes), in the same order as running the two preparations one after the other.
+        Strings which don't contain "Cortex XSOAR" are not searched with the references pattern.
+
+        Args:
+            data: content item data
+            current_marketplace: Marketplace. Used to determine the references to replace and the specific suffix
+
+        Returns: A (possibly) modified content item data
+        """
+        replace_references = (
+            current_marketplace in MARKETPLACES_REPLACING_XSOAR_REFERENCES
+        )
+        suffixes, all_marketplace_suffixes = marketplace_suffixes(current_marketplace)
+
+        def prepare_recursively(datum: Any) -> Any:
+            if isinstance(datum, dict):
+                keys_to_update = {}
+                for key, value in datum.items():
+                    if isinstance(value, (dict, list)) or (
+                        replace_references and isinstance(value, str)
+                    ):
+                        datum[key] = prepare_recursively(value)
+                    if (
+                        replace_references
+                        and isinstance(key, str)
+                        and (new_key := replace_xsoar_references(key)) != key
+                    ):
+                        keys_to_update[key] = new_key
+                for old_key, new_key in keys_to_update.items():
+                    datum[new_key] = datum.pop(old_key)
+                resolve_suffixed_keys(datum, suffixes, all_marketplace_suffixes)
+            elif isinstance(datum, list):
+                for i, item in enumerate(datum):
+                    if isinstance(item, (dict, list)) or (
+                        replace_references and isinstance(item, str)
+                    ):
+                        datum[i] = prepare_recursively(item)
+            elif isinstance(datum, FoldedScalarString):
+                # if data is a FoldedScalarString (yml unification), we need to convert it to a string and back
+                datum = FoldedScalarString(replace_xsoar_references(datum))
+            elif isinstance(datum, str):
+                datum = replace_xsoar_references(datum)
+            return datum
+
+        if not isinstance(result := prepare_recursively(data), dict):  # to calm mypy
+            raise ValueError(
+                f"unexpected result type {type(result)}, expected dictionary"
+            )
+        return result
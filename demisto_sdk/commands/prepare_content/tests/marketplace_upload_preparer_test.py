@@ -0,0 +1,89 @@
+from copy import deepcopy
+
+import pytest
+from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedScalarString is OK
+    FoldedScalarString,
+)
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.content_graph.common import replace_marketplace_references
+from demisto_sdk.commands.prepare_content.preparers.marketplace_suffix_preparer import (
+    MarketplaceSuffixPreparer,
+)
+from demisto_sdk.commands.prepare_content.preparers.marketplace_upload_preparer import (
+    MarketplaceUploadPreparer,
+)
+
+DATA = {
+    "name": "Test",
+    "description": "Use with Cortex XSOAR 6.5 to do things",
+    "description:xsoar": "Use with Cortex XSOAR only",
+    "description:marketplacev2": "Use with Cortex XSIAM",
+    "Cortex XSOAR key": "value",
+    "details": "See https://xsoar.pan.dev, Cortex XSOAR https://docs",
+    "script": {
+        "script": FoldedScalarString("# Cortex XSOAR 8 script\nreturn 1"),
+        "commands": [
+            {
+                "name": "command",
+                "description": "A Cortex XSOAR command",
+                "deprecated:xsoar_saas": True,
+                "deprecated": False,
+                "arguments": [
+                    {"name": "arg", "description": "Cortex XSOAR", "default": 1}
+                ],
+            },
+            "Cortex XSOAR in a list",
+        ],
+    },
+    "image:platform": "platform image",
+    "id:xpanse": "xpanse",
+}
+
+
+@pytest.mark.parametrize("marketplace", list(MarketplaceVersions))
+def test_prepare_same_as_separate_preparers(marketplace):
+    """
+    Given:
+        - Data with "Cortex XSOAR" references (in keys, values, lists and a folded script) and marketplace suffixes.
+    When:
+        - Calling MarketplaceUploadPreparer.prepare on the data for every marketplace.
+    Then:
+        - The data is the same as replacing the marketplace references and then calling MarketplaceSuffixPreparer.prepare.
+        - The folded script stays a FoldedScalarString.
+    """
+    expected = MarketplaceSuffixPreparer.prepare(
+        replace_marketplace_references(deepcopy(DATA), marketplace), marketplace
+    )
+
+    data = MarketplaceUploadPreparer.prepare(deepcopy(DATA), marketplace)
+
+    assert data == expected
+    assert list(data) == list(expected)
+    assert isinstance(data["script"]["script"], FoldedScalarString)
+
+
+def test_prepare_marketplacev2():
+    """
+    Given:
+        - Data with "Cortex XSOAR" references and marketplace suffixes.
+    When:
+        - Calling MarketplaceUploadPreparer.prepare on the data for marketplacev2.
+    Then:
+        - The references are replaced, except the one followed by a url.
+        - The marketplacev2 suffixed description replaces the description, and the other suffixed keys are deleted.
+    """
+    data = MarketplaceUploadPreparer.prepare(
+        deepcopy(DATA), MarketplaceVersions.MarketplaceV2
+    )
+
+    assert data["description"] == "Use with Cortex XSIAM"
+    assert data["Cortex key"] == "value"
+    assert data["details"] == DATA["details"]
+    assert data["script"]["script"] == "# Cortex script\nreturn 1"
+    assert data["script"]["commands"][0]["description"] == "A Cortex command"
+    assert data["script"]["commands"][0]["arguments"][0]["description"] == "Cortex"
+    assert data["script"]["commands"][1] == "Cortex in a list"
+    assert "deprecated:xsoar_saas" not in data["script"]["commands"][0]
+    assert "image" not in data
+    assert "image:platform" not in data
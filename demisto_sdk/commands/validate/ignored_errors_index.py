@@ -0,0 +1,66 @@
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+# The key of the pack-level (`[pack]` section) codes of a pack in the index.
+PACK_LEVEL_KEY = "[pack]"
+# The key of the codes of the content item's own file in the index.
+MAIN_FILE_KEY = ""
+
+
+class IgnoredErrorsIndex:
+    """
+    The error codes ignored for the content items of a validate run.
+
+    The ignore files (`.pack-ignore`, `.connector-ignore`) are parsed by the content items, and the ignored codes
+    of every item are read from them once, on the first check of the item, into frozen sets keyed by
+    (path of the item, the ignored file of the item).
+    Checking whether a validation result or a validator is ignored for an item is then a dict lookup,
+    instead of resolving the ignore sections of the item on every check.
+
+    The content objects are duck-typed, as in `is_error_ignored`: a pack is an object with `pack_level_ignored_errors`,
+    and every other content item reaches its pack by `in_pack`.
+    Objects without a path (such as test stand-ins) are not indexed, and their codes are read on every check.
+    """
+
+    def __init__(self):
+        self._ignored: Dict[Tuple[Path, str], FrozenSet[str]] = {}
+
+    def _get(self, path: Optional[Path], key: str, read) -> FrozenSet[str]:
+        if path is None:
+            return frozenset(read())
+        if (codes := self._ignored.get((path, key))) is None:
+            codes = self._ignored[(path, key)] = frozenset(read())
+        return codes
+
+    def ignored_errors(self, content_object: Any) -> FrozenSet[str]:
+        """The codes ignored for the file of the content object (its `ignored_errors`)."""
+        return self._get(
+            getattr(content_object, "path", None),
+            MAIN_FILE_KEY,
+            lambda: getattr(content_object, "ignored_errors", None) or (),
+        )
+
+    def related_file_ignored_errors(
+        self, content_object: Any, file_path: Path
+    ) -> FrozenSet[str]:
+        """The codes ignored for a related file of the content object (its `ignored_errors_related_files`)."""
+        return self._get(
+            getattr(content_object, "path", None),
+            str(file_path),
+            lambda: content_object.ignored_errors_related_files(file_path) or (),
+        )
+
+    def pack_level_ignored_errors(self, content_object: Any) -> FrozenSet[str]:
+        """The codes ignored for the whole pack of the content object (the `[pack]` section of `.pack-ignore`)."""
+        pack = (
+            content_object
+            if hasattr(content_object, "pack_level_ignored_errors")
+            else getattr(content_object, "in_pack", None)
+        )
+        if pack is None:
+            return frozenset()
+        return self._get(
+            getattr(pack, "path", None),
+            PACK_LEVEL_KEY,
+            lambda: getattr(pack, "pack_level_ignored_errors", None) or (),
+        )
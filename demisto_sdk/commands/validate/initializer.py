@@ -32,7 +32,7 @@ from demisto_sdk.commands.common.constants import (
     PathLevel,
 )
 from demisto_sdk.commands.common.content import Content
-from demisto_sdk.commands.common.git_util import GitUtil
+from demisto_sdk.commands.common.git_util import GitUtil, RepositoryFileIndex
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
@@ -1149,8 +1149,11 @@ class Initializer:
                 self.private_content_path
             )
 
-            if file_path.exists() and not is_in_private:
-                loaded_files.update(p for p in file_path.rglob("*") if p.is_file())
+            if not is_in_private:
+                if index := RepositoryFileIndex.active(file_path):
+                    loaded_files.update(index.list_dir(file_path))
+                elif file_path.exists():
+                    loaded_files.update(p for p in file_path.rglob("*") if p.is_file())
 
             if self.private_content_path:
                 rel_path = get_relative_path_from_packs_dir(resolved_file_str)
@@ -29,6 +29,7 @@ from demisto_sdk.commands.validate.config_reader import (
     ConfigReader,
     ConfiguredValidations,
 )
+from demisto_sdk.commands.validate.ignored_errors_index import IgnoredErrorsIndex
 from demisto_sdk.commands.validate.initializer import (
     ConnectorAwareInitializer,
     Initializer,
@@ -711,6 +712,42 @@ def test_is_error_ignored_not_ignored_anywhere():
     )
 
 
+def test_ignored_errors_index_reads_ignored_codes_once():
+    """
+    Given:
+    - A content item ignoring BA101 in its own per-file section, in a pack
+      ignoring RM104 in its `[pack]` section.
+    When:
+    - Calling is_error_ignored several times with an IgnoredErrorsIndex of the run.
+    Then:
+    - The ignored codes of the item and of its pack are honored, and read only once.
+    """
+
+    class Pack:
+        path = Path("Packs/MyPack")
+        reads = 0
+
+        @property
+        def pack_level_ignored_errors(self):
+            Pack.reads += 1
+            return ["RM104"]
+
+    class Item(_FakeContentItem):
+        path = Path("Packs/MyPack/Scripts/MyScript/MyScript.yml")
+        in_pack = Pack()
+
+    item = Item(own_ignored=["BA101"])
+    index = IgnoredErrorsIndex()
+    assert is_error_ignored("BA101", ["BA101"], item, None, index)
+    item.ignored_errors = []  # changes after the first check are not read
+
+    for _ in range(3):
+        assert is_error_ignored("BA101", ["BA101", "RM104"], item, None, index)
+        assert is_error_ignored("RM104", ["BA101", "RM104"], item, None, index)
+        assert not is_error_ignored("BA102", ["BA102"], item, None, index)
+    assert Pack.reads == 1
+
+
 def test_object_collection_with_readme_path(repo):
     """
     Given:
@@ -6,12 +6,14 @@ from demisto_sdk.commands.common.constants import (
     ExecutionMode,
 )
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tracing import span
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.content_graph.parsers.related_files import RelatedFileType
 from demisto_sdk.commands.validate.config_reader import (
     ConfigReader,
     ConfiguredValidations,
 )
+from demisto_sdk.commands.validate.ignored_errors_index import IgnoredErrorsIndex
 from demisto_sdk.commands.validate.initializer import Initializer
 from demisto_sdk.commands.validate.validation_results import (
     ResultWriter,
@@ -59,6 +61,8 @@ class ValidateManager:
             self.objects_to_run,
             self.invalid_items,
         ) = self.initializer.gather_objects_to_run_on()
+        # The ignored codes of the objects are read once, and shared with the validators while running
+        self.ignored_errors_index = IgnoredErrorsIndex()
         self.committed_only = self.initializer.committed_only
         self.configured_validations: ConfiguredValidations = self.config_reader.read(
             ignore_support_level=ignore_support_level,
@@ -76,6 +80,7 @@ class ValidateManager:
             int: the exit code to obtained from the calculations of post_results.
         """
         logger.info("Starting validate items.")
+        BaseValidator.ignored_errors_index = self.ignored_errors_index
         try:
             for validator in self.validators:
                 logger.debug(
@@ -92,11 +97,16 @@ class ValidateManager:
                         self.objects_to_run,
                     )
                 ):
-                    validation_results: List[ValidationResult] = (
-                        validator.obtain_invalid_content_items(
-                            filtered_content_objects_for_validator
-                        )
-                    )  # type: ignore
+                    with span(
+                        "validate.validator",
+                        error_code=validator.error_code,
+                        items=len(filtered_content_objects_for_validator),
+                    ):
+                        validation_results: List[ValidationResult] = (
+                            validator.obtain_invalid_content_items(
+                                filtered_content_objects_for_validator
+                            )
+                        )  # type: ignore
                     if (
                         validator.expected_execution_mode == [ExecutionMode.ALL_FILES]
                         and self.initializer.execution_mode == ExecutionMode.ALL_FILES
@@ -159,6 +169,7 @@ class ValidateManager:
                             validation_caught_exception_result
                         )
         finally:
+            BaseValidator.ignored_errors_index = None
             if BaseValidator.graph_interface:
                 logger.info("Closing graph.")
                 BaseValidator.graph_interface.close()
@@ -246,30 +257,20 @@ class ValidateManager:
             if not self._is_result_ignored_by_pack_or_file(result)
         ]
 
-    @staticmethod
-    def _is_result_ignored_by_pack_or_file(result: ValidationResult) -> bool:
+    def _is_result_ignored_by_pack_or_file(self, result: ValidationResult) -> bool:
         """Whether a single validation result is ignored by the content item's own
         ``ignored_errors`` (per-file ``[file:...]`` section) or by the pack's
         ``pack_level_ignored_errors`` (the ``[pack]`` section of
-        ``.pack-ignore``).
+        ``.pack-ignore``), as read once into the run's ignored errors index.
         """
         err_code = result.validator.error_code
         content_object = result.content_object
 
-        if err_code in getattr(content_object, "ignored_errors", []):
-            return True
-
-        pack = (
+        return err_code in self.ignored_errors_index.ignored_errors(
+            content_object
+        ) or err_code in self.ignored_errors_index.pack_level_ignored_errors(
             content_object
-            if hasattr(content_object, "pack_level_ignored_errors")
-            else getattr(content_object, "in_pack", None)
         )
-        if pack is not None and err_code in getattr(
-            pack, "pack_level_ignored_errors", []
-        ):
-            return True
-
-        return False
 
     @staticmethod
     def _is_connector_handler_validation(result: ValidationResult) -> bool:
@@ -12,6 +12,7 @@ from demisto_sdk.commands.common.constants import (
     ExecutionMode,
 )
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+from demisto_sdk.commands.common.git_util import RepositoryFileIndex
 from demisto_sdk.commands.common.logger import logger, logging_setup_decorator
 from demisto_sdk.commands.common.tools import (
     is_external_repository,
@@ -332,6 +333,11 @@ def validate(
                             changed_only=changed_only,
                         )
                     )
+                if execution_mode == ExecutionMode.ALL_FILES and not ctx.params.get(
+                    "fix"
+                ):
+                    # the files looked up by the validations are listed once for the whole repository
+                    stack.enter_context(RepositoryFileIndex.scope(CONTENT_PATH))
                 exit_code += run_new_validation(file_path, execution_mode, **ctx.params)
 
         raise typer.Exit(code=exit_code)
@@ -427,7 +433,13 @@ def run_old_validation(file_path, is_external_repo, run_with_mp, **kwargs):
         check_is_unskipped=not kwargs.get("allow_skipped", False),
         specific_validations=kwargs.get("run_specific_validations"),
     )
-    return validator.run_validation()
+    # the files looked up by the validations are listed once for the whole repository
+    with (
+        RepositoryFileIndex.scope(CONTENT_PATH)
+        if kwargs["validate_all"]
+        else contextlib.nullcontext()
+    ):
+        return validator.run_validation()
 
 
 def attach_graph_interface_if_requested(use_graph: bool) -> None:
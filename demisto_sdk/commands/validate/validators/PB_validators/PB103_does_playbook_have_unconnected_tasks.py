@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Iterable, List
 
+from demisto_sdk.commands.common.playbook_tasks_graph import PlaybookTasksGraph
 from demisto_sdk.commands.content_graph.objects.playbook import Playbook
 from demisto_sdk.commands.validate.validators.base_validator import (
     BaseValidator,
@@ -28,20 +29,9 @@ class DoesPlaybookHaveUnconnectedTasks(BaseValidator[ContentTypes]):
         Return:
             - bool. True if the playbook has an unconnected task, False otherwise.
         """
-        start_task_id = playbook.data.get("starttaskid")
-        tasks = playbook.tasks
-        tasks_bucket = set()
-        next_tasks_bucket = set()
-
-        for task_id, task in tasks.items():
-            if task_id != start_task_id:
-                tasks_bucket.add(task_id)
-            if next_tasks := task.nexttasks:
-                for next_task_ids in next_tasks.values():
-                    if next_task_ids:
-                        next_tasks_bucket.update(next_task_ids)
-        orphan_tasks = tasks_bucket.difference(next_tasks_bucket)
-        return orphan_tasks
+        return PlaybookTasksGraph.from_task_configs(
+            playbook.data.get("starttaskid", ""), playbook.tasks
+        ).orphan_tasks
 
     def obtain_invalid_content_items(
         self, content_items: Iterable[ContentTypes]
@@ -37,6 +37,7 @@ from demisto_sdk.commands.content_graph.objects.base_content import (
 )
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
 from demisto_sdk.commands.content_graph.parsers.related_files import RelatedFileType
+from demisto_sdk.commands.validate.ignored_errors_index import IgnoredErrorsIndex
 
 ContentTypes = TypeVar("ContentTypes", bound=BaseContent)
 
@@ -116,6 +117,7 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
     related_file_type: ClassVar[Optional[List[RelatedFileType]]] = None
     expected_execution_mode: ClassVar[Optional[List[ExecutionMode]]] = None
     create_graph_from_scratch: ClassVar[bool] = False
+    ignored_errors_index: ClassVar[Optional[IgnoredErrorsIndex]] = None
 
     def get_content_types(self):
         args = (get_args(self.__orig_bases__[0]) or get_args(self.__orig_bases__[1]))[0]  # type: ignore
@@ -156,6 +158,7 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
                     ignorable_errors,
                     content_item,
                     self.related_file_type,
+                    self.ignored_errors_index,
                 ),
             ]
         )
@@ -463,6 +466,7 @@ def is_error_ignored(
     ignorable_errors: List[str],
     content_item: ContentTypes,
     related_file_type: Optional[List[RelatedFileType]] = None,
+    ignored_errors_index: Optional[IgnoredErrorsIndex] = None,
 ) -> bool:
     """Check whether the given validation error code is ignored for the
     given content item.
@@ -487,24 +491,22 @@ def is_error_ignored(
         content_item: The item being validated. May be a ``ContentItem``
             *or* a ``Pack`` (for PA-validators that run on packs).
         related_file_type: Optional related-file scope (e.g. README, image).
+        ignored_errors_index: The ignored codes of the run, read once per
+            content item. When not given, the codes are read from the item.
 
     Returns:
         True when the error should be ignored for this item; False otherwise.
     """
     if (err_code not in ignorable_errors) or (err_code in ALWAYS_RUN_ON_ERROR_CODE):
         return False
+    index = ignored_errors_index or IgnoredErrorsIndex()
 
     # ------ Pack-level ignore ------
-    # Duck-typed to keep this module free of a direct import of `Pack`,
-    # which would create a circular import with the content_graph package.
-    # `Pack` itself exposes `pack_level_ignored_errors`; every `ContentItem`
-    # reaches its pack via `in_pack`.
-    pack = (
-        content_item
-        if hasattr(content_item, "pack_level_ignored_errors")
-        else getattr(content_item, "in_pack", None)
-    )
-    if pack is not None and err_code in getattr(pack, "pack_level_ignored_errors", []):
+    # Duck-typed (in the index) to keep this module free of a direct import of
+    # `Pack`, which would create a circular import with the content_graph
+    # package. `Pack` itself exposes `pack_level_ignored_errors`; every
+    # `ContentItem` reaches its pack via `in_pack`.
+    if err_code in index.pack_level_ignored_errors(content_item):
         return True
 
     if related_file_type:
@@ -512,8 +514,8 @@ def is_error_ignored(
         for related_file in related_file_type:
             try:
                 related_file_object = getattr(content_item, related_file.value)
-                if err_code in content_item.ignored_errors_related_files(
-                    related_file_object.file_path
+                if err_code in index.related_file_ignored_errors(
+                    content_item, related_file_object.file_path
                 ):
                     return True
             except Exception:
@@ -524,7 +526,7 @@ def is_error_ignored(
         # ignore so a `[file:...]` section on the item itself is still honored.
 
     # If the validation should run on the main content, will check if the validation's error code is ignored by the file.
-    return err_code in content_item.ignored_errors
+    return err_code in index.ignored_errors(content_item)
 
 
 class ValidationResult(BaseResult, BaseModel):
@@ -3,7 +3,7 @@ import tempfile
 from pathlib import Path
 
 from demisto_sdk.commands.common.constants import DEMISTO_SDK_LOG_FILE_PATH, LOGS_DIR
-from demisto_sdk.commands.common.logger import calculate_log_dir
+from demisto_sdk.commands.common.logger import calculate_log_dir, lazy_logger, logger
 
 
 def test_calculate_dir_path_no_input():
@@ -93,3 +93,44 @@ def test_calculate_dir_path_input_overrides_environment_variable(monkeypatch):
     with tempfile.TemporaryDirectory() as temp_dir:
         monkeypatch.setenv(DEMISTO_SDK_LOG_FILE_PATH, "/some/other/path")
         assert calculate_log_dir(Path(temp_dir)) == Path(temp_dir)
+
+
+def test_lazy_logger_formats_accepted_records():
+    """
+    Given:
+        A sink accepting DEBUG records
+    When:
+        Logging a debug message with a value arg and a callable arg with `lazy_logger`
+    Then:
+        Ensure the message is formatted with the value and the result of the callable,
+        and the record points to the caller of `lazy_logger`
+    """
+    records = []
+    handler_id = logger.add(records.append, level="DEBUG", format="{message}")
+    try:
+        lazy_logger.debug("Parsing {} ({})", Path("Packs/MyPack"), lambda: "lazy")
+    finally:
+        logger.remove(handler_id)
+
+    assert len(records) == 1
+    assert records[0].record["message"] == "Parsing Packs/MyPack (lazy)"
+    assert records[0].record["function"] == "test_lazy_logger_formats_accepted_records"
+
+
+def test_lazy_logger_skips_rejected_records(monkeypatch):
+    """
+    Given:
+        Sinks accepting only INFO records and above
+    When:
+        Logging a debug message with a callable arg with `lazy_logger`
+    Then:
+        Ensure the callable is not called, and DEBUG is reported as not enabled
+    """
+    monkeypatch.setattr(logger._core, "min_level", logger.level("INFO").no)
+    calls = []
+
+    lazy_logger.debug("Pack files: {}", lambda: calls.append(1))
+
+    assert not calls
+    assert not lazy_logger.is_enabled_for("DEBUG")
+    assert lazy_logger.is_enabled_for("WARNING")